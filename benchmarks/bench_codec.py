@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Benchmark codecs JSON : save_to_file / load_from_file / export JSON
+avec chaque codec installé (orjson, ujson, json)
+
+Usage : python -m benchmarks.bench_codec [nombre_de_taches]
+"""
+import os
+import sys
+import tempfile
+import time
+from src.task_manager.codec import available_codecs
+from src.task_manager.manager import TaskManager
+from src.task_manager.services import ExportService
+from src.task_manager.task import Priority
+
+
+def tasks_per_second(action, count: int) -> float:
+    start = time.perf_counter()
+    action()
+    return count / (time.perf_counter() - start)
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    print(f"=== Codecs JSON ({count} tâches) ===\n")
+    print(f"{'codec':<8} {'save':>14} {'load':>14} {'export':>14}   (tâches/s)")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        source = TaskManager(os.path.join(temp_dir, "source.json"))
+        ids = source.add_tasks([(f"Tâche de benchmark {i}", "Description", list(Priority)[i % 4]) for i in range(count)])
+        for task_id in ids[::3]:
+            source.get_task(task_id).mark_completed()
+        tasks = source.get_all_tasks()
+
+        results = {}
+        for name in available_codecs():
+            path = os.path.join(temp_dir, f"{name}.json")
+            manager = TaskManager(path, codec=name)
+            manager.add_tasks(tasks)
+            save = tasks_per_second(lambda: manager.save_to_file(), count)
+            # Validation complète : on mesure le décodage, pas le chemin de confiance
+            load = tasks_per_second(lambda: TaskManager(path, codec=name).load_from_file(trusted=False), count)
+            export = tasks_per_second(
+                lambda: ExportService(codec=name).export_tasks(tasks, os.path.join(temp_dir, f"export_{name}.json")),
+                count
+            )
+            results[name] = (save, load, export)
+            print(f"{name:<8} {save:14,.0f} {load:14,.0f} {export:14,.0f}")
+
+        baseline = results["json"]
+        for name, timings in results.items():
+            if name != "json":
+                ratios = " / ".join(f"{value / reference:.1f}x" for value, reference in zip(timings, baseline))
+                print(f"\n{name} vs json : {ratios}")
+
+
+if __name__ == "__main__":
+    main()
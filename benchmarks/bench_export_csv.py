@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""
+Benchmark export CSV : DictWriter contre mode haut débit, en un processus
+et en tranches parallèles
+
+Usage : python -m benchmarks.bench_export_csv [nombre_de_taches] [processus]
+"""
+import os
+import sys
+import tempfile
+import time
+from src.task_manager.services import ReportService
+from src.task_manager.task import Task, Priority
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    workers = int(sys.argv[2]) if len(sys.argv) > 2 else (os.cpu_count() or 1)
+    print(f"=== Export CSV ({count} tâches) ===\n")
+
+    tasks = Task.create_many(
+        [f"Tâche de benchmark {i}" for i in range(count)],
+        priorities=[list(Priority)[i % 4] for i in range(count)]
+    )
+    for task in tasks[::3]:
+        task.mark_completed()
+
+    service = ReportService()
+    modes = [("DictWriter", {}), ("haut débit", {"high_throughput": True})]
+    if workers > 1:
+        modes.append((f"{workers} processus", {"workers": workers}))
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        baseline = None
+        for name, options in modes:
+            start = time.perf_counter()
+            service.export_tasks_csv(tasks, os.path.join(temp_dir, "export.csv"), **options)
+            rate = count / (time.perf_counter() - start)
+            baseline = baseline or rate
+            print(f"{name:<14} {rate:14,.0f} tâches/s   {rate / baseline:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Benchmark export multi-format : trois export_tasks successifs (JSON, XML,
+Excel) contre un seul export_many, en temps total
+
+Usage : python -m benchmarks.bench_export_many [nombre_de_taches]
+"""
+import os
+import sys
+import tempfile
+import time
+from src.task_manager.manager import TaskManager
+from src.task_manager.services import ExportService
+from src.task_manager.task import Priority
+
+FORMATS = ("json", "xml", "xlsx")
+
+
+def seconds(action) -> float:
+    start = time.perf_counter()
+    action()
+    return time.perf_counter() - start
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+    print(f"=== Export JSON + XML + Excel ({count} tâches) ===\n")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        manager = TaskManager(os.path.join(temp_dir, "tasks.json"))
+        ids = manager.add_tasks([(f"Tâche de benchmark {i}", "Description", list(Priority)[i % 4]) for i in range(count)])
+        for task_id in ids[::3]:
+            manager.get_task(task_id).mark_completed()
+        tasks = manager.get_all_tasks()
+
+        def targets(prefix):
+            return {fmt: os.path.join(temp_dir, f"{prefix}.{fmt}") for fmt in FORMATS}
+
+        def sequential():
+            service = ExportService()
+            for fmt, filename in targets("sequential").items():
+                service.export_tasks(tasks, filename, fmt)
+
+        results = {
+            "export_tasks x3": seconds(sequential),
+            "export_many (séquentiel)": seconds(lambda: ExportService().export_many(tasks, targets("many"), parallel=False)),
+            "export_many (parallèle)": seconds(lambda: ExportService().export_many(tasks, targets("parallel"), parallel=True)),
+        }
+
+        baseline = results["export_tasks x3"]
+        for name, elapsed in results.items():
+            print(f"{name:<26} {elapsed:8.2f} s {count / elapsed:12,.0f} tâches/s   {baseline / elapsed:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+Benchmark export Excel : classeur openpyxl standard contre mode write_only
+(lignes/s et pic mémoire de l'export)
+
+Usage : python -m benchmarks.bench_export_xlsx [nombre_de_taches]
+"""
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from src.task_manager.services import ExportService
+from src.task_manager.task import Task, Priority
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    print(f"=== Export Excel ({count} tâches) ===\n")
+    print(f"{'mode':<12} {'lignes/s':>14} {'pic mémoire':>14}")
+
+    tasks = Task.create_many(
+        [f"Tâche de benchmark {i}" for i in range(count)],
+        priorities=[list(Priority)[i % 4] for i in range(count)]
+    )
+    for task in tasks[::3]:
+        task.mark_completed()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        results = {}
+        for name, streaming in (("standard", False), ("write_only", True)):
+            tracemalloc.start()
+            start = time.perf_counter()
+            ExportService().export_tasks(tasks, os.path.join(temp_dir, f"{name}.xlsx"), "xlsx", streaming=streaming)
+            elapsed = time.perf_counter() - start
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            results[name] = (count / elapsed, peak)
+            print(f"{name:<12} {count / elapsed:14,.0f} {peak / 1024 ** 2:11,.1f} Mo")
+
+        speed = results["write_only"][0] / results["standard"][0]
+        memory = results["standard"][1] / results["write_only"][1]
+        print(f"\nwrite_only vs standard : {speed:.1f}x plus rapide, {memory:.0f}x moins de mémoire")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""
+Benchmark export XML : arbre ElementTree complet contre écriture en
+streaming (tâches/s et pic mémoire de l'export)
+
+Usage : python -m benchmarks.bench_export_xml [nombre_de_taches]
+"""
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from src.task_manager.services import ExportService
+from src.task_manager.task import Task, Priority
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    print(f"=== Export XML ({count} tâches) ===\n")
+    print(f"{'mode':<10} {'tâches/s':>14} {'pic mémoire':>14}")
+
+    tasks = Task.create_many(
+        [f"Tâche de benchmark {i}" for i in range(count)],
+        priorities=[list(Priority)[i % 4] for i in range(count)]
+    )
+    for task in tasks[::3]:
+        task.mark_completed()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for name, streaming in (("arbre", False), ("streaming", True)):
+            tracemalloc.start()
+            start = time.perf_counter()
+            ExportService().export_tasks(tasks, os.path.join(temp_dir, f"{name}.xml"), "xml", streaming=streaming)
+            elapsed = time.perf_counter() - start
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            print(f"{name:<10} {count / elapsed:14,.0f} {peak / 1024 ** 2:11,.1f} Mo")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Benchmark désérialisation : Task.from_dict (vérifié) vs Task.from_trusted_dict,
+puis load_from_file d'un fichier inconnu vs déjà validé (marqueur écrit par
+le premier chargement, relu par un nouveau gestionnaire comme au démarrage)
+
+Usage : python -m benchmarks.bench_from_dict [nombre_de_taches]
+"""
+import os
+import sys
+import tempfile
+import time
+from src.task_manager.manager import TaskManager
+from src.task_manager.task import Task, Priority, parse_iso_us
+
+
+def records_per_second(parse, records) -> float:
+    parse_iso_us.cache_clear()
+    start = time.perf_counter()
+    for record in records:
+        parse(record)
+    return len(records) / (time.perf_counter() - start)
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    print(f"=== Désérialisation ({count} tâches) ===\n")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, "tasks.json")
+        manager = TaskManager(path)
+        ids = manager.add_tasks([(f"Tâche de benchmark {i}", "", list(Priority)[i % 4]) for i in range(count)])
+        for task_id in ids[::3]:
+            manager.get_task(task_id).mark_completed()
+        records = [task.to_dict() for task in manager]
+
+        checked = records_per_second(Task.from_dict, records)
+        trusted = records_per_second(Task.from_trusted_dict, records)
+        print(f"{'from_dict':<24}: {checked:12,.0f} tâches/s")
+        print(f"{'from_trusted_dict':<24}: {trusted:12,.0f} tâches/s ({trusted / checked:.1f}x)")
+
+        manager.save_to_file()
+        for streaming in (False, True):
+            label = "streaming" if streaming else "complet"
+            os.remove(path + TaskManager.VALIDATED_SUFFIX)
+            timings = []
+            for _ in range(2):
+                loader = TaskManager(path)
+                parse_iso_us.cache_clear()
+                start = time.perf_counter()
+                loader.load_from_file(streaming=streaming)
+                timings.append(time.perf_counter() - start)
+            print(f"\n{'load_from_file ' + label:<24}: {count / timings[0]:12,.0f} tâches/s (fichier inconnu)")
+            print(f"{'':<24}: {count / timings[1]:12,.0f} tâches/s (déjà validé)")
+
+
+if __name__ == "__main__":
+    main()
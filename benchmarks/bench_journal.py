@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Benchmark persistance d'un changement : ajout au journal (moteur 'wal')
+vs réécriture complète du fichier JSON avec save_to_file
+
+Usage : python -m benchmarks.bench_journal [nombre_de_taches]
+"""
+import os
+import sys
+import tempfile
+import time
+from src.task_manager.manager import TaskManager
+from src.task_manager.task import Priority
+
+CHANGES = 200
+
+
+def per_change_us(manager: TaskManager, persist) -> float:
+    """Temps moyen (µs) pour modifier une tâche et rendre le changement persistant"""
+    tasks = manager.get_all_tasks()[:CHANGES]
+    start = time.perf_counter()
+    for i, task in enumerate(tasks):
+        task.update_priority(Priority.HIGH if i % 2 else Priority.LOW)
+        persist()
+    return (time.perf_counter() - start) / len(tasks) * 1_000_000
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    print(f"=== Persistance d'un changement ({count} tâches) ===\n")
+    titles = [f"Tâche de benchmark {i}" for i in range(count)]
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        manager = TaskManager(os.path.join(temp_dir, "full.json"))
+        manager.add_tasks(titles)
+        full = per_change_us(manager, lambda: manager.save_to_file(streaming=True))
+        print(f"save_to_file complet   : {full:12.1f} µs/changement")
+
+        for durable in (True, False):
+            path = os.path.join(temp_dir, f"wal_{durable}.json")
+            manager = TaskManager(path, backend="wal")
+            manager._store._durable = durable
+            manager.add_tasks(titles)
+            manager.checkpoint()
+            journal = per_change_us(manager, lambda: None)
+            label = "journal + fsync" if durable else "journal sans fsync"
+            print(f"{label:<22} : {journal:12.1f} µs/changement ({full / journal:,.0f}x)")
+            manager.close()
+
+
+if __name__ == "__main__":
+    main()
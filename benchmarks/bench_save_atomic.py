@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+Benchmark sauvegarde : surcoût de l'écriture atomique (fichier temporaire,
+fsync, os.replace, fsync du répertoire) par rapport à l'écriture directe
+
+Usage : python -m benchmarks.bench_save_atomic [taille1 taille2 ...]
+"""
+import os
+import sys
+import tempfile
+import time
+from src.task_manager.manager import TaskManager
+
+REPEAT = 3
+
+
+def best_time(manager: TaskManager, target: str, atomic: bool) -> float:
+    """Meilleur temps de sauvegarde sur REPEAT essais"""
+    timings = []
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        manager.save_to_file(target, streaming=True, atomic=atomic)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    sizes = [int(arg) for arg in sys.argv[1:]] or [10_000, 100_000, 1_000_000]
+    print("=== Sauvegarde atomique vs directe (streaming, meilleur de "
+          f"{REPEAT} essais) ===\n")
+    print(f"{'tâches':>10} | {'directe':>9} | {'atomique':>9} | {'surcoût':>9}")
+
+    for count in sizes:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            target = os.path.join(temp_dir, "tasks.json")
+            manager = TaskManager(target)
+            manager.add_tasks(f"Tâche de benchmark {i}" for i in range(count))
+
+            direct = best_time(manager, target, atomic=False)
+            atomic = best_time(manager, target, atomic=True)
+
+        print(f"{count:>10} | {direct:8.3f}s | {atomic:8.3f}s | "
+              f"{(atomic - direct) * 1000:+7.1f}ms ({(atomic / direct - 1) * 100:+.1f}%)")
+
+
+if __name__ == "__main__":
+    main()
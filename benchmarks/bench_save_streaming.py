@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Benchmark sauvegarde : json.dump du document complet vs écriture en streaming
+
+Chaque mode est mesuré dans un processus séparé pour que le pic de RSS
+(resource.getrusage) ne soit pas pollué par les mesures précédentes.
+
+Usage : python -m benchmarks.bench_save_streaming [nombre_de_taches]
+"""
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from src.task_manager.manager import TaskManager
+
+MODES = {
+    "complet": {"streaming": False, "compact": False},
+    "complet compact": {"streaming": False, "compact": True},
+    "streaming": {"streaming": True, "compact": False},
+    "streaming compact": {"streaming": True, "compact": True},
+}
+
+
+def peak_rss_mb() -> float:
+    """Pic de mémoire résidente du processus (ru_maxrss est en Ko sous Linux)"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def run_mode(mode: str, count: int) -> None:
+    """Exécuté dans le processus enfant : construit les tâches puis sauvegarde une fois"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        target = os.path.join(temp_dir, "tasks.json")
+        manager = TaskManager(target)
+        manager.add_tasks(f"Tâche de benchmark {i}" for i in range(count))
+        before = peak_rss_mb()
+
+        start = time.perf_counter()
+        manager.save_to_file(target, **MODES[mode])
+        elapsed = time.perf_counter() - start
+
+        size = os.path.getsize(target) / (1024 * 1024)
+        print(f"{mode:<18} : {elapsed:6.2f} s, fichier {size:7.1f} Mo, "
+              f"pic RSS {peak_rss_mb():7.1f} Mo (+{peak_rss_mb() - before:6.1f} Mo pendant la sauvegarde)")
+
+
+def main():
+    if len(sys.argv) > 2 and sys.argv[1] == "--mode":
+        run_mode(sys.argv[2], int(sys.argv[3]))
+        return
+
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    print(f"=== Sauvegarde JSON ({count} tâches) ===\n")
+
+    for mode in MODES:
+        subprocess.run(
+            [sys.executable, "-m", "benchmarks.bench_save_streaming", "--mode", mode, str(count)],
+            check=True
+        )
+
+
+if __name__ == "__main__":
+    main()
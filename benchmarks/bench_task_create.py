@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""
+Benchmark création de tâches : Task() une par une vs Task.create_many,
+et TaskManager.add_tasks
+
+Usage : python -m benchmarks.bench_task_create [nombre_de_taches]
+"""
+import sys
+import time
+from src.task_manager.manager import TaskManager
+from src.task_manager.task import Task, Priority
+
+
+def tasks_per_second(create, count: int) -> float:
+    start = time.perf_counter()
+    create()
+    return count / (time.perf_counter() - start)
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 500_000
+    print(f"=== Création de tâches ({count} tâches) ===\n")
+    titles = [f"  Tâche d'ingestion {i}  " for i in range(count)]
+    descriptions = [f"Description {i}" for i in range(count)]
+    priorities = [list(Priority)[i % 4] for i in range(count)]
+
+    single = tasks_per_second(
+        lambda: [Task(title, description, priority)
+                 for title, description, priority in zip(titles, descriptions, priorities)],
+        count
+    )
+    batch = tasks_per_second(lambda: Task.create_many(titles, descriptions, priorities), count)
+    manager = tasks_per_second(
+        lambda: TaskManager("bench.json").add_tasks(list(zip(titles, descriptions, priorities))), count
+    )
+
+    print(f"{'Task() une par une':<24}: {single:12,.0f} tâches/s")
+    print(f"{'Task.create_many':<24}: {batch:12,.0f} tâches/s ({batch / single:.1f}x)")
+    print(f"{'TaskManager.add_tasks':<24}: {manager:12,.0f} tâches/s (création + index)")
+
+
+if __name__ == "__main__":
+    main()
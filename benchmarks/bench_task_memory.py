@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Benchmark mémoire : octets par tâche, ancienne représentation (__dict__) vs __slots__
+
+Usage : python -m benchmarks.bench_task_memory [nombre_de_taches]
+"""
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+from src.task_manager.task import Task, Priority, Status
+
+
+class LegacyTask:
+    """Réplique de l'ancienne Task : 8 attributs dans un __dict__, dates en datetime"""
+
+    def __init__(self, title: str, description: str = "", priority: Priority = Priority.MEDIUM) -> None:
+        self.id = time.time()
+        self.title = title.strip()
+        self.description = description.strip()
+        self.priority = priority
+        self.created_at = datetime.now()
+        self.status = Status.TODO
+        self.completed_at = None
+        self.project_id = None
+
+
+def measure(factory, count: int) -> float:
+    """Octets alloués par tâche (titres et descriptions partagés exclus)"""
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    tasks = [factory("Tâche de benchmark", "Description") for _ in range(count)]
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del tasks
+    return (after - before) / count
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    print(f"=== Mémoire par tâche ({count} tâches) ===\n")
+
+    legacy = measure(LegacyTask, count)
+    compact = measure(Task, count)
+
+    print(f"Avant  (__dict__, datetime) : {legacy:8.1f} octets/tâche")
+    print(f"Après  (__slots__, epoch µs) : {compact:8.1f} octets/tâche")
+    print(f"Gain : {(1 - compact / legacy) * 100:.1f}%")
+
+
+if __name__ == "__main__":
+    main()
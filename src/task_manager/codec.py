@@ -0,0 +1,124 @@
+# src/task_manager/codec.py
+import json
+from datetime import date, datetime
+from typing import Any, Callable, Dict, List, Optional, Type, Union
+from .jsonstream import array_item_encoder
+
+# Imports conditionnels des encodeurs rapides
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import ujson
+    UJSON_AVAILABLE = True
+except ImportError:
+    UJSON_AVAILABLE = False
+
+
+def _default(value: Any) -> Any:
+    """Types non JSON : les dates en ISO 8601, comme Task.to_dict"""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+class JsonCodec:
+    """
+    Encodeur/décodeur JSON de la bibliothèque standard
+
+    dumps renvoie des octets UTF-8 (caractères non ASCII gardés tels quels),
+    indentés de deux espaces ou compacts ; les datetime sont écrits en ISO
+    8601. loads accepte des octets ou du texte et lève json.JSONDecodeError
+    quel que soit l'encodeur. item_encoder encode un élément du tableau d'un
+    document écrit en streaming (voir jsonstream.array_item_encoder).
+    """
+
+    name = "json"
+
+    def dumps(self, value: Any, indent: bool = True) -> bytes:
+        if indent:
+            text = json.dumps(value, indent=2, ensure_ascii=False, default=_default)
+        else:
+            text = json.dumps(value, separators=(',', ':'), ensure_ascii=False, default=_default)
+        return text.encode('utf-8')
+
+    def item_encoder(self, compact: bool = False) -> Callable[[Any], str]:
+        return array_item_encoder(compact, default=_default)
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return json.loads(data)
+
+
+class OrjsonCodec(JsonCodec):
+    """orjson (Rust) : datetime, énumérations et UTF-8 gérés nativement"""
+
+    name = "orjson"
+
+    def dumps(self, value: Any, indent: bool = True) -> bytes:
+        return orjson.dumps(value, default=_default, option=orjson.OPT_INDENT_2 if indent else 0)
+
+    def item_encoder(self, compact: bool = False) -> Callable[[Any], str]:
+        dumps = orjson.dumps
+        if compact:
+            return lambda item: dumps(item, default=_default).decode('utf-8')
+        # Indenté pour le deuxième niveau du document
+        return lambda item: dumps(item, default=_default, option=orjson.OPT_INDENT_2).decode('utf-8').replace('\n', '\n    ')
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        # orjson.JSONDecodeError hérite de json.JSONDecodeError
+        return orjson.loads(data)
+
+
+class UjsonCodec(JsonCodec):
+    """ujson (C) : les datetime passent par _default"""
+
+    name = "ujson"
+
+    def dumps(self, value: Any, indent: bool = True) -> bytes:
+        text = ujson.dumps(
+            value, indent=2 if indent else 0, ensure_ascii=False, escape_forward_slashes=False, default=_default
+        )
+        return text.encode('utf-8')
+
+    def item_encoder(self, compact: bool = False) -> Callable[[Any], str]:
+        if compact:
+            return lambda item: ujson.dumps(item, ensure_ascii=False, escape_forward_slashes=False, default=_default)
+        return lambda item: ujson.dumps(
+            item, indent=2, ensure_ascii=False, escape_forward_slashes=False, default=_default
+        ).replace('\n', '\n    ')
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        try:
+            return ujson.loads(data)
+        except ValueError as e:
+            document = data.decode('utf-8', errors='replace') if isinstance(data, bytes) else data
+            raise json.JSONDecodeError(str(e), document, 0)
+
+
+# Par ordre de préférence
+CODECS: Dict[str, Type[JsonCodec]] = {"orjson": OrjsonCodec, "ujson": UjsonCodec, "json": JsonCodec}
+_AVAILABLE = {"orjson": ORJSON_AVAILABLE, "ujson": UJSON_AVAILABLE, "json": True}
+
+
+def available_codecs() -> List[str]:
+    return [name for name in CODECS if _AVAILABLE[name]]
+
+
+def get_codec(name: Optional[str] = None) -> JsonCodec:
+    """
+    Codec JSON par nom, ou le plus rapide installé (orjson, puis ujson, puis json)
+
+    Raises:
+        ValueError: Si le nom est inconnu
+        ImportError: Si la bibliothèque demandée n'est pas installée
+    """
+    if name is None:
+        name = available_codecs()[0]
+    if name not in CODECS:
+        raise ValueError(f"Unknown JSON codec: {name}. Supported codecs: {list(CODECS)}")
+    if not _AVAILABLE[name]:
+        raise ImportError(f"{name} library is required for the '{name}' JSON codec. Install with: pip install {name}")
+    return CODECS[name]()
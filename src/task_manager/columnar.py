@@ -0,0 +1,387 @@
+# src/task_manager/columnar.py
+import weakref
+from datetime import date, datetime, time as dt_time
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+from .task import Task, Priority, Status, to_epoch_us
+from .stats import TaskCounts
+from .storage import TaskStore
+from .ids import TaskId
+
+# Import conditionnel pour le stockage colonne
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+
+PRIORITIES: List[Priority] = list(Priority)
+STATUSES: List[Status] = list(Status)
+PRIORITY_CODES: Dict[Priority, int] = {priority: code for code, priority in enumerate(PRIORITIES)}
+STATUS_CODES: Dict[Status, int] = {status: code for code, status in enumerate(STATUSES)}
+
+# Valeur sentinelle pour completed_at = None
+NO_DATE = -(2 ** 63)
+MICROSECONDS_PER_DAY = 86_400_000_000
+
+
+class StringPool:
+    """Pool de chaînes : chaque valeur distincte n'est stockée qu'une fois"""
+
+    def __init__(self) -> None:
+        self._values: List[str] = []
+        self._codes: Dict[str, int] = {}
+
+    def intern(self, value: str) -> int:
+        code = self._codes.get(value)
+        if code is None:
+            code = len(self._values)
+            self._values.append(value)
+            self._codes[value] = code
+        return code
+
+    def __getitem__(self, code: int) -> str:
+        return self._values[code]
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def retain(self, codes: Any) -> Any:
+        """Ne garde que les chaînes référencées par codes ; renvoie les codes renumérotés"""
+        used, remapped = np.unique(codes, return_inverse=True)
+        self._values = [self._values[code] for code in used.tolist()]
+        self._codes = {value: code for code, value in enumerate(self._values)}
+        return remapped.astype(codes.dtype)
+
+
+class ColumnarTaskStore(TaskStore):
+    """
+    Stockage colonne (struct-of-arrays) avec NumPy
+
+    Une colonne par champ : id, codes de priorité et de statut, dates en
+    microsecondes, project_id (NaN si absent) et codes vers des pools de chaînes
+    pour le titre et la description. Les objets Task ne sont créés qu'à la
+    demande ; tant qu'une tâche est référencée, le même objet est renvoyé et
+    ses changements (statut, priorité, complétion, projet) sont réécrits dans
+    les colonnes. Les filtres et statistiques sont des opérations vectorisées.
+    Les suppressions posent une pierre tombale, compactée quand elles
+    dépassent la moitié des lignes ; le compactage reconstruit aussi les pools
+    de chaînes, également compactés quand les modifications de titre ou de
+    description y laissent plus de chaînes orphelines que de lignes vivantes.
+    """
+
+    INITIAL_CAPACITY = 1024
+
+    # (attribut, dtype, valeur de remplissage)
+    COLUMNS = (
+        ("_ids", "float64", 0),
+        ("_priority", "int8", 0),
+        ("_status", "int8", 0),
+        ("_created", "int64", 0),
+        ("_completed", "int64", NO_DATE),
+        ("_project", "float64", float("nan")),
+        ("_title", "int32", 0),
+        ("_description", "int32", 0),
+        ("_alive", "bool", False),
+    )
+
+    def __init__(self) -> None:
+        if not NUMPY_AVAILABLE:
+            raise ImportError("numpy library is required for the columnar storage engine. Install with: pip install numpy")
+
+        self._rows: Dict[TaskId, int] = {}
+        self._live: "weakref.WeakValueDictionary[TaskId, Task]" = weakref.WeakValueDictionary()
+        self._reset()
+
+    def _reset(self) -> None:
+        self._size = 0
+        self._rows.clear()
+        self._live.clear()
+        self._titles = StringPool()
+        self._descriptions = StringPool()
+        self._allocate(self.INITIAL_CAPACITY)
+
+    def _allocate(self, capacity: int) -> None:
+        self._capacity = capacity
+        for name, dtype, fill in self.COLUMNS:
+            setattr(self, name, np.full(capacity, fill, dtype=dtype))
+
+    def _resize(self, capacity: int, rows: Any = None) -> None:
+        """Réalloue les colonnes ; rows (indices conservés) compacte en même temps"""
+        for name, _, fill in self.COLUMNS:
+            old = getattr(self, name)
+            new = np.full(capacity, fill, dtype=old.dtype)
+            if rows is None:
+                new[:self._size] = old[:self._size]
+            else:
+                new[:len(rows)] = old[rows]
+            setattr(self, name, new)
+        self._capacity = capacity
+
+    def _compact(self) -> None:
+        rows = np.flatnonzero(self._alive[:self._size])
+        self._resize(max(self.INITIAL_CAPACITY, 2 * len(rows)), rows)
+        self._size = len(rows)
+        self._rows = {self._id_at(row): row for row in range(self._size)}
+        self._title[:self._size] = self._titles.retain(self._title[:self._size])
+        self._description[:self._size] = self._descriptions.retain(self._description[:self._size])
+
+    def _compact_if_needed(self) -> None:
+        live = len(self._rows)
+        tombstones = self._size - live
+        strings = max(len(self._titles), len(self._descriptions))
+        if (tombstones > self.INITIAL_CAPACITY and tombstones > live) or \
+                strings > max(self.INITIAL_CAPACITY, 2 * live):
+            self._compact()
+
+    def _store_id(self, row: int, task_id: TaskId) -> None:
+        ids = self._ids
+        if ids.dtype != object:
+            exact = isinstance(task_id, float) if ids.dtype.kind == "f" else isinstance(task_id, int)
+            if not exact:
+                if not self._rows:
+                    # Stockage vide : on adopte le type du premier identifiant
+                    self._ids = np.zeros(self._capacity, dtype="int64" if isinstance(task_id, int) else "float64")
+                else:
+                    self._ids = ids.astype(object)
+        self._ids[row] = task_id
+
+    def _id_at(self, row: int) -> TaskId:
+        value = self._ids[row]
+        return value.item() if hasattr(value, "item") else value
+
+    def _write_row(self, row: int, task: Task) -> None:
+        self._store_id(row, task.id)
+        self._priority[row] = PRIORITY_CODES[task.priority]
+        self._status[row] = STATUS_CODES[task.status]
+        self._created[row] = task._created_us
+        self._completed[row] = NO_DATE if task._completed_us is None else task._completed_us
+        self._project[row] = float("nan") if task.project_id is None else task.project_id
+        self._title[row] = self._titles.intern(task.title)
+        self._description[row] = self._descriptions.intern(task.description)
+
+    def _materialize(self, row: int) -> Task:
+        completed = int(self._completed[row])
+        project_id = float(self._project[row])
+        task = Task._from_fields(
+            self._id_at(row),
+            self._titles[self._title[row]],
+            self._descriptions[self._description[row]],
+            PRIORITIES[self._priority[row]],
+            STATUSES[self._status[row]],
+            int(self._created[row]),
+            None if completed == NO_DATE else completed,
+            None if project_id != project_id else project_id
+        )
+        task._owner = self
+        return task
+
+    def _task_at(self, row: int) -> Task:
+        task_id = self._id_at(row)
+        task = self._live.get(task_id)
+        if task is None:
+            task = self._materialize(row)
+            self._live[task_id] = task
+        return task
+
+    def _alive_mask(self) -> Any:
+        return self._alive[:self._size]
+
+    def add(self, task: Task) -> None:
+        if task.id in self._rows:
+            self.remove(task.id)
+
+        if self._size == self._capacity:
+            self._resize(2 * self._capacity)
+
+        row = self._size
+        self._size += 1
+        self._write_row(row, task)
+        self._alive[row] = True
+        self._rows[task.id] = row
+        self._live[task.id] = task
+        task._owner = self
+
+    def get(self, task_id: TaskId) -> Optional[Task]:
+        row = self._rows.get(task_id)
+        if row is None:
+            return None
+        return self._task_at(row)
+
+    def existing(self, task_ids: Iterable[TaskId]) -> List[TaskId]:
+        rows = self._rows
+        return [task_id for task_id in dict.fromkeys(task_ids) if task_id in rows]
+
+    def remove(self, task_id: TaskId) -> bool:
+        row = self._rows.pop(task_id, None)
+        if row is None:
+            return False
+
+        self._alive[row] = False
+        task = self._live.pop(task_id, None)
+        if task is not None:
+            task._owner = None
+
+        self._compact_if_needed()
+        return True
+
+    def add_many(self, tasks: List[Task]) -> None:
+        """Ajout en bloc : une seule réallocation et des affectations de colonnes vectorisées"""
+        batch: Dict[TaskId, Task] = {}
+        for task in tasks:
+            if task.id in self._rows:
+                self.remove(task.id)
+            batch[task.id] = task
+        if not batch:
+            return
+
+        start = self._size
+        stop = start + len(batch)
+        if stop > self._capacity:
+            self._resize(max(2 * self._capacity, stop))
+
+        batch_tasks = list(batch.values())
+        ids = list(batch)
+        id_type = {"f": float, "i": int}.get(self._ids.dtype.kind)
+        if id_type is not None and all(type(task_id) is id_type for task_id in ids):
+            self._ids[start:stop] = ids
+        else:
+            for row, task_id in enumerate(ids, start):
+                self._store_id(row, task_id)
+
+        self._priority[start:stop] = [PRIORITY_CODES[task._priority] for task in batch_tasks]
+        self._status[start:stop] = [STATUS_CODES[task._status] for task in batch_tasks]
+        self._created[start:stop] = [task._created_us for task in batch_tasks]
+        self._completed[start:stop] = [
+            NO_DATE if task._completed_us is None else task._completed_us for task in batch_tasks
+        ]
+        self._project[start:stop] = [
+            float("nan") if task.project_id is None else task.project_id for task in batch_tasks
+        ]
+        self._title[start:stop] = [self._titles.intern(task.title) for task in batch_tasks]
+        self._description[start:stop] = [self._descriptions.intern(task.description) for task in batch_tasks]
+        self._alive[start:stop] = True
+
+        self._size = stop
+        self._rows.update(zip(ids, range(start, stop)))
+        for task in batch_tasks:
+            self._live[task.id] = task
+            task._owner = self
+
+    def remove_many(self, task_ids: Iterable[TaskId]) -> int:
+        """Suppression en bloc : pierres tombales posées d'un coup, un seul compactage"""
+        rows = []
+        for task_id in task_ids:
+            row = self._rows.pop(task_id, None)
+            if row is None:
+                continue
+            rows.append(row)
+            task = self._live.pop(task_id, None)
+            if task is not None:
+                task._owner = None
+
+        if rows:
+            self._alive[rows] = False
+            self._compact_if_needed()
+        return len(rows)
+
+    def update_many(
+        self,
+        task_ids: Iterable[TaskId],
+        status: Optional[Status] = None,
+        priority: Optional[Priority] = None
+    ) -> int:
+        """Mise à jour en bloc par affectation vectorisée des colonnes"""
+        targets: Dict[TaskId, int] = {}
+        for task_id in task_ids:
+            row = self._rows.get(task_id)
+            if row is not None:
+                targets[task_id] = row
+        if not targets:
+            return 0
+
+        rows = np.fromiter(targets.values(), dtype=np.intp, count=len(targets))
+        done_code = STATUS_CODES[Status.DONE]
+
+        if priority is not None:
+            completed = self._status[rows] == done_code
+            if completed.any():
+                completed_ids = [self._id_at(row) for row in rows[completed]]
+                raise ValueError(f"Cannot update priority of completed tasks: {completed_ids}")
+            self._priority[rows] = PRIORITY_CODES[priority]
+
+        if status is not None:
+            if status is Status.DONE:
+                newly_completed = rows[self._status[rows] != done_code]
+                self._completed[newly_completed] = to_epoch_us(datetime.now())
+            self._status[rows] = STATUS_CODES[status]
+
+        # Les objets Task déjà matérialisés reflètent les nouvelles colonnes
+        for task_id, row in targets.items():
+            task = self._live.get(task_id)
+            if task is not None:
+                task._priority = PRIORITIES[self._priority[row]]
+                task._status = STATUSES[self._status[row]]
+                completed_us = int(self._completed[row])
+                task._completed_us = None if completed_us == NO_DATE else completed_us
+
+        return len(targets)
+
+    def _select(self, mask: Any) -> List[Task]:
+        return [self._task_at(row) for row in np.flatnonzero(mask)]
+
+    def by_status(self, status: Status) -> List[Task]:
+        return self._select(self._alive_mask() & (self._status[:self._size] == STATUS_CODES[status]))
+
+    def by_priority(self, priority: Priority) -> List[Task]:
+        return self._select(self._alive_mask() & (self._priority[:self._size] == PRIORITY_CODES[priority]))
+
+    def _day_masks(self, day: date) -> Any:
+        start = to_epoch_us(datetime.combine(day, dt_time.min))
+        end = start + MICROSECONDS_PER_DAY
+        created = self._created[:self._size]
+        completed = self._completed[:self._size]
+        created_mask = (created >= start) & (created < end)
+        completed_mask = (completed >= start) & (completed < end)
+        return created_mask, completed_mask
+
+    def by_day(self, day: date) -> List[Task]:
+        created_mask, completed_mask = self._day_masks(day)
+        return self._select(self._alive_mask() & (created_mask | completed_mask))
+
+    def counts(self, day: Optional[date] = None) -> TaskCounts:
+        mask = self._alive_mask()
+        created_on_day = 0
+        if day is not None:
+            created_mask, completed_mask = self._day_masks(day)
+            mask = mask & (created_mask | completed_mask)
+            created_on_day = int(np.count_nonzero(mask & created_mask))
+
+        status_counts = np.bincount(self._status[:self._size][mask], minlength=len(STATUSES))
+        priority_counts = np.bincount(self._priority[:self._size][mask], minlength=len(PRIORITIES))
+
+        return TaskCounts(
+            int(np.count_nonzero(mask)),
+            {status: int(status_counts[code]) for status, code in STATUS_CODES.items()},
+            {priority: int(priority_counts[code]) for priority, code in PRIORITY_CODES.items()},
+            created_on_day
+        )
+
+    def clear(self) -> None:
+        for task in list(self._live.values()):
+            task._owner = None
+        self._reset()
+
+    def _on_task_changed(self, task: Task, field: str, old_value: Any) -> None:
+        row = self._rows.get(task.id)
+        if row is not None:
+            self._write_row(row, task)
+            if field in ("title", "description"):
+                self._compact_if_needed()
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __iter__(self) -> Iterator[Task]:
+        for row in np.flatnonzero(self._alive_mask()):
+            yield self._task_at(row)
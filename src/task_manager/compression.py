@@ -0,0 +1,114 @@
+# src/task_manager/compression.py
+import gzip
+import io
+from contextlib import contextmanager
+from typing import IO, Any, BinaryIO, Dict, Iterator, Optional
+
+# Imports conditionnels des formats hors bibliothèque standard
+try:
+    import zstandard
+    ZSTANDARD_AVAILABLE = True
+except ImportError:
+    ZSTANDARD_AVAILABLE = False
+
+try:
+    import lz4.frame
+    LZ4_AVAILABLE = True
+except ImportError:
+    LZ4_AVAILABLE = False
+
+# Extension -> format ; niveaux par défaut choisis pour la vitesse
+EXTENSIONS: Dict[str, str] = {".gz": "gzip", ".zst": "zstd", ".lz4": "lz4"}
+SUFFIXES: Dict[str, str] = {name: extension for extension, name in EXTENSIONS.items()}
+DEFAULT_LEVELS: Dict[str, int] = {"gzip": 6, "zstd": 3, "lz4": 0}
+SUPPORTED_COMPRESSIONS = list(SUFFIXES)
+
+
+def detect_compression(path: str, compression: Optional[str] = None) -> Optional[str]:
+    """
+    Format de compression demandé, sinon déduit de l'extension du fichier
+
+    Args:
+        compression: 'gzip', 'zstd', 'lz4', 'none' pour forcer un fichier
+                     non compressé, ou None pour suivre l'extension
+
+    Raises:
+        ValueError: Si le format est inconnu
+    """
+    if compression is None:
+        for extension, name in EXTENSIONS.items():
+            if path.endswith(extension):
+                return name
+        return None
+
+    compression = compression.lower().strip()
+    if compression == "none":
+        return None
+    if compression not in SUFFIXES:
+        raise ValueError(f"Unsupported compression: {compression}. Supported compressions: {SUPPORTED_COMPRESSIONS}")
+    return compression
+
+
+def strip_compression_suffix(path: str) -> str:
+    """Nom du fichier sans l'extension de compression"""
+    for extension in EXTENSIONS:
+        if path.endswith(extension):
+            return path[:-len(extension)]
+    return path
+
+
+def _check_available(compression: str) -> None:
+    if compression == "zstd" and not ZSTANDARD_AVAILABLE:
+        raise ImportError("zstandard library is required for .zst compression. Install with: pip install zstandard")
+    if compression == "lz4" and not LZ4_AVAILABLE:
+        raise ImportError("lz4 library is required for .lz4 compression. Install with: pip install lz4")
+
+
+def _compressor(raw: BinaryIO, compression: str, level: Optional[int]) -> BinaryIO:
+    if level is None:
+        level = DEFAULT_LEVELS[compression]
+    if compression == "gzip":
+        # mtime=0 : même contenu, même fichier compressé
+        return gzip.GzipFile(fileobj=raw, mode='wb', compresslevel=level, mtime=0)
+    if compression == "zstd":
+        return zstandard.ZstdCompressor(level=level).stream_writer(raw, closefd=False)
+    return lz4.frame.LZ4FrameFile(raw, mode='wb', compression_level=level)
+
+
+def _decompressor(raw: BinaryIO, compression: str) -> BinaryIO:
+    if compression == "gzip":
+        return gzip.GzipFile(fileobj=raw, mode='rb')
+    if compression == "zstd":
+        return zstandard.ZstdDecompressor().stream_reader(raw, closefd=False)
+    return lz4.frame.LZ4FrameFile(raw, mode='rb')
+
+
+@contextmanager
+def compressed_stream(
+    raw: BinaryIO,
+    mode: str,
+    compression: str,
+    level: Optional[int] = None,
+    **kwargs: Any
+) -> Iterator[IO]:
+    """
+    Enveloppe un fichier binaire ouvert dans un flux (dé)compressé
+
+    Les données sont compressées ou décompressées au fil des écritures et
+    lectures, jamais en entier en mémoire. À la sortie, la fin du flux
+    compressé est écrite ; le fichier sous-jacent reste ouvert.
+
+    Args:
+        raw: Fichier binaire ouvert
+        mode: 'r', 'rb', 'w' ou 'wb' ; en mode texte, kwargs (encoding...)
+              sont transmis à io.TextIOWrapper
+        compression: 'gzip', 'zstd' ou 'lz4'
+        level: Niveau de compression (DEFAULT_LEVELS par défaut)
+    """
+    _check_available(compression)
+    binary = _compressor(raw, compression, level) if 'w' in mode else _decompressor(raw, compression)
+    stream = binary if 'b' in mode else io.TextIOWrapper(binary, **kwargs)
+    try:
+        yield stream
+    finally:
+        stream.close()
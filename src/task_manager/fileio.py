@@ -0,0 +1,157 @@
+# src/task_manager/fileio.py
+import os
+import shutil
+import uuid
+from contextlib import contextmanager, suppress
+from typing import IO, Any, Dict, Iterator, Optional, Tuple
+from .compression import compressed_stream
+
+
+def fsync_directory(directory: str) -> None:
+    """Rend durable le renommage d'une entrée du répertoire (POSIX uniquement)"""
+    if os.name != 'posix':
+        return
+    fd = os.open(directory, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+@contextmanager
+def open_for_write(
+    path: str,
+    mode: str = 'w',
+    atomic: bool = True,
+    compression: Optional[str] = None,
+    level: Optional[int] = None,
+    **kwargs: Any
+) -> Iterator[IO]:
+    """
+    Ouvre un fichier en écriture, de façon atomique par défaut
+
+    En mode atomique, l'écriture se fait dans un fichier temporaire du même
+    répertoire, synchronisé sur disque (fsync) puis renommé sur la cible avec
+    os.replace. Un crash pendant l'écriture laisse donc l'ancien fichier
+    intact ; en cas d'erreur le fichier temporaire est supprimé. Un lien
+    symbolique est suivi (le fichier pointé est remplacé, le lien reste) et
+    les permissions d'un fichier existant sont conservées.
+
+    Args:
+        path: Fichier cible
+        mode: 'w' ou 'wb'
+        atomic: False pour écrire directement dans la cible
+        compression: 'gzip', 'zstd' ou 'lz4' pour compresser au fil de l'écriture
+        level: Niveau de compression
+        **kwargs: Transmis à open (encoding, newline...)
+    """
+    if compression is not None:
+        with open_for_write(path, 'wb', atomic=atomic) as raw:
+            with compressed_stream(raw, mode, compression, level, **kwargs) as file:
+                yield file
+        return
+
+    if not atomic:
+        with open(path, mode, **kwargs) as file:
+            yield file
+        return
+
+    path = os.path.realpath(path)
+    directory = os.path.dirname(path)
+    temp_path = os.path.join(directory, f".{os.path.basename(path)}.{uuid.uuid4().hex[:12]}.tmp")
+
+    try:
+        with open(temp_path, mode.replace('w', 'x'), **kwargs) as file:
+            yield file
+            file.flush()
+            os.fsync(file.fileno())
+        with suppress(FileNotFoundError):
+            shutil.copymode(path, temp_path)
+        os.replace(temp_path, path)
+    except BaseException:
+        with suppress(OSError):
+            os.unlink(temp_path)
+        raise
+
+    fsync_directory(directory)
+
+
+@contextmanager
+def open_for_read(path: str, mode: str = 'r', compression: Optional[str] = None, **kwargs: Any) -> Iterator[IO]:
+    """Ouvre un fichier en lecture, décompressé au fil de la lecture si compression est donné"""
+    if compression is None:
+        with open(path, mode, **kwargs) as file:
+            yield file
+        return
+
+    with open(path, 'rb') as raw:
+        with compressed_stream(raw, mode, compression, **kwargs) as file:
+            yield file
+
+
+class FileCountCache:
+    """
+    Nombre de fichiers d'une extension par répertoire, sans parcours à chaque appel
+
+    Le compte est gardé avec la date de modification (mtime) du répertoire,
+    qui change à chaque création, suppression ou renommage d'une entrée :
+    os.listdir n'est relancé que si le répertoire a changé depuis. Les
+    écritures faites par ce processus sont signalées avec record_write pour
+    ne pas déclencher de nouveau parcours : la date du répertoire est relevée
+    avec directory_mtime juste avant l'écriture, et le compte n'est avancé
+    que si elle correspond encore au compte gardé (sinon un autre processus
+    a modifié le répertoire et le compte est abandonné).
+    """
+
+    def __init__(self, extension: str) -> None:
+        self._extension = extension
+        # Répertoire -> (mtime en ns, nombre de fichiers)
+        self._counts: Dict[str, Tuple[int, int]] = {}
+
+    def count(self, directory: str) -> int:
+        """
+        Raises:
+            OSError: Si le répertoire ne peut pas être lu
+        """
+        key = os.path.abspath(directory)
+        # mtime lu avant le parcours : un changement pendant le parcours force le suivant
+        mtime = os.stat(key).st_mtime_ns
+        cached = self._counts.get(key)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        count = sum(1 for name in os.listdir(directory) if name.endswith(self._extension))
+        self._counts[key] = (mtime, count)
+        return count
+
+    @staticmethod
+    def directory_mtime(path: str) -> Optional[int]:
+        """mtime du répertoire de path, à relever avant une écriture puis passer à record_write"""
+        try:
+            return os.stat(os.path.dirname(os.path.abspath(path))).st_mtime_ns
+        except OSError:
+            return None
+
+    def record_write(self, path: str, created: bool, mtime_before: Optional[int]) -> None:
+        """
+        Met à jour le compte après l'écriture de path
+
+        Args:
+            created: Le fichier n'existait pas avant l'écriture
+            mtime_before: directory_mtime(path) relevé avant l'écriture
+        """
+        key = os.path.dirname(os.path.abspath(path))
+        cached = self._counts.get(key)
+        if cached is None:
+            return
+        if mtime_before is None or cached[0] != mtime_before:
+            # Répertoire modifié par ailleurs depuis le dernier count
+            del self._counts[key]
+            return
+        try:
+            mtime = os.stat(key).st_mtime_ns
+        except OSError:
+            del self._counts[key]
+            return
+        added = 1 if created and path.endswith(self._extension) else 0
+        self._counts[key] = (mtime, cached[1] + added)
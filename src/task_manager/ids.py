@@ -0,0 +1,142 @@
+# src/task_manager/ids.py
+import threading
+import time
+from typing import Callable, List, Union
+
+TaskId = Union[float, int]
+
+
+class IdGenerator:
+    """Interface d'un générateur d'identifiants de tâches"""
+
+    def next_id(self) -> TaskId:
+        raise NotImplementedError
+
+    def next_ids(self, count: int) -> List[TaskId]:
+        """count identifiants consécutifs (les générateurs peuvent lire l'horloge une seule fois)"""
+        return [self.next_id() for _ in range(count)]
+
+
+class MonotonicIdGenerator(IdGenerator):
+    """
+    Identifiants float basés sur time.time(), strictement croissants
+
+    Compatible avec les anciens identifiants (timestamp float). Si l'horloge
+    renvoie deux fois la même valeur (ou recule), l'identifiant est avancé d'une
+    microseconde. Unique au sein d'un processus seulement : deux processus
+    qui créent une tâche à la même microseconde obtiennent le même
+    identifiant. Pour plusieurs processus écrivant dans le même stockage,
+    utiliser SnowflakeIdGenerator avec un worker_id distinct par processus.
+    """
+
+    STEP = 1e-6
+
+    def __init__(self, clock: Callable[[], float] = time.time) -> None:
+        self._clock = clock
+        self._last: float = 0.0
+        self._lock = threading.Lock()
+
+    def next_id(self) -> float:
+        with self._lock:
+            now = self._clock()
+            if now <= self._last:
+                now = self._last + self.STEP
+            self._last = now
+            return now
+
+    def next_ids(self, count: int) -> List[float]:
+        with self._lock:
+            now = self._clock()
+            if now <= self._last:
+                now = self._last + self.STEP
+            ids = [now + i * self.STEP for i in range(count)]
+            if ids:
+                self._last = ids[-1]
+            return ids
+
+
+class SnowflakeIdGenerator(IdGenerator):
+    """
+    Identifiants entiers 64 bits de type Snowflake
+
+    Disposition : 41 bits de millisecondes depuis EPOCH_MS, 10 bits de worker,
+    12 bits de séquence. Les identifiants sont triés par date de création.
+
+    Garantie : unicité entre processus si et seulement si deux processus
+    actifs n'ont jamais le même worker_id. Il n'y a pas de valeur par défaut
+    (un worker_id dérivé du PID entrerait en collision une fois sur 1024
+    par paire de processus) : l'appelant l'attribue, par exemple depuis la
+    configuration de déploiement ou un registre de workers.
+    """
+
+    EPOCH_MS = 1704067200000  # 2024-01-01T00:00:00Z
+    WORKER_BITS = 10
+    SEQUENCE_BITS = 12
+    MAX_WORKER_ID = (1 << WORKER_BITS) - 1
+    MAX_SEQUENCE = (1 << SEQUENCE_BITS) - 1
+
+    def __init__(
+        self,
+        worker_id: int,
+        clock: Callable[[], float] = time.time
+    ) -> None:
+        if not isinstance(worker_id, int) or not 0 <= worker_id <= self.MAX_WORKER_ID:
+            raise ValueError(f"Worker ID must be an integer between 0 and {self.MAX_WORKER_ID}, got {worker_id}")
+
+        self.worker_id: int = worker_id
+        self._clock = clock
+        self._last_ms: int = -1
+        self._sequence: int = 0
+        self._lock = threading.Lock()
+
+    def next_id(self) -> int:
+        with self._lock:
+            return self._allocate(int(self._clock() * 1000) - self.EPOCH_MS)
+
+    def next_ids(self, count: int) -> List[int]:
+        with self._lock:
+            now_ms = int(self._clock() * 1000) - self.EPOCH_MS
+            return [self._allocate(now_ms) for _ in range(count)]
+
+    def _allocate(self, now_ms: int) -> int:
+        """Identifiant suivant pour l'instant now_ms (appelé sous le verrou)"""
+        if now_ms < self._last_ms:
+            now_ms = self._last_ms
+
+        if now_ms == self._last_ms:
+            self._sequence = (self._sequence + 1) & self.MAX_SEQUENCE
+            if self._sequence == 0:
+                # Séquence épuisée pour cette milliseconde : on passe à la suivante
+                now_ms = self._last_ms + 1
+        else:
+            self._sequence = 0
+
+        self._last_ms = now_ms
+        return (
+            (now_ms << (self.WORKER_BITS + self.SEQUENCE_BITS))
+            | (self.worker_id << self.SEQUENCE_BITS)
+            | self._sequence
+        )
+
+
+def parse_id(value: Union[float, int, str]) -> TaskId:
+    """
+    Convertit un identifiant (nouveau format entier ou ancien float) en clé
+
+    Raises:
+        TypeError: Si le type n'est pas convertible
+        ValueError: Si la chaîne n'est pas un nombre
+    """
+    if isinstance(value, bool):
+        raise TypeError(f"Task ID must be a number, got {type(value)}")
+
+    if isinstance(value, (int, float)):
+        return value
+
+    if isinstance(value, str):
+        try:
+            return int(value)
+        except ValueError:
+            return float(value)
+
+    raise TypeError(f"Task ID must be a number, got {type(value)}")
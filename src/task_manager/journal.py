@@ -0,0 +1,335 @@
+# src/task_manager/journal.py
+import json
+import os
+import uuid
+from datetime import datetime
+from typing import Any, BinaryIO, Dict, Iterable, List, Optional
+from .task import Task, Priority, Status, to_epoch_us
+from .storage import MemoryTaskStore
+from .ids import TaskId
+from .jsonstream import iter_json_array, iter_json_document
+from .fileio import open_for_write, fsync_directory
+
+
+class JournalTaskStore(MemoryTaskStore):
+    """
+    Stockage en mémoire persisté par un journal en ajout seul (write-ahead log)
+
+    Chaque changement ajoute une ligne JSON compacte au journal au lieu de
+    réécrire tout le fichier :
+
+        ["base", génération]                  en-tête : instantané de départ
+        ["add", {tâche}]                      ajout (ou remplacement)
+        ["del", id]                           suppression
+        ["clear"]                             suppression de toutes les tâches
+        ["status", id, statut, completed_us]  changement de statut
+        ["priority", id, priorité]            changement de priorité
+        ["project", id, project_id]           affectation à un projet
+        ["text", id, titre, description]
+        ["times", id, created_us, completed_us]
+
+    Chaque enregistrement est écrit (et synchronisé si durable) avant la
+    modification en mémoire : si l'écriture échoue, la modification n'a pas
+    lieu et l'erreur remonte. Chaque enregistrement donne la nouvelle valeur :
+    rejouer le journal sur un instantané plus récent redonne le même état.
+
+    checkpoint() réécrit l'instantané (même format que
+    TaskManager.save_to_file) de façon atomique puis vide le journal ; c'est
+    fait automatiquement au-delà de COMPACT_THRESHOLD enregistrements. Un
+    chargement complet (replace_all) écrit de la même façon l'instantané des
+    nouvelles tâches, sans enregistrement par tâche. Chaque instantané porte
+    une génération (metadata.generation) et le journal commence par celle de
+    l'instantané auquel il s'applique : après un crash entre l'écriture de
+    l'instantané et la troncature, le journal de l'ancien instantané est
+    ignoré. Au démarrage, l'instantané est chargé puis le journal rejoué ; un
+    dernier enregistrement incomplet (crash pendant l'écriture) est ignoré et
+    retiré.
+    """
+
+    persistent = True
+    COMPACT_THRESHOLD = 100_000
+
+    def __init__(self, snapshot_path: str, journal_path: Optional[str] = None, durable: bool = True) -> None:
+        """
+        Args:
+            snapshot_path: Fichier JSON de l'instantané
+            journal_path: Fichier du journal (par défaut snapshot_path + '.wal')
+            durable: fsync après chaque écriture ; sinon les enregistrements
+                     sont seulement transmis au système (survivent à un crash
+                     du processus, pas à une coupure de courant)
+        """
+        super().__init__()
+        self._snapshot_path = snapshot_path
+        self._journal_path = journal_path or snapshot_path + ".wal"
+        # L'instantané n'est écrit que par ce moteur (pas d'export JSON par-dessus)
+        self.database_file = os.path.abspath(snapshot_path)
+        self._durable = durable
+        self._file: Optional[BinaryIO] = None
+        self._records = 0
+        # Génération de l'instantané courant ; journal sans en-tête (ancien format)
+        self._generation: Optional[str] = None
+        self._legacy_journal = False
+
+        self._load_snapshot()
+        self._replay_journal()
+
+    # Démarrage
+
+    def _load_snapshot(self) -> None:
+        if not os.path.exists(self._snapshot_path):
+            return
+
+        tasks = []
+        others: Dict[str, Any] = {}
+        with open(self._snapshot_path, 'r', encoding='utf-8') as file:
+            for i, task_data in enumerate(iter_json_array(file, "tasks", source=self._snapshot_path, extra=others)):
+                try:
+                    tasks.append(Task.from_dict(task_data))
+                except Exception as e:
+                    raise ValueError(f"Invalid task data at index {i} in '{self._snapshot_path}': {str(e)}")
+        MemoryTaskStore.add_many(self, tasks)
+
+        metadata = others.get("metadata")
+        if isinstance(metadata, dict):
+            self._generation = metadata.get("generation")
+
+    def _replay_journal(self) -> None:
+        if not os.path.exists(self._journal_path):
+            return
+
+        offset = 0
+        incomplete = False
+        stale = False
+        with open(self._journal_path, 'rb') as file:
+            for number, line in enumerate(file, 1):
+                if not line.endswith(b"\n"):
+                    incomplete = True
+                    break
+                try:
+                    record = json.loads(line)
+                    if number == 1 and record[0] == "base":
+                        if record[1] != self._generation:
+                            # Journal de l'instantané précédent, déjà intégré ou remplacé
+                            stale = True
+                            break
+                    else:
+                        self._legacy_journal = self._legacy_journal or number == 1
+                        self._apply(record)
+                        self._records += 1
+                except (ValueError, TypeError, KeyError, IndexError) as e:
+                    raise ValueError(f"Corrupted journal record at line {number} in '{self._journal_path}': {str(e)}")
+                offset += len(line)
+
+        if stale:
+            self._truncate_journal()
+        elif incomplete:
+            os.truncate(self._journal_path, offset)
+
+    def _apply(self, record: List[Any]) -> None:
+        """Rejoue un enregistrement sans le journaliser à nouveau"""
+        op = record[0]
+        if op == "add":
+            MemoryTaskStore.add(self, Task.from_trusted_dict(record[1]))
+            return
+        if op == "del":
+            MemoryTaskStore.remove(self, record[1])
+            return
+        if op == "clear":
+            MemoryTaskStore.clear(self)
+            return
+
+        task = self._tasks.get(record[1])
+        if task is None:
+            # Tâche supprimée plus loin dans l'instantané déjà compacté
+            return
+
+        if op == "status":
+            old_status = task._status
+            task._status = Status(record[2])
+            task._completed_us = record[3]
+            MemoryTaskStore._on_task_changed(self, task, "status", old_status)
+        elif op == "priority":
+            old_priority = task._priority
+            task._priority = Priority(record[2])
+            MemoryTaskStore._on_task_changed(self, task, "priority", old_priority)
+        elif op == "project":
+            task._project_id = record[2]
+        elif op == "text":
+            task._title = record[2]
+            task._description = record[3]
+        elif op == "times":
+            task._created_us = record[2]
+            task._completed_us = record[3]
+        else:
+            raise ValueError(f"Unknown journal operation: {op}")
+
+    # Écriture du journal
+
+    def _write(self, records: List[List[Any]]) -> None:
+        """
+        Ajoute des enregistrements au journal en une écriture, avant de
+        modifier la mémoire. En cas d'échec, le journal est ramené à sa taille
+        précédente (au mieux) pour ne pas laisser de ligne partielle.
+        """
+        if not records:
+            return
+
+        data = b"".join(
+            json.dumps(record, separators=(',', ':'), ensure_ascii=False).encode('utf-8') + b"\n"
+            for record in records
+        )
+        if self._file is None:
+            self._file = open(self._journal_path, 'ab')
+        offset = self._file.seek(0, os.SEEK_END)
+        if offset == 0:
+            header = json.dumps(["base", self._generation], separators=(',', ':')).encode('utf-8')
+            data = header + b"\n" + data
+        try:
+            self._file.write(data)
+            self._file.flush()
+            if self._durable:
+                os.fsync(self._file.fileno())
+        except BaseException:
+            try:
+                self._file.truncate(offset)
+            except OSError:
+                pass
+            raise
+        self._records += len(records)
+
+    def _compact_if_needed(self) -> None:
+        if self._records >= self.COMPACT_THRESHOLD:
+            self.checkpoint()
+
+    def checkpoint(self) -> None:
+        """Écrit un instantané de toutes les tâches puis vide le journal"""
+        self._write_snapshot(list(self._tasks.values()))
+        # Un crash avant cette troncature rejoue le journal sur le nouvel
+        # instantané, ce qui redonne le même état
+        self._truncate_journal()
+
+    def _write_snapshot(self, tasks: List[Task]) -> None:
+        """Instantané atomique d'une nouvelle génération ; le journal courant ne s'y applique plus"""
+        generation = uuid.uuid4().hex
+        chunks = iter_json_document(
+            (task.to_dict() for task in tasks),
+            key="tasks",
+            trailer=lambda count: {
+                "metadata": {
+                    "total_tasks": count,
+                    "saved_at": datetime.now().isoformat(),
+                    "generation": generation
+                }
+            }
+        )
+        with open_for_write(self._snapshot_path, 'w', encoding='utf-8') as file:
+            for chunk in chunks:
+                file.write(chunk)
+        self._generation = generation
+
+    def _truncate_journal(self) -> None:
+        self.close()
+        with open(self._journal_path, 'wb') as file:
+            os.fsync(file.fileno())
+        fsync_directory(os.path.dirname(os.path.abspath(self._journal_path)))
+        self._records = 0
+        self._legacy_journal = False
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    # Opérations du stockage
+
+    def add(self, task: Task) -> None:
+        self._write([["add", task.to_dict()]])
+        super().add(task)
+        self._compact_if_needed()
+
+    def remove(self, task_id: TaskId) -> bool:
+        if task_id not in self._tasks:
+            return False
+        self._write([["del", task_id]])
+        super().remove(task_id)
+        self._compact_if_needed()
+        return True
+
+    def add_many(self, tasks: List[Task]) -> None:
+        self._write([["add", task.to_dict()] for task in tasks])
+        super().add_many(tasks)
+        self._compact_if_needed()
+
+    def remove_many(self, task_ids: Iterable[TaskId]) -> int:
+        present = [task_id for task_id in dict.fromkeys(task_ids) if task_id in self._tasks]
+        self._write([["del", task_id] for task_id in present])
+        for task_id in present:
+            MemoryTaskStore.remove(self, task_id)
+        self._compact_if_needed()
+        return len(present)
+
+    def update_many(
+        self,
+        task_ids: Iterable[TaskId],
+        status: Optional[Status] = None,
+        priority: Optional[Priority] = None
+    ) -> int:
+        """Mêmes règles que TaskStore.update_many ; les enregistrements sont écrits puis rejoués en mémoire"""
+        tasks = [task for task in (self.get(task_id) for task_id in task_ids) if task is not None]
+
+        if priority is not None:
+            completed = [task.id for task in tasks if task.status == Status.DONE]
+            if completed:
+                raise ValueError(f"Cannot update priority of completed tasks: {completed}")
+
+        now_us = to_epoch_us(datetime.now())
+        records: List[List[Any]] = []
+        for task in tasks:
+            if priority is not None and task._priority is not priority:
+                records.append(["priority", task.id, priority.value])
+            if status is not None and task._status is not status:
+                completed_us = now_us if status is Status.DONE else task._completed_us
+                records.append(["status", task.id, status.value, completed_us])
+
+        self._write(records)
+        for record in records:
+            self._apply(record)
+        self._compact_if_needed()
+        return len(tasks)
+
+    def clear(self) -> None:
+        self._write([["clear"]])
+        super().clear()
+        self._compact_if_needed()
+
+    def replace_all(self, tasks: List[Task]) -> None:
+        """
+        Remplace toutes les tâches par un nouvel instantané
+
+        Le nouvel instantané remplace l'ancien de façon atomique, puis le
+        journal est vidé : un crash entre les deux laisse un journal d'une
+        autre génération, ignoré au démarrage. Un journal d'ancien format
+        (sans génération) est d'abord intégré à l'instantané courant. La
+        mémoire n'est modifiée qu'ensuite.
+        """
+        if self._legacy_journal:
+            self.checkpoint()
+        self._write_snapshot(tasks)
+        self._truncate_journal()
+        MemoryTaskStore.clear(self)
+        MemoryTaskStore.add_many(self, tasks)
+
+    def _on_task_changed(self, task: Task, field: str, old_value: Any) -> None:
+        # La tâche porte déjà la nouvelle valeur ; si l'écriture échoue, Task la retire
+        if field == "status":
+            self._write([["status", task.id, task._status.value, task._completed_us]])
+        elif field == "priority":
+            self._write([["priority", task.id, task._priority.value]])
+        elif field == "project_id":
+            self._write([["project", task.id, task.project_id]])
+        elif field in ("title", "description"):
+            self._write([["text", task.id, task._title, task._description]])
+        elif field in ("created_at", "completed_at"):
+            self._write([["times", task.id, task._created_us, task._completed_us]])
+        super()._on_task_changed(task, field, old_value)
+        self._compact_if_needed()
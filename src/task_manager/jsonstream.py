@@ -0,0 +1,226 @@
+# src/task_manager/jsonstream.py
+import json
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, TextIO
+
+WHITESPACE = " \t\n\r"
+CONTAINERS = (dict, list, tuple)
+JSON_TYPE_NAMES = {'{': "object", '[': "array", '"': "string", 't': "boolean", 'f': "boolean", 'n': "null"}
+
+
+class _StreamBuffer:
+    """Fenêtre glissante sur un fichier texte, décodée morceau par morceau"""
+
+    def __init__(self, file: TextIO, chunk_size: int) -> None:
+        self._file = file
+        self._chunk_size = chunk_size
+        self._decoder = json.JSONDecoder()
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+
+    def fill(self) -> bool:
+        """Lit un morceau de plus ; la partie déjà consommée est libérée"""
+        if self.eof:
+            return False
+        chunk = self._file.read(self._chunk_size)
+        if not chunk:
+            self.eof = True
+            return False
+        self.buffer = self.buffer[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Prochain caractère significatif ('' en fin de fichier)"""
+        while True:
+            buffer = self.buffer
+            pos = self.pos
+            length = len(buffer)
+            while pos < length and buffer[pos] in WHITESPACE:
+                pos += 1
+            self.pos = pos
+            if pos < length:
+                return buffer[pos]
+            if not self.fill():
+                return ""
+
+    def expect(self, char: str) -> None:
+        found = self.peek()
+        if found != char:
+            self.error(f"Expecting '{char}'" if found else "Unexpected end of data")
+        self.pos += 1
+
+    def decode_value(self) -> Any:
+        """Décode une valeur JSON complète, en lisant plus de données si elle est coupée"""
+        self.peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                if self.fill():
+                    continue
+                raise
+            if end == len(self.buffer) and self.fill():
+                # Un nombre en fin de morceau peut continuer dans le suivant
+                continue
+            self.pos = end
+            return value
+
+    def error(self, message: str) -> None:
+        raise json.JSONDecodeError(message, self.buffer, self.pos)
+
+
+def iter_json_array(
+    file: TextIO,
+    key: str = "tasks",
+    source: str = "<stream>",
+    chunk_size: int = 64 * 1024,
+    extra: Optional[Dict[str, Any]] = None
+) -> Iterator[Any]:
+    """
+    Parcourt un document {"key": [...], ...} élément par élément
+
+    Seul l'élément courant et un morceau du fichier sont en mémoire. Les autres
+    clés de l'objet racine sont lues puis ignorées, ou rangées dans extra s'il
+    est fourni (complet une fois l'itération terminée). Si la clé est absente,
+    rien n'est renvoyé.
+
+    Raises:
+        ValueError: Si la racine n'est pas un objet ou si la clé n'est pas un tableau
+        json.JSONDecodeError: Si le JSON est invalide ou tronqué
+    """
+    stream = _StreamBuffer(file, chunk_size)
+
+    first = stream.peek()
+    if first != '{':
+        found = JSON_TYPE_NAMES.get(first, "number") if first else "empty document"
+        raise ValueError(f"Invalid JSON structure in '{source}': expected object, got {found}")
+    stream.pos += 1
+
+    if stream.peek() == '}':
+        return
+
+    while True:
+        name = stream.decode_value()
+        if not isinstance(name, str):
+            stream.error("Expecting property name enclosed in double quotes")
+        stream.expect(':')
+
+        if name == key:
+            first = stream.peek()
+            if first != '[':
+                found = JSON_TYPE_NAMES.get(first, "number") if first else "end of data"
+                raise ValueError(f"Invalid tasks format in '{source}': expected array, got {found}")
+            stream.pos += 1
+
+            if stream.peek() == ']':
+                stream.pos += 1
+            else:
+                while True:
+                    yield stream.decode_value()
+                    separator = stream.peek()
+                    stream.pos += 1
+                    if separator == ']':
+                        break
+                    if separator != ',':
+                        stream.pos -= 1
+                        stream.error("Expecting ',' delimiter" if separator else "Unexpected end of data")
+        else:
+            value = stream.decode_value()
+            if extra is not None:
+                extra[name] = value
+
+        separator = stream.peek()
+        stream.pos += 1
+        if separator == '}':
+            return
+        if separator != ',':
+            stream.pos -= 1
+            stream.error("Expecting ',' delimiter" if separator else "Unexpected end of data")
+
+
+def array_item_encoder(
+    compact: bool = False,
+    default: Optional[Callable[[Any], Any]] = None
+) -> Callable[[Any], str]:
+    """
+    Encodeur d'un élément du tableau tel qu'il apparaît dans iter_json_document
+
+    En mode indenté, l'élément est indenté pour sa place dans le tableau
+    (deuxième niveau) ; le texte produit peut être mis en cache et repassé à
+    iter_json_document avec encoded=True. default convertit les valeurs non
+    JSON, comme pour json.dumps.
+    """
+    if compact:
+        return json.JSONEncoder(ensure_ascii=False, separators=(',', ':'), default=default).encode
+
+    encode = json.JSONEncoder(ensure_ascii=False, indent=2, default=default).encode
+    # Un objet sans conteneur imbriqué s'encode indenté avec l'encodeur C : le
+    # séparateur d'éléments porte le retour à la ligne et l'indentation
+    encode_flat = json.JSONEncoder(ensure_ascii=False, separators=(',\n      ', ': '), default=default).encode
+
+    def encode_item(item: Any) -> str:
+        if type(item) is dict and item and not any(isinstance(value, CONTAINERS) for value in item.values()):
+            return '{\n      ' + encode_flat(item)[1:-1] + '\n    }'
+        return encode(item).replace('\n', '\n    ')
+
+    return encode_item
+
+
+def iter_json_document(
+    items: Iterable[Any],
+    key: str = "tasks",
+    trailer: Optional[Callable[[int], Dict[str, Any]]] = None,
+    compact: bool = False,
+    batch_size: int = 1000,
+    encoded: bool = False
+) -> Iterator[str]:
+    """
+    Produit le texte d'un document {"key": [...], ...} morceau par morceau
+
+    Les éléments sont encodés au fil de l'eau et regroupés par batch_size avant
+    d'être renvoyés. En mode indenté, le résultat est identique à
+    json.dump(document, indent=2, ensure_ascii=False).
+
+    Args:
+        items: Éléments du tableau (consommés une seule fois)
+        key: Nom du tableau
+        trailer: Appelé avec le nombre d'éléments écrits, renvoie les clés
+                 suivant le tableau (ex: métadonnées)
+        compact: JSON sans indentation ni espaces
+        batch_size: Nombre d'éléments par morceau renvoyé
+        encoded: Les éléments sont déjà encodés par array_item_encoder(compact)
+    """
+    if compact:
+        encoder = json.JSONEncoder(ensure_ascii=False, separators=(',', ':'))
+        parts = ['{', encoder.encode(key), ':[']
+        first_separator, separator = '', ','
+        key_separator, close_array, close_document = ':', ']', '}'
+    else:
+        encoder = json.JSONEncoder(ensure_ascii=False, indent=2)
+        parts = ['{\n  ', encoder.encode(key), ': [']
+        first_separator, separator = '\n    ', ',\n    '
+        key_separator, close_array, close_document = ': ', '\n  ]', '\n}'
+
+    encode_item = None if encoded else array_item_encoder(compact)
+    count = 0
+    for item in items:
+        parts.append(separator if count else first_separator)
+        parts.append(item if encode_item is None else encode_item(item))
+        count += 1
+        if len(parts) >= 2 * batch_size:
+            yield ''.join(parts)
+            parts = []
+
+    parts.append(close_array if count or compact else ']')
+
+    encode = encoder.encode
+    for name, value in (trailer(count) if trailer else {}).items():
+        encoded_value = encode(value)
+        if not compact:
+            encoded_value = encoded_value.replace('\n', '\n  ')
+        parts.append(',' if compact else ',\n  ')
+        parts.append(encode(name) + key_separator + encoded_value)
+
+    parts.append(close_document)
+    yield ''.join(parts)
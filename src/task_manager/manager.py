@@ -1,8 +1,40 @@
 # src/task_manager/manager.py
 import json
 import os
-from typing import List, Optional, Dict, Any, Union
+from datetime import date, datetime
+from typing import List, Optional, Dict, Any, Union, Iterable, Tuple, Callable
 from .task import Task, Priority, Status
+from .stats import TaskCounts
+from .ids import TaskId, parse_id
+from .storage import TaskStore, create_store
+from .jsonstream import iter_json_array, iter_json_document
+from .fileio import open_for_write, open_for_read, FileCountCache
+from .compression import detect_compression
+from .tracking import ChangeTracker
+from .snapshot import write_snapshot
+from .codec import get_codec
+
+
+def _task_arguments(
+    title: str,
+    description: str = "",
+    priority: Priority = Priority.MEDIUM
+) -> Tuple[Any, Any, Any]:
+    """Mêmes arguments que Task()"""
+    return title, description, priority
+
+
+class _CanonicalRecords:
+    """Task.from_dict qui retient si tous les enregistrements lus étaient canoniques"""
+
+    def __init__(self) -> None:
+        self.canonical = True
+
+    def parse(self, data: Dict[str, Any]) -> Task:
+        task, canonical = Task.parse_dict(data)
+        if not canonical:
+            self.canonical = False
+        return task
 
 
 class TaskManager:
@@ -10,81 +42,269 @@ class TaskManager:
 
     MAX_TASKS_PER_PROJECT = 100
     MAX_JSON_FILES = 150
+    STREAM_BATCH_SIZE = 10_000
+    SAVE_BATCH_SIZE = 1_000
+    DELTA_SUFFIX = ".delta"
+    # Marqueur (mtime, taille) d'un fichier dont tout le contenu est canonique
+    VALIDATED_SUFFIX = ".validated"
+    # Au-delà de cette part de tâches changées, la sauvegarde incrémentale réécrit tout
+    MAX_DELTA_RATIO = 0.25
 
-    def __init__(self, storage_file: str = "tasks.json") -> None:
-        self._tasks: List[Task] = []
+    def __init__(
+        self,
+        storage_file: str = "tasks.json",
+        backend: str = "memory",
+        codec: Optional[str] = None
+    ) -> None:
+        """
+        Args:
+            storage_file: Fichier de sauvegarde JSON
+            backend: Moteur de stockage ('memory' par défaut, 'columnar' avec
+                     NumPy, 'wal' pour journaliser chaque changement dans
+                     storage_file + '.wal', 'sqlite' pour utiliser
+                     storage_file comme base SQLite, 'mmap' pour lire
+                     l'instantané binaire storage_file sans le charger ; avec
+                     ces trois derniers les tâches sont disponibles dès la
+                     création du gestionnaire)
+            codec: Encodeur JSON des sauvegardes (complètes ou en streaming) et
+                   des chargements complets ('orjson', 'ujson', 'json') ; par
+                   défaut le plus rapide installé
+        """
+        self._backend: str = backend
         self._storage_file: str = storage_file
         self._validate_storage_environment()
+        self._changes = ChangeTracker()
+        self._store: TaskStore = create_store(backend, storage_file)
+        self._store.observer = self._changes.task_changed
+        self._codec = get_codec(codec)
+        self._json_files = FileCountCache('.json')
 
     def add_task(
         self, 
         title: str, 
         description: str = "", 
         priority: Priority = Priority.MEDIUM
-    ) -> float:
+    ) -> TaskId:
         task = Task(title, description, priority)
-        self._tasks.append(task)
+        self._store.add(task)
+        self._changes.mark((task.id,))
         return task.id
 
-    def get_task(self, task_id: Union[float, int, str, None]) -> Optional[Task]:
-        if task_id is None:
-            return None
+    def add_tasks(
+        self,
+        tasks: Iterable[Union[Task, str, Dict[str, Any], Tuple[Any, ...]]]
+    ) -> List[TaskId]:
+        """
+        Ajoute plusieurs tâches en un seul appel
         
-        try:
-            target_id = float(task_id)
-        except (ValueError, TypeError):
-            return None
+        Toutes les tâches sont validées avant la moindre insertion : si l'une
+        est invalide, rien n'est ajouté. Les nouvelles tâches sont créées
+        ensemble par Task.create_many, puis l'index est mis à jour en bloc.
         
-        for task in self._tasks:
-            if task.id == target_id:
-                return task
+        Args:
+            tasks: Tâches (Task), titres (str), dicts d'arguments
+                   (title, description, priority) ou tuples (title, description, priority)
+                   
+        Returns:
+            List[TaskId]: Identifiants des tâches ajoutées, dans l'ordre
+        """
+        new_tasks: List[Optional[Task]] = []
+        positions: List[int] = []
+        specs: List[Tuple[Any, Any, Any]] = []
+        for i, item in enumerate(tasks):
+            if isinstance(item, Task):
+                new_tasks.append(item)
+                continue
+            try:
+                specs.append(self._task_args(item))
+            except TypeError as e:
+                raise TypeError(f"Invalid task at index {i}: {str(e)}") from e
+            new_tasks.append(None)
+            positions.append(i)
         
-        return None
+        if specs:
+            titles, descriptions, priorities = zip(*specs)
+            try:
+                created = Task.create_many(titles, descriptions, priorities)
+            except (TypeError, ValueError):
+                # Index de l'élément dans la liste reçue, Task existantes comprises
+                for position, (title, _, priority) in zip(positions, specs):
+                    try:
+                        Task._validate_title(title)
+                        Task._validate_priority(priority)
+                    except (TypeError, ValueError) as e:
+                        raise type(e)(f"Invalid task at index {position}: {str(e)}") from e
+                raise
+            for position, task in zip(positions, created):
+                new_tasks[position] = task
+        
+        self._store.add_many(new_tasks)
+        ids = [task.id for task in new_tasks]
+        self._changes.mark(ids)
+        return ids
+
+    def delete_tasks(self, task_ids: Iterable[Union[float, int, str, None]]) -> int:
+        """
+        Supprime plusieurs tâches en une passe
+        
+        Returns:
+            int: Nombre de tâches effectivement supprimées (les identifiants
+                 invalides ou inconnus sont ignorés)
+        """
+        # Seules les tâches présentes sont suivies comme supprimées
+        ids = self._store.existing(self._normalize_ids(task_ids))
+        deleted = self._store.remove_many(ids)
+        self._changes.forget(ids)
+        return deleted
+
+    def bulk_update(
+        self,
+        task_ids: Iterable[Union[float, int, str, None]],
+        status: Optional[Status] = None,
+        priority: Optional[Priority] = None
+    ) -> int:
+        """
+        Change le statut et/ou la priorité de plusieurs tâches
+        
+        Rien n'est modifié si une des tâches est terminée et qu'une nouvelle
+        priorité est demandée.
+        
+        Returns:
+            int: Nombre de tâches mises à jour
+        """
+        if status is None and priority is None:
+            raise ValueError("Nothing to update: provide a status and/or a priority")
+        
+        if status is not None and not isinstance(status, Status):
+            raise TypeError(f"Status must be a Status enum, got {type(status)}")
+        
+        if priority is not None and not isinstance(priority, Priority):
+            raise TypeError(f"Priority must be a Priority enum, got {type(priority)}")
+        
+        ids = self._store.existing(self._normalize_ids(task_ids))
+        updated = self._store.update_many(ids, status, priority)
+        self._changes.mark(ids)
+        return updated
+
+    def get_task(self, task_id: Union[float, int, str, None]) -> Optional[Task]:
+        target_id = self._normalize_id(task_id)
+        if target_id is None:
+            return None
+        
+        return self._store.get(target_id)
 
     def get_tasks_by_status(self, status: Status) -> List[Task]:
         if not isinstance(status, Status):
             raise TypeError(f"Status must be a Status enum, got {type(status)}")
         
-        return [task for task in self._tasks if task.status == status]
+        return self._store.by_status(status)
 
     def get_tasks_by_priority(self, priority: Priority) -> List[Task]:
         if not isinstance(priority, Priority):
             raise TypeError(f"Priority must be a Priority enum, got {type(priority)}")
         
-        return [task for task in self._tasks if task.priority == priority]
+        return self._store.by_priority(priority)
 
     def delete_task(self, task_id: Union[float, int, str, None]) -> bool:
-        if task_id is None:
+        target_id = self._normalize_id(task_id)
+        if target_id is None:
             return False
         
-        try:
-            target_id = float(task_id)
-        except (ValueError, TypeError):
-            return False
+        removed = self._store.remove(target_id)
+        if removed:
+            self._changes.forget((target_id,))
+        return removed
+
+    def get_tasks_by_date(self, target_date: Union[date, datetime]) -> List[Task]:
+        """Tâches créées ou terminées à la date donnée"""
+        if isinstance(target_date, datetime):
+            target_date = target_date.date()
         
-        for i, task in enumerate(self._tasks):
-            if task.id == target_id:
-                del self._tasks[i]
-                return True
+        if not isinstance(target_date, date):
+            raise TypeError(f"Date must be a date or datetime object, got {type(target_date)}")
         
-        return False
+        return self._store.by_day(target_date)
 
-    def save_to_file(self, filename: Optional[str] = None) -> None:
+    def save_to_file(
+        self,
+        filename: Optional[str] = None,
+        streaming: bool = False,
+        compact: bool = False,
+        atomic: bool = True,
+        incremental: bool = False,
+        compression: Optional[str] = None,
+        compression_level: Optional[int] = None
+    ) -> None:
+        """
+        Sauvegarde les tâches dans un fichier JSON
+        
+        Args:
+            filename: Fichier à écrire (par défaut le fichier de stockage)
+            streaming: Encoder et écrire les tâches par paquets de
+                       SAVE_BATCH_SIZE au lieu de construire tout le document
+                       en mémoire ; le fichier produit est identique
+            compact: JSON sans indentation ni espaces (fichier plus petit)
+            atomic: Écrire dans un fichier temporaire synchronisé puis le
+                    renommer sur la cible : un crash pendant la sauvegarde
+                    laisse l'ancien fichier intact
+            incremental: Si le fichier correspond à la dernière sauvegarde
+                         complète ou au dernier chargement, n'écrire que les
+                         tâches ajoutées, modifiées ou supprimées depuis dans
+                         filename + DELTA_SUFFIX (relu par load_from_file).
+                         Sinon, ou au-delà de MAX_DELTA_RATIO de tâches
+                         changées, tout est réécrit en streaming en
+                         réutilisant le JSON déjà encodé des tâches inchangées
+                         (gardé en mémoire entre deux sauvegardes)
+            compression: 'gzip', 'zstd', 'lz4' ou 'none' ; par défaut déduit
+                         de l'extension (.gz, .zst, .lz4). Le JSON est
+                         compressé au fil de l'écriture : avec streaming, ni
+                         le document ni sa version compressée ne sont
+                         entièrement en mémoire. Le fichier delta reste non compressé
+            compression_level: Niveau de compression (plus bas : plus rapide,
+                               plus haut : fichier plus petit)
+        """
         target_file = filename or self._storage_file
         
+        self._check_not_database(target_file)
         self._validate_json_file_limits()
+        compression = detect_compression(target_file, compression)
+        created = not os.path.exists(target_file)
+        directory_mtime = self._json_files.directory_mtime(target_file)
         
         try:
-            data = {
-                "tasks": [task.to_dict() for task in self._tasks],
-                "metadata": {
-                    "total_tasks": len(self._tasks),
-                    "saved_at": self._get_current_time_iso()
+            if incremental and self._can_save_delta(target_file):
+                self._save_delta(target_file, atomic)
+                self._json_files.record_write(target_file, False, directory_mtime)
+                return
+            
+            saved_at = self._get_current_time_iso()
+            
+            if streaming or incremental:
+                self._save_streaming(
+                    target_file, compact, atomic, saved_at, cached=incremental,
+                    compression=compression, compression_level=compression_level
+                )
+            else:
+                data = {
+                    "tasks": [task.to_record() for task in self._store],
+                    "metadata": {
+                        "total_tasks": len(self._store),
+                        "saved_at": saved_at
+                    }
                 }
-            }
+                
+                with open_for_write(
+                    target_file, 'wb', atomic=atomic, compression=compression, level=compression_level
+                ) as file:
+                    file.write(self._codec.dumps(data, indent=not compact))
             
-            with open(target_file, 'w', encoding='utf-8') as file:
-                json.dump(data, file, indent=2, ensure_ascii=False)
+            # Le delta éventuel visait l'ancien fichier : il n'a plus lieu d'être
+            delta_file = target_file + self.DELTA_SUFFIX
+            if os.path.exists(delta_file):
+                os.remove(delta_file)
+            self._changes.reset(target_file, saved_at, keep_encoded=True)
+            self._mark_validated(target_file)
+            self._json_files.record_write(target_file, created, directory_mtime)
                 
         except PermissionError as e:
             raise PermissionError(f"Cannot write to file '{target_file}': {str(e)}. Check file permissions.")
@@ -93,33 +313,161 @@ class TaskManager:
         except Exception as e:
             raise RuntimeError(f"Unexpected error while saving tasks: {str(e)}")
 
-    def load_from_file(self, filename: Optional[str] = None) -> None:
+    def _save_streaming(
+        self,
+        target_file: str,
+        compact: bool,
+        atomic: bool,
+        saved_at: str,
+        cached: bool = False,
+        compression: Optional[str] = None,
+        compression_level: Optional[int] = None
+    ) -> None:
+        """Écrit le document morceau par morceau, les métadonnées en dernier ; les tâches passent par le codec"""
+        if cached:
+            items = self._iter_encoded_tasks(compact)
+        else:
+            items = map(self._codec.item_encoder(compact), (task.to_record() for task in self._store))
+        
+        chunks = iter_json_document(
+            items,
+            key="tasks",
+            trailer=lambda count: {
+                "metadata": {
+                    "total_tasks": count,
+                    "saved_at": saved_at
+                }
+            },
+            compact=compact,
+            batch_size=self.SAVE_BATCH_SIZE,
+            encoded=True
+        )
+        
+        with open_for_write(
+            target_file, 'w', atomic=atomic, compression=compression, level=compression_level, encoding='utf-8'
+        ) as file:
+            for chunk in chunks:
+                file.write(chunk)
+
+    def _iter_encoded_tasks(self, compact: bool) -> Iterable[str]:
+        """Texte JSON de chaque tâche, encodé seulement si elle a changé depuis le dernier passage"""
+        cache = self._changes.encoded_cache(compact)
+        encode = self._codec.item_encoder(compact)
+        for task in self._store:
+            encoded = cache.get(task.id)
+            if encoded is None:
+                encoded = cache[task.id] = encode(task.to_record())
+            yield encoded
+
+    def _can_save_delta(self, target_file: str) -> bool:
+        changes = self._changes
+        return (
+            changes.is_baseline(target_file) and
+            changes.baseline_saved_at is not None and
+            os.path.exists(target_file) and
+            len(changes) <= self.MAX_DELTA_RATIO * len(self._store)
+        )
+
+    def _save_delta(self, target_file: str, atomic: bool) -> None:
+        """Écrit les changements depuis la référence (cumulés) dans le fichier delta"""
+        changes = self._changes
+        changed = (self._store.get(task_id) for task_id in changes.changed)
+        data = {
+            "base_saved_at": changes.baseline_saved_at,
+            "tasks": [task.to_record() for task in changed if task is not None],
+            "deleted": list(changes.deleted),
+            "metadata": {
+                "total_tasks": len(self._store),
+                "saved_at": self._get_current_time_iso()
+            }
+        }
+        
+        with open_for_write(target_file + self.DELTA_SUFFIX, 'wb', atomic=atomic) as file:
+            file.write(self._codec.dumps(data, indent=False))
+
+    def save_snapshot(self, filename: Optional[str] = None) -> None:
+        """
+        Sauvegarde les tâches au format binaire à largeur fixe
+        
+        Le fichier s'ouvre ensuite sans chargement avec
+        TaskManager(filename, backend="mmap"). Pour ce moteur, sauvegarder
+        dans son propre fichier intègre les changements et le projette à nouveau.
+        
+        Raises:
+            ValueError: Si les identifiants mélangent entiers et flottants
+        """
         target_file = filename or self._storage_file
         
+        if self._backend == "mmap" and self._store.database_file == os.path.abspath(target_file):
+            self._store.checkpoint()
+            return
+        
+        self._check_not_database(target_file)
+        tasks = list(self._store)
+        with open_for_write(target_file, 'wb') as file:
+            write_snapshot(tasks, file)
+
+    def load_from_file(
+        self,
+        filename: Optional[str] = None,
+        streaming: bool = False,
+        trusted: Optional[bool] = None,
+        compression: Optional[str] = None
+    ) -> None:
+        """
+        Charge les tâches depuis un fichier JSON (remplace les tâches actuelles)
+        
+        Args:
+            filename: Fichier à lire (par défaut le fichier de stockage)
+            streaming: Lire le tableau "tasks" élément par élément au lieu de
+                       charger tout le document : la mémoire de pointe se limite
+                       à une tâche en cours de décodage plus le stockage final
+            trusted: Recréer les tâches avec Task.from_trusted_dict, sans
+                     vérifier chaque champ. Par défaut, seulement si le
+                     marqueur filename + VALIDATED_SUFFIX correspond encore
+                     au fichier (même mtime, même taille). Le marqueur est
+                     écrit par save_to_file, ou par un chargement vérifié dont
+                     tous les enregistrements étaient déjà canoniques : un
+                     fichier d'ancien format (identifiants en texte, valeurs
+                     en majuscules), que seul Task.from_dict normalise, est
+                     donc vérifié à chaque chargement. Le marqueur sert aussi
+                     aux autres gestionnaires et processus
+            compression: 'gzip', 'zstd', 'lz4' ou 'none' ; par défaut déduit
+                         de l'extension. Décompressé au fil de la lecture
+        
+        Un fichier delta (sauvegarde incrémentale) écrit pour ce fichier est
+        appliqué par-dessus ; il est ignoré s'il vise une version antérieure.
+        """
+        target_file = filename or self._storage_file
+        
+        self._check_not_database(target_file)
         if not os.path.exists(target_file):
-            self._tasks = []
+            self.clear_all_tasks()
             return
         
+        compression = detect_compression(target_file, compression)
+        signature = self._file_signature(target_file)
+        if trusted is None:
+            trusted = self._is_validated(target_file, signature)
+        records = None if trusted else _CanonicalRecords()
+        parse = Task.from_trusted_dict if records is None else records.parse
+        
         try:
-            with open(target_file, 'r', encoding='utf-8') as file:
-                data = json.load(file)
-            
-            if not isinstance(data, dict):
-                raise ValueError(f"Invalid JSON structure in '{target_file}': expected object, got {type(data)}")
-            
-            tasks_data = data.get("tasks", [])
-            if not isinstance(tasks_data, list):
-                raise ValueError(f"Invalid tasks format in '{target_file}': expected array, got {type(tasks_data)}")
-            
-            loaded_tasks = []
-            for i, task_data in enumerate(tasks_data):
-                try:
-                    task = Task.from_dict(task_data)
-                    loaded_tasks.append(task)
-                except Exception as e:
-                    raise ValueError(f"Invalid task data at index {i} in '{target_file}': {str(e)}")
+            if streaming:
+                saved_at = self._load_streaming(target_file, parse, compression)
+            else:
+                saved_at = self._load_document(target_file, parse, compression)
             
-            self._tasks = loaded_tasks
+            delta = self._read_delta(target_file)
+            changed: List[TaskId] = []
+            deleted: List[TaskId] = []
+            if delta is not None and saved_at is not None and delta["base_saved_at"] == saved_at:
+                changed, deleted = self._apply_delta(delta["tasks"], delta["deleted"])
+            self._changes.reset(target_file, saved_at, changed, deleted)
+            if records is not None and records.canonical and signature is not None:
+                self._mark_validated(target_file, signature)
+            elif records is not None:
+                self._unmark_validated(target_file)
             
         except json.JSONDecodeError as e:
             raise json.JSONDecodeError(
@@ -132,75 +480,221 @@ class TaskManager:
         except Exception as e:
             raise RuntimeError(f"Unexpected error while loading tasks: {str(e)}")
 
-    def get_statistics(self) -> Dict[str, Any]:
-        total_tasks = len(self._tasks)
-        
-        if total_tasks == 0:
-            return {
-                "total_tasks": 0,
-                "completed_tasks": 0,
-                "pending_tasks": 0,
-                "in_progress_tasks": 0,
-                "cancelled_tasks": 0,
-                "completion_rate": 0.0,
-                "priority_distribution": {
-                    "low": 0,
-                    "medium": 0,
-                    "high": 0,
-                    "urgent": 0
-                },
-                "status_distribution": {
-                    "todo": 0,
-                    "in_progress": 0,
-                    "done": 0,
-                    "cancelled": 0
-                },
-                "message": "No tasks found. Create tasks to see statistics.",
-                "generated_at": self._get_current_time_iso()
-            }
+    def _load_document(
+        self,
+        target_file: str,
+        parse: Callable[[Dict[str, Any]], Task],
+        compression: Optional[str] = None
+    ) -> Optional[str]:
+        """Chargement complet du document ; renvoie la date de sauvegarde des métadonnées"""
+        with open_for_read(target_file, 'rb', compression=compression) as file:
+            data = self._codec.loads(file.read())
         
-        completed_tasks = len([t for t in self._tasks if t.status == Status.DONE])
-        pending_tasks = len([t for t in self._tasks if t.status == Status.TODO])
-        in_progress_tasks = len([t for t in self._tasks if t.status == Status.IN_PROGRESS])
-        cancelled_tasks = len([t for t in self._tasks if t.status == Status.CANCELLED])
+        if not isinstance(data, dict):
+            raise ValueError(f"Invalid JSON structure in '{target_file}': expected object, got {type(data)}")
         
-        completion_rate = (completed_tasks / total_tasks) * 100.0
+        tasks_data = data.get("tasks", [])
+        if not isinstance(tasks_data, list):
+            raise ValueError(f"Invalid tasks format in '{target_file}': expected array, got {type(tasks_data)}")
         
-        priority_stats = {
-            "low": len([t for t in self._tasks if t.priority == Priority.LOW]),
-            "medium": len([t for t in self._tasks if t.priority == Priority.MEDIUM]),
-            "high": len([t for t in self._tasks if t.priority == Priority.HIGH]),
-            "urgent": len([t for t in self._tasks if t.priority == Priority.URGENT])
-        }
+        loaded_tasks = []
+        for i, task_data in enumerate(tasks_data):
+            try:
+                task = parse(task_data)
+                loaded_tasks.append(task)
+            except Exception as e:
+                raise ValueError(f"Invalid task data at index {i} in '{target_file}': {str(e)}")
         
-        status_stats = {
-            "todo": pending_tasks,
-            "in_progress": in_progress_tasks,
-            "done": completed_tasks,
-            "cancelled": cancelled_tasks
-        }
+        self._store.replace_all(loaded_tasks)
+        self._changes.invalidate()
+        return self._saved_at(data)
+
+    def _load_streaming(
+        self,
+        target_file: str,
+        parse: Callable[[Dict[str, Any]], Task],
+        compression: Optional[str] = None
+    ) -> Optional[str]:
+        """Construit un nouveau stockage au fil de la lecture, puis remplace l'ancien"""
+        # Un moteur persistant garde ses fichiers : il est rempli à la fin
+        store = create_store("memory" if self._store.persistent else self._backend)
+        batch: List[Task] = []
+        others: Dict[str, Any] = {}
+        
+        with open_for_read(target_file, 'r', compression=compression, encoding='utf-8') as file:
+            for i, task_data in enumerate(iter_json_array(file, "tasks", source=target_file, extra=others)):
+                try:
+                    batch.append(parse(task_data))
+                except Exception as e:
+                    raise ValueError(f"Invalid task data at index {i} in '{target_file}': {str(e)}")
+                
+                if len(batch) >= self.STREAM_BATCH_SIZE:
+                    store.add_many(batch)
+                    batch = []
+        
+        store.add_many(batch)
+        if self._store.persistent:
+            self._store.replace_all(list(store))
+        else:
+            self._store.clear()
+            store.observer = self._changes.task_changed
+            self._store = store
+        return self._saved_at(others)
+
+    @staticmethod
+    def _file_signature(target_file: str) -> Optional[Tuple[int, int]]:
+        """(mtime, taille) du fichier, None s'il est illisible"""
+        try:
+            stat = os.stat(target_file)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def _mark_validated(self, target_file: str, signature: Optional[Tuple[int, int]] = None) -> None:
+        """
+        Écrit le marqueur de validation du fichier
+
+        signature est (mtime, taille) relevé avant la lecture : si le fichier
+        a changé depuis, rien n'est marqué. Un marqueur incomplet (crash
+        pendant l'écriture) n'est pas du JSON valide et ne vaut rien.
+        """
+        marker = target_file + self.VALIDATED_SUFFIX
+        current = self._file_signature(target_file)
+        if current is None or (signature is not None and signature != current):
+            return
+        try:
+            with open(marker, 'w', encoding='utf-8') as file:
+                json.dump(list(current), file)
+        except OSError:
+            # Répertoire en lecture seule : le prochain chargement sera vérifié
+            self._unmark_validated(target_file)
+
+    def _unmark_validated(self, target_file: str) -> None:
+        try:
+            os.remove(target_file + self.VALIDATED_SUFFIX)
+        except OSError:
+            pass
+
+    def _is_validated(self, target_file: str, signature: Optional[Tuple[int, int]]) -> bool:
+        if signature is None:
+            return False
+        try:
+            with open(target_file + self.VALIDATED_SUFFIX, 'r', encoding='utf-8') as file:
+                return tuple(json.load(file)) == signature
+        except (OSError, ValueError, TypeError):
+            return False
+
+    @staticmethod
+    def _saved_at(data: Dict[str, Any]) -> Optional[str]:
+        metadata = data.get("metadata")
+        return metadata.get("saved_at") if isinstance(metadata, dict) else None
+
+    def _read_delta(self, target_file: str) -> Optional[Dict[str, Any]]:
+        """Lit et valide le fichier delta associé, None s'il n'existe pas"""
+        delta_file = target_file + self.DELTA_SUFFIX
+        if not os.path.exists(delta_file):
+            return None
+        
+        with open(delta_file, 'rb') as file:
+            data = self._codec.loads(file.read())
+        
+        if not isinstance(data, dict):
+            raise ValueError(f"Invalid JSON structure in '{delta_file}': expected object, got {type(data)}")
+        
+        tasks_data = data.get("tasks", [])
+        deleted = data.get("deleted", [])
+        if not isinstance(tasks_data, list) or not isinstance(deleted, list):
+            raise ValueError(f"Invalid delta format in '{delta_file}': expected arrays of tasks and deleted ids")
+        
+        tasks = []
+        for i, task_data in enumerate(tasks_data):
+            try:
+                tasks.append(Task.from_dict(task_data))
+            except Exception as e:
+                raise ValueError(f"Invalid task data at index {i} in '{delta_file}': {str(e)}")
         
         return {
-            "total_tasks": total_tasks,
-            "completed_tasks": completed_tasks,
-            "pending_tasks": pending_tasks,
-            "in_progress_tasks": in_progress_tasks,
-            "cancelled_tasks": cancelled_tasks,
-            "completion_rate": round(completion_rate, 2),
-            "priority_distribution": priority_stats,
-            "status_distribution": status_stats,
-            "message": f"{completion_rate:.1f}% completion rate",
-            "generated_at": self._get_current_time_iso()
+            "base_saved_at": data.get("base_saved_at"),
+            "tasks": tasks,
+            "deleted": [parse_id(task_id) for task_id in deleted]
         }
 
+    def _apply_delta(self, tasks: List[Task], deleted: List[TaskId]) -> Tuple[List[TaskId], List[TaskId]]:
+        """
+        Applique un delta aux tâches chargées : les tâches existantes sont
+        modifiées sur place pour garder leur position, les nouvelles ajoutées à la fin
+        """
+        self._store.remove_many(deleted)
+        
+        new_tasks = []
+        for task in tasks:
+            current = self._store.get(task.id)
+            if current is None:
+                new_tasks.append(task)
+                continue
+            current.title = task.title
+            current.description = task.description
+            current.priority = task.priority
+            current.status = task.status
+            current.created_at = task.created_at
+            current.completed_at = task.completed_at
+            current.project_id = task.project_id
+        self._store.add_many(new_tasks)
+        
+        return [task.id for task in tasks], deleted
+
+    def get_statistics(self, recompute: bool = False) -> Dict[str, Any]:
+        """
+        Statistiques des tâches en O(1)
+        
+        Les compteurs viennent du moteur de stockage : taille des index par
+        statut et par priorité en mémoire, comptages vectorisés en colonne.
+        
+        Args:
+            recompute: Recompter toutes les tâches en une passe et vérifier les compteurs
+            
+        Returns:
+            Dict[str, Any]: Statistiques des tâches
+        """
+        counts = self._store.counts()
+        
+        if recompute:
+            recounted = self._store.recount()
+            if recounted != counts:
+                raise RuntimeError(f"Statistics counters out of sync: {counts} != {recounted}")
+        
+        statistics = counts.to_statistics()
+        if counts.total == 0:
+            statistics["message"] = "No tasks found. Create tasks to see statistics."
+        else:
+            statistics["message"] = f"{counts.completion_rate:.1f}% completion rate"
+        return statistics
+
+    def checkpoint(self) -> None:
+        """
+        Compacte le journal du moteur 'wal' dans son instantané
+        
+        Sans effet pour les moteurs en mémoire.
+        """
+        self._store.checkpoint()
+
+    def close(self) -> None:
+        """Ferme les fichiers ouverts par le moteur de stockage"""
+        self._store.close()
+
+    def get_counts(self, day: Optional[date] = None) -> TaskCounts:
+        """Compteurs bruts du moteur de stockage, éventuellement limités à un jour"""
+        return self._store.counts(day)
+
     def get_all_tasks(self) -> List[Task]:
-        return self._tasks.copy()
+        return list(self._store)
 
     def clear_all_tasks(self) -> None:
-        self._tasks.clear()
+        self._store.clear()
+        self._changes.invalidate()
 
     def get_task_count(self) -> int:
-        return len(self._tasks)
+        return len(self._store)
 
     def _validate_storage_environment(self) -> None:
         storage_dir = os.path.dirname(self._storage_file) or "."
@@ -211,18 +705,23 @@ class TaskManager:
             except OSError as e:
                 raise OSError(f"Cannot create storage directory '{storage_dir}': {str(e)}")
 
+    def _check_not_database(self, target_file: str) -> None:
+        if self._store.database_file == os.path.abspath(target_file):
+            raise ValueError(
+                f"'{target_file}' is the database of the '{self._backend}' backend: "
+                f"tasks are already persisted there, use another file for JSON"
+            )
+
     def _validate_json_file_limits(self) -> None:
         storage_dir = os.path.dirname(self._storage_file) or "."
         
         try:
-            existing_json_files = [
-                f for f in os.listdir(storage_dir) 
-                if f.endswith('.json')
-            ]
+            # Compte mis en cache, recompté seulement si le répertoire a changé
+            json_file_count = self._json_files.count(storage_dir)
             
-            if len(existing_json_files) >= self.MAX_JSON_FILES:
+            if json_file_count >= self.MAX_JSON_FILES:
                 raise ValueError(
-                    f"Maximum number of JSON files exceeded: {len(existing_json_files)}. "
+                    f"Maximum number of JSON files exceeded: {json_file_count}. "
                     f"Maximum allowed: {self.MAX_JSON_FILES}. "
                     f"Please clean up old files before saving."
                 )
@@ -230,15 +729,41 @@ class TaskManager:
         except OSError:
             pass
 
+    @staticmethod
+    def _task_args(item: Union[str, Dict[str, Any], Tuple[Any, ...]]) -> Tuple[Any, Any, Any]:
+        """(titre, description, priorité) d'un élément de add_tasks, comme les arguments de Task()"""
+        if isinstance(item, str):
+            return item, "", Priority.MEDIUM
+        if isinstance(item, dict):
+            return _task_arguments(**item)
+        if isinstance(item, tuple):
+            return _task_arguments(*item)
+        raise TypeError(f"Task must be a Task, str, dict or tuple, got {type(item)}")
+
+    def _normalize_ids(self, task_ids: Iterable[Union[float, int, str, None]]) -> List[TaskId]:
+        """Identifiants valides uniquement, sans doublons"""
+        normalized = (self._normalize_id(task_id) for task_id in task_ids)
+        return list(dict.fromkeys(task_id for task_id in normalized if task_id is not None))
+
+    @staticmethod
+    def _normalize_id(task_id: Union[float, int, str, None]) -> Optional[TaskId]:
+        """Convertit un identifiant en clé de l'index, None si invalide"""
+        if task_id is None:
+            return None
+        
+        try:
+            return parse_id(task_id)
+        except (ValueError, TypeError):
+            return None
+
     def _get_current_time_iso(self) -> str:
-        from datetime import datetime
         return datetime.now().isoformat()
 
     def __len__(self) -> int:
-        return len(self._tasks)
+        return len(self._store)
 
     def __iter__(self):
-        return iter(self._tasks)
+        return iter(self._store)
 
     def export_tasks(self, filename: str, format_type: str = 'json', 
                      include_statistics: bool = True) -> bool:
@@ -247,7 +772,7 @@ class TaskManager:
         
         Args:
             filename: Nom du fichier de sortie
-            format_type: Format d'export ('json', 'xml', 'xlsx', 'excel')
+            format_type: Format d'export ('json', 'xml', 'xlsx', 'excel', 'parquet', 'arrow')
             include_statistics: Inclure les statistiques dans l'export
             
         Returns:
@@ -257,7 +782,7 @@ class TaskManager:
         
         export_service = ExportService()
         return export_service.export_tasks(
-            self._tasks, 
+            self.get_all_tasks(), 
             filename, 
             format_type, 
             include_statistics
@@ -270,4 +795,4 @@ class TaskManager:
         return export_service.get_supported_formats()
 
     def __repr__(self) -> str:
-        return f"TaskManager(tasks={len(self._tasks)}, storage='{self._storage_file}')"
\ No newline at end of file
+        return f"TaskManager(tasks={len(self._store)}, storage='{self._storage_file}')"
\ No newline at end of file
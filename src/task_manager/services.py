@@ -1,20 +1,42 @@
 import smtplib
 import csv
+import io
+import multiprocessing
+import os
 import re
-import json
+import shutil
+import tempfile
 import xml.etree.ElementTree as ET
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
-from typing import List, Dict, Any, Optional
-from .task import Task, Status, Priority
+from functools import lru_cache
+from operator import attrgetter
+from typing import List, Dict, Any, Optional, Tuple, Union
+from .task import Task, Status, Priority, from_epoch_us
+from .stats import count_tasks
+from .manager import TaskManager
+from .codec import get_codec
+from .compression import detect_compression, strip_compression_suffix, SUFFIXES as COMPRESSION_SUFFIXES
+from .fileio import open_for_write
 
 # Import conditionnel pour Excel
 try:
     import openpyxl
+    from openpyxl.cell import WriteOnlyCell
     from openpyxl.styles import Font, PatternFill, Alignment
+    from openpyxl.utils import get_column_letter
     OPENPYXL_AVAILABLE = True
 except ImportError:
     OPENPYXL_AVAILABLE = False
 
+# Import conditionnel pour Parquet et Arrow
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
 
 class EmailService:
     """Service d'envoi d'emails (à mocker dans les tests)"""
@@ -109,12 +131,24 @@ class EmailService:
 class ReportService:
     """Service de génération de rapports"""
 
+    CSV_FIELDNAMES = [
+        'id', 'title', 'description', 'priority', 'status',
+        'created_at', 'completed_at', 'project_id'
+    ]
+    # Mode haut débit : tampon d'écriture et lignes par appel à writerows
+    CSV_BUFFER_SIZE = 1024 * 1024
+    CSV_BATCH_SIZE = 10_000
+
     def generate_daily_report(
         self, 
-        tasks: List[Task], 
+        tasks: Union[List[Task], TaskManager], 
         date: Optional[datetime] = None
     ) -> Dict[str, Any]:
-        if not isinstance(tasks, list):
+        """
+        Rapport journalier ; avec un TaskManager, les comptages sont délégués
+        à son moteur de stockage (vectorisés en stockage colonne)
+        """
+        if not isinstance(tasks, (list, TaskManager)):
             raise TypeError(f"Tasks must be a list, got {type(tasks)}")
         
         if len(tasks) == 0:
@@ -125,39 +159,46 @@ class ReportService:
         if not isinstance(report_date, datetime):
             raise TypeError(f"Date must be a datetime object, got {type(report_date)}")
         
-        tasks_for_date = self._filter_tasks_by_date(tasks, report_date)
-        
-        completed_today = len([t for t in tasks_for_date if t.status == Status.DONE])
-        created_today = len([t for t in tasks_for_date if t.created_at.date() == report_date.date()])
-        
-        priority_breakdown = {
-            "urgent": len([t for t in tasks_for_date if t.priority == Priority.URGENT]),
-            "high": len([t for t in tasks_for_date if t.priority == Priority.HIGH]),
-            "medium": len([t for t in tasks_for_date if t.priority == Priority.MEDIUM]),
-            "low": len([t for t in tasks_for_date if t.priority == Priority.LOW])
-        }
-        
-        status_breakdown = {
-            "todo": len([t for t in tasks_for_date if t.status == Status.TODO]),
-            "in_progress": len([t for t in tasks_for_date if t.status == Status.IN_PROGRESS]),
-            "done": len([t for t in tasks_for_date if t.status == Status.DONE]),
-            "cancelled": len([t for t in tasks_for_date if t.status == Status.CANCELLED])
-        }
+        if isinstance(tasks, TaskManager):
+            counts = tasks.get_counts(day=report_date.date())
+        else:
+            counts = count_tasks(tasks, day=report_date.date())
+        completed_today = counts.completed
+        created_today = counts.created_on_day
         
         return {
             "report_date": report_date.isoformat(),
             "total_tasks": len(tasks),
-            "tasks_for_date": len(tasks_for_date),
+            "tasks_for_date": counts.total,
             "completed_today": completed_today,
             "created_today": created_today,
-            "completion_rate_today": (completed_today / len(tasks_for_date) * 100) if tasks_for_date else 0,
-            "priority_breakdown": priority_breakdown,
-            "status_breakdown": status_breakdown,
+            "completion_rate_today": counts.completion_rate,
+            "priority_breakdown": {
+                "urgent": counts.priority_counts[Priority.URGENT],
+                "high": counts.priority_counts[Priority.HIGH],
+                "medium": counts.priority_counts[Priority.MEDIUM],
+                "low": counts.priority_counts[Priority.LOW]
+            },
+            "status_breakdown": counts.status_distribution(),
             "generated_at": datetime.now().isoformat(),
             "summary": f"Daily report for {report_date.strftime('%Y-%m-%d')}: {completed_today} tasks completed, {created_today} tasks created"
         }
 
-    def export_tasks_csv(self, tasks: List[Task], filename: str) -> bool:
+    def export_tasks_csv(self, tasks: List[Task], filename: str, high_throughput: bool = False,
+                         workers: int = 1) -> bool:
+        """
+        Export CSV des tâches
+        
+        Args:
+            high_throughput: csv.writer sur des tuples plutôt que DictWriter,
+                             tampon de CSV_BUFFER_SIZE et writerows par paquets
+                             de CSV_BATCH_SIZE lignes (même fichier)
+            workers: Avec plus d'un processus, chacun écrit une tranche des
+                     tâches dans un fichier temporaire ; les tranches sont
+                     ensuite concaténées (implique high_throughput). Les
+                     processus sont créés par fork et lisent les tâches
+                     héritées : sans fork (Windows), écriture en un processus
+        """
         if not isinstance(tasks, list):
             raise TypeError(f"Tasks must be a list, got {type(tasks)}")
         
@@ -176,11 +217,17 @@ class ReportService:
             filename += '.csv'
         
         try:
+            if workers > 1 and _FORK_AVAILABLE:
+                return self._export_csv_sharded(tasks, filename, workers)
+            if high_throughput or workers > 1:
+                with open(filename, 'w', newline='', encoding='utf-8', buffering=self.CSV_BUFFER_SIZE) as csvfile:
+                    writer = csv.writer(csvfile)
+                    writer.writerow(self.CSV_FIELDNAMES)
+                    _write_csv_rows(writer, tasks, self.CSV_BATCH_SIZE)
+                return True
+            
             with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
-                fieldnames = [
-                    'id', 'title', 'description', 'priority', 'status',
-                    'created_at', 'completed_at', 'project_id'
-                ]
+                fieldnames = self.CSV_FIELDNAMES
                 
                 writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
                 writer.writeheader()
@@ -207,7 +254,45 @@ class ReportService:
         except Exception as e:
             raise RuntimeError(f"Unexpected error while exporting CSV: {str(e)}")
 
-    def _filter_tasks_by_date(self, tasks: List[Task], target_date: datetime) -> List[Task]:
+    def _export_csv_sharded(self, tasks: List[Task], filename: str, workers: int) -> bool:
+        """
+        Tranches écrites en parallèle puis concaténées après l'en-tête
+
+        Les processus, créés par fork, héritent de la liste des tâches et ne
+        reçoivent que les bornes de leur tranche : rien n'est copié ni
+        sérialisé dans le processus principal. Les tranches sont écrites dans
+        un répertoire temporaire propre à l'export (à côté de la cible) et le
+        fichier final est écrit de façon atomique.
+        """
+        global _SHARD_TASKS
+        size = -(-len(tasks) // workers)
+        bounds = [(start, min(start + size, len(tasks))) for start in range(0, len(tasks), size)]
+        header = io.StringIO()
+        csv.writer(header).writerow(self.CSV_FIELDNAMES)
+        directory = os.path.dirname(os.path.abspath(filename))
+
+        _SHARD_TASKS = tasks
+        try:
+            with tempfile.TemporaryDirectory(prefix=f".{os.path.basename(filename)}.", dir=directory) as temp_dir:
+                paths = [os.path.join(temp_dir, f"part{index}.csv") for index in range(len(bounds))]
+                with ProcessPoolExecutor(max_workers=len(bounds), mp_context=multiprocessing.get_context('fork')) as pool:
+                    for future in [pool.submit(_write_csv_shard, start, stop, path,
+                                               self.CSV_BATCH_SIZE, self.CSV_BUFFER_SIZE)
+                                   for (start, stop), path in zip(bounds, paths)]:
+                        future.result()
+                with open_for_write(filename, 'wb') as csvfile:
+                    csvfile.write(header.getvalue().encode('utf-8'))
+                    for path in paths:
+                        with open(path, 'rb') as shard_file:
+                            shutil.copyfileobj(shard_file, csvfile, self.CSV_BUFFER_SIZE)
+            return True
+        finally:
+            _SHARD_TASKS = []
+
+    def _filter_tasks_by_date(self, tasks: Union[List[Task], TaskManager], target_date: datetime) -> List[Task]:
+        if isinstance(tasks, TaskManager):
+            return tasks.get_tasks_by_date(target_date)
+        
         target_date_only = target_date.date()
         return [
             task for task in tasks
@@ -232,24 +317,97 @@ class ReportService:
         }
 
 
+# Champs d'une tâche lus en un appel, dans l'ordre de Task._from_fields ;
+# les tuples obtenus passent aussi d'un processus à l'autre (export_many)
+_TASK_FIELDS = attrgetter(
+    'id', '_title', '_description', '_priority', '_status', '_created_us', '_completed_us', '_project_id'
+)
+_ENUM_VALUES = {member: member.value for enum in (Priority, Status) for member in enum}
+
+
+@lru_cache(maxsize=4096)
+def _iso_seconds(seconds: int) -> str:
+    return from_epoch_us(seconds * 1_000_000).isoformat()
+
+
+def _iso_us(value: int) -> str:
+    """Même texte que from_epoch_us(value).isoformat() ; les tâches créées ensemble partagent la partie en secondes"""
+    seconds, microseconds = divmod(value, 1_000_000)
+    if microseconds:
+        return f"{_iso_seconds(seconds)}.{microseconds:06d}"
+    return _iso_seconds(seconds)
+
+
+def _csv_row(fields: Tuple[Any, ...]) -> Tuple[Any, ...]:
+    """Ligne CSV identique à celle de DictWriter pour les champs d'une tâche"""
+    task_id, title, description, priority, status, created_us, completed_us, project_id = fields
+    return (
+        task_id, title, description, _ENUM_VALUES[priority], _ENUM_VALUES[status],
+        _iso_us(created_us),
+        _iso_us(completed_us) if completed_us is not None else '',
+        project_id or ''
+    )
+
+
+def _write_csv_rows(writer: Any, tasks: List[Task], batch_size: int) -> None:
+    for start in range(0, len(tasks), batch_size):
+        writer.writerows([_csv_row(_TASK_FIELDS(task)) for task in tasks[start:start + batch_size]])
+
+
+# Export CSV en tranches : tâches lues par les processus de travail, hérités par fork
+_FORK_AVAILABLE = 'fork' in multiprocessing.get_all_start_methods()
+_SHARD_TASKS: List[Task] = []
+
+
+def _write_csv_shard(start: int, stop: int, path: str, batch_size: int, buffer_size: int) -> None:
+    """Tranche CSV [start, stop) sans en-tête, écrite dans un processus de travail"""
+    with open(path, 'w', newline='', encoding='utf-8', buffering=buffer_size) as csvfile:
+        _write_csv_rows(csv.writer(csvfile), _SHARD_TASKS[start:stop], batch_size)
+
+
 class ExportService:
     """Service d'export vers différents formats (JSON, XML, Excel)"""
     
-    SUPPORTED_FORMATS = ['json', 'xml', 'xlsx', 'excel']
+    SUPPORTED_FORMATS = ['json', 'xml', 'xlsx', 'excel', 'parquet', 'arrow']
+    # Formats écrits dans un processus séparé par export_many
+    PROCESS_POOL_FORMATS = ('xml', 'xlsx')
+    # Tâches sérialisées entre deux écritures de l'export XML en streaming
+    XML_BATCH_SIZE = 1000
+    EXCEL_HEADERS = ("ID", "Title", "Description", "Priority", "Status", "Created At", "Completed At", "Project ID")
+    EXCEL_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+    # Formats dont le contenu est déjà compressé : pas de compression du fichier entier
+    SELF_COMPRESSED_FORMATS = ('xlsx', 'parquet', 'arrow')
+    # Parquet et Arrow : tâches par groupe de lignes (record batch) et compression des colonnes
+    COLUMNAR_BATCH_SIZE = 65_536
+    COLUMNAR_COMPRESSION = 'zstd'
     
-    def __init__(self):
+    def __init__(self, codec: Optional[str] = None):
+        """
+        Args:
+            codec: Encodeur de l'export JSON ('orjson', 'ujson', 'json') ;
+                   par défaut le plus rapide installé
+        """
         self.export_history: List[Dict[str, Any]] = []
+        self._codec = get_codec(codec)
     
     def export_tasks(self, tasks: List[Task], filename: str, format_type: str = 'json', 
-                     include_statistics: bool = True) -> bool:
+                     include_statistics: bool = True, compression: Optional[str] = None,
+                     compression_level: Optional[int] = None, streaming: bool = False) -> bool:
         """
         Export des tâches vers différents formats
         
         Args:
             tasks: Liste des tâches à exporter
             filename: Nom du fichier de sortie
-            format_type: Format d'export ('json', 'xml', 'xlsx', 'excel')
+            format_type: Format d'export ('json', 'xml', 'xlsx', 'excel', 'parquet', 'arrow')
             include_statistics: Inclure les statistiques dans l'export
+            compression: 'gzip', 'zstd', 'lz4' ou 'none' pour JSON et XML ;
+                         par défaut déduit de l'extension (ex: tasks.json.gz).
+                         L'extension est ajoutée si elle manque
+            compression_level: Niveau de compression
+            streaming: XML écrit tâche par tâche au lieu de construire tout
+                       l'arbre en mémoire (même contenu) ; Excel écrit en mode
+                       write_only d'openpyxl, ligne par ligne
             
         Returns:
             bool: True si l'export a réussi
@@ -257,6 +415,103 @@ class ExportService:
         if not isinstance(tasks, list):
             raise TypeError(f"Tasks must be a list, got {type(tasks)}")
         
+        format_type, filename, compression = self._resolve_target(filename, format_type, compression)
+        
+        try:
+            success = self._write(format_type, tasks, filename, include_statistics, compression, compression_level,
+                                  streaming=streaming)
+            self._record_export(filename, format_type, len(tasks), include_statistics, success)
+            return success
+            
+        except Exception as e:
+            self._record_export(filename, format_type, len(tasks), include_statistics, False, e)
+            raise
+    
+    def export_many(self, tasks: List[Task], targets: Dict[str, str], include_statistics: bool = True,
+                    parallel: Optional[bool] = None, streaming: bool = False) -> Dict[str, bool]:
+        """
+        Exporte les mêmes tâches vers plusieurs formats en une fois
+        
+        Les tâches sont copiées une seule fois (instantané figé au moment de
+        l'appel) et les statistiques calculées une seule fois. XML et Excel,
+        limités par le CPU, sont écrits en parallèle dans des processus
+        séparés pendant que le JSON est écrit dans le processus courant.
+        
+        Args:
+            tasks: Liste des tâches à exporter
+            targets: Format -> nom du fichier (ex: {'json': 'tasks.json', 'xlsx': 'tasks.xlsx'}),
+                     résolus comme dans export_tasks
+            include_statistics: Inclure les statistiques dans chaque export
+            parallel: True/False pour forcer ou interdire les processus séparés ;
+                      None : seulement si la machine a plusieurs cœurs
+            streaming: Comme dans export_tasks
+            
+        Returns:
+            Dict[str, bool]: Résultat par format demandé
+            
+        Raises:
+            La première erreur rencontrée, une fois tous les exports terminés
+        """
+        if not isinstance(tasks, list):
+            raise TypeError(f"Tasks must be a list, got {type(tasks)}")
+        
+        if not isinstance(targets, dict) or not targets:
+            raise ValueError("Targets must be a non-empty dict of format -> filename")
+        
+        resolved = {key: self._resolve_target(filename, key, None) for key, filename in targets.items()}
+        snapshot = [self._task_fields(task) for task in tasks]
+        frozen_tasks = [Task._from_fields(*fields) for fields in snapshot]
+        statistics = self._generate_export_statistics(frozen_tasks) if include_statistics else None
+        
+        if parallel is None:
+            parallel = (os.cpu_count() or 1) > 1
+        in_pool = {
+            key: target for key, target in resolved.items()
+            if parallel and len(resolved) > 1 and target[0] in self.PROCESS_POOL_FORMATS
+        }
+        results: Dict[str, bool] = {}
+        errors: Dict[str, Exception] = {}
+        
+        def write_here(key: str) -> None:
+            format_type, filename, compression = resolved[key]
+            try:
+                results[key] = self._write(format_type, frozen_tasks, filename, include_statistics,
+                                           compression, None, statistics, streaming)
+            except Exception as e:
+                errors[key] = e
+        
+        if in_pool:
+            with ProcessPoolExecutor(max_workers=len(in_pool)) as pool:
+                futures = {
+                    key: pool.submit(
+                        _export_in_subprocess, self._codec.name, format_type, snapshot, filename,
+                        include_statistics, compression, statistics, streaming
+                    )
+                    for key, (format_type, filename, compression) in in_pool.items()
+                }
+                for key in resolved:
+                    if key not in in_pool:
+                        write_here(key)
+                for key, future in futures.items():
+                    try:
+                        results[key] = future.result()
+                    except Exception as e:
+                        errors[key] = e
+        else:
+            for key in resolved:
+                write_here(key)
+        
+        for key, (format_type, filename, _) in resolved.items():
+            self._record_export(filename, format_type, len(tasks), include_statistics,
+                                results.get(key, False), errors.get(key))
+        
+        if errors:
+            raise next(iter(errors.values()))
+        return {key: results[key] for key in resolved}
+    
+    def _resolve_target(self, filename: str, format_type: str,
+                        compression: Optional[str]) -> Tuple[str, str, Optional[str]]:
+        """(format, nom de fichier final, compression) d'un export"""
         if not isinstance(filename, str) or not filename.strip():
             raise ValueError("Filename cannot be empty")
         
@@ -269,6 +524,9 @@ class ExportService:
             raise ValueError(f"Unsupported format: {format_type}. Supported formats: {self.SUPPORTED_FORMATS}")
         
         filename = filename.strip()
+        compression = detect_compression(filename, compression)
+        if compression is not None:
+            filename = strip_compression_suffix(filename)
         
         # Détecter le format depuis l'extension si pas spécifié
         if format_type == 'excel' or filename.endswith('.xlsx'):
@@ -277,50 +535,70 @@ class ExportService:
             format_type = 'xml'
         elif filename.endswith('.json'):
             format_type = 'json'
+        elif filename.endswith('.parquet'):
+            format_type = 'parquet'
+        elif filename.endswith(('.arrow', '.feather')):
+            format_type = 'arrow'
         
-        # Ajouter l'extension si manquante
-        if not filename.endswith(f'.{format_type}'):
+        # Ajouter l'extension si manquante (.feather accepté pour Arrow)
+        if not filename.endswith(f'.{format_type}') and not (format_type == 'arrow' and filename.endswith('.feather')):
             filename += f'.{format_type}'
         
-        try:
-            if format_type == 'json':
-                success = self._export_json(tasks, filename, include_statistics)
-            elif format_type == 'xml':
-                success = self._export_xml(tasks, filename, include_statistics)
-            elif format_type == 'xlsx':
-                success = self._export_excel(tasks, filename, include_statistics)
-            else:
-                raise ValueError(f"Unsupported format: {format_type}")
-            
-            # Enregistrer l'historique d'export
-            self.export_history.append({
-                "filename": filename,
-                "format": format_type,
-                "task_count": len(tasks),
-                "include_statistics": include_statistics,
-                "exported_at": datetime.now().isoformat(),
-                "success": success
-            })
-            
-            return success
-            
-        except Exception as e:
-            self.export_history.append({
-                "filename": filename,
-                "format": format_type,
-                "task_count": len(tasks),
-                "include_statistics": include_statistics,
-                "exported_at": datetime.now().isoformat(),
-                "success": False,
-                "error": str(e)
-            })
-            raise
+        if compression is not None:
+            if format_type in self.SELF_COMPRESSED_FORMATS:
+                raise ValueError(
+                    f"Compression is not supported for {format_type} exports: the format is already compressed"
+                )
+            filename += COMPRESSION_SUFFIXES[compression]
+        
+        return format_type, filename, compression
+    
+    def _write(self, format_type: str, tasks: List[Task], filename: str, include_statistics: bool,
+               compression: Optional[str] = None, compression_level: Optional[int] = None,
+               statistics: Optional[Dict[str, Any]] = None, streaming: bool = False) -> bool:
+        if format_type == 'json':
+            return self._export_json(tasks, filename, include_statistics, compression, compression_level, statistics)
+        if format_type == 'xml':
+            if streaming:
+                return self._export_xml_streaming(
+                    tasks, filename, include_statistics, compression, compression_level, statistics
+                )
+            return self._export_xml(tasks, filename, include_statistics, compression, compression_level, statistics)
+        if format_type == 'xlsx':
+            if streaming:
+                return self._export_excel_write_only(tasks, filename, include_statistics, statistics)
+            return self._export_excel(tasks, filename, include_statistics, statistics)
+        if format_type in ('parquet', 'arrow'):
+            return self._export_columnar(tasks, filename, format_type, include_statistics, statistics)
+        raise ValueError(f"Unsupported format: {format_type}")
     
-    def _export_json(self, tasks: List[Task], filename: str, include_statistics: bool) -> bool:
+    def _record_export(self, filename: str, format_type: str, task_count: int, include_statistics: bool,
+                       success: bool, error: Optional[Exception] = None) -> None:
+        """Enregistre l'export dans l'historique"""
+        entry = {
+            "filename": filename,
+            "format": format_type,
+            "task_count": task_count,
+            "include_statistics": include_statistics,
+            "exported_at": datetime.now().isoformat(),
+            "success": success
+        }
+        if error is not None:
+            entry["error"] = str(error)
+        self.export_history.append(entry)
+    
+    @staticmethod
+    def _task_fields(task: Task) -> Tuple[Any, ...]:
+        """Champs d'une tâche, dans l'ordre de Task._from_fields (copiable vers un autre processus)"""
+        return _TASK_FIELDS(task)
+    
+    def _export_json(self, tasks: List[Task], filename: str, include_statistics: bool,
+                     compression: Optional[str] = None, compression_level: Optional[int] = None,
+                     statistics: Optional[Dict[str, Any]] = None) -> bool:
         """Export vers JSON"""
         try:
             export_data = {
-                "tasks": [task.to_dict() for task in tasks],
+                "tasks": [task.to_record() for task in tasks],
                 "metadata": {
                     "total_tasks": len(tasks),
                     "export_format": "json",
@@ -330,28 +608,24 @@ class ExportService:
             }
             
             if include_statistics:
-                export_data["statistics"] = self._generate_export_statistics(tasks)
+                export_data["statistics"] = statistics or self._generate_export_statistics(tasks)
             
-            with open(filename, 'w', encoding='utf-8') as file:
-                json.dump(export_data, file, indent=2, ensure_ascii=False)
+            with open_for_write(filename, 'wb', atomic=False, compression=compression, level=compression_level) as file:
+                file.write(self._codec.dumps(export_data))
             
             return True
             
         except Exception as e:
             raise RuntimeError(f"Error exporting to JSON: {str(e)}")
     
-    def _export_xml(self, tasks: List[Task], filename: str, include_statistics: bool) -> bool:
+    def _export_xml(self, tasks: List[Task], filename: str, include_statistics: bool,
+                    compression: Optional[str] = None, compression_level: Optional[int] = None,
+                    statistics: Optional[Dict[str, Any]] = None) -> bool:
         """Export vers XML"""
         try:
             # Créer l'élément racine
             root = ET.Element("TaskManagerExport")
-            
-            # Métadonnées
-            metadata = ET.SubElement(root, "Metadata")
-            ET.SubElement(metadata, "TotalTasks").text = str(len(tasks))
-            ET.SubElement(metadata, "ExportFormat").text = "xml"
-            ET.SubElement(metadata, "ExportedAt").text = datetime.now().isoformat()
-            ET.SubElement(metadata, "IncludeStatistics").text = str(include_statistics)
+            root.append(self._xml_metadata(len(tasks), include_statistics))
             
             # Tâches
             tasks_element = ET.SubElement(root, "Tasks")
@@ -373,39 +647,99 @@ class ExportService:
             
             # Statistiques
             if include_statistics:
-                stats = self._generate_export_statistics(tasks)
-                stats_element = ET.SubElement(root, "Statistics")
-                
-                general_stats = ET.SubElement(stats_element, "GeneralStats")
-                ET.SubElement(general_stats, "TotalTasks").text = str(stats["total_tasks"])
-                ET.SubElement(general_stats, "CompletedTasks").text = str(stats["completed_tasks"])
-                ET.SubElement(general_stats, "PendingTasks").text = str(stats["pending_tasks"])
-                ET.SubElement(general_stats, "CompletionRate").text = str(stats["completion_rate"])
-                
-                # Répartition par priorité
-                priority_stats = ET.SubElement(stats_element, "PriorityDistribution")
-                for priority, count in stats["priority_distribution"].items():
-                    priority_elem = ET.SubElement(priority_stats, "Priority")
-                    priority_elem.set("type", priority)
-                    priority_elem.text = str(count)
-                
-                # Répartition par statut
-                status_stats = ET.SubElement(stats_element, "StatusDistribution")
-                for status, count in stats["status_distribution"].items():
-                    status_elem = ET.SubElement(status_stats, "Status")
-                    status_elem.set("type", status)
-                    status_elem.text = str(count)
+                root.append(self._xml_statistics(statistics or self._generate_export_statistics(tasks)))
             
             # Écrire le fichier XML
             tree = ET.ElementTree(root)
-            tree.write(filename, encoding='utf-8', xml_declaration=True)
+            with open_for_write(filename, 'wb', atomic=False, compression=compression, level=compression_level) as file:
+                tree.write(file, encoding='utf-8', xml_declaration=True)
+            
+            return True
+            
+        except Exception as e:
+            raise RuntimeError(f"Error exporting to XML: {str(e)}")
+    
+    def _export_xml_streaming(self, tasks: List[Task], filename: str, include_statistics: bool,
+                              compression: Optional[str] = None, compression_level: Optional[int] = None,
+                              statistics: Optional[Dict[str, Any]] = None) -> bool:
+        """
+        Export vers XML, tâche par tâche
+        
+        Produit exactement les mêmes octets que _export_xml, sans arbre en
+        mémoire : chaque <Task> est sérialisé directement et écrit par
+        paquets de XML_BATCH_SIZE tâches. Seuls les petits blocs Metadata et
+        Statistics passent par ElementTree.
+        """
+        try:
+            # Les statistiques sont écrites après les tâches mais calculées avant,
+            # pour ne parcourir les tâches qu'une fois pendant l'écriture
+            if include_statistics and not statistics:
+                statistics = self._generate_export_statistics(tasks)
+            
+            with open_for_write(filename, 'wb', atomic=False, compression=compression, level=compression_level) as file:
+                header = ET.tostring(self._xml_metadata(len(tasks), include_statistics), encoding='unicode')
+                file.write(f"<?xml version='1.0' encoding='utf-8'?>\n<TaskManagerExport>{header}".encode('utf-8'))
+                
+                if tasks:
+                    chunk = ["<Tasks>"]
+                    for task in tasks:
+                        chunk.append(_xml_task(task))
+                        if len(chunk) >= self.XML_BATCH_SIZE:
+                            file.write("".join(chunk).encode('utf-8'))
+                            chunk = []
+                    chunk.append("</Tasks>")
+                    file.write("".join(chunk).encode('utf-8'))
+                else:
+                    file.write(b"<Tasks />")
+                
+                if include_statistics:
+                    file.write(ET.tostring(self._xml_statistics(statistics), encoding='utf-8', xml_declaration=False))
+                file.write(b"</TaskManagerExport>")
             
             return True
             
         except Exception as e:
             raise RuntimeError(f"Error exporting to XML: {str(e)}")
     
-    def _export_excel(self, tasks: List[Task], filename: str, include_statistics: bool) -> bool:
+    @staticmethod
+    def _xml_metadata(task_count: int, include_statistics: bool) -> ET.Element:
+        """Bloc <Metadata> de l'export XML"""
+        metadata = ET.Element("Metadata")
+        ET.SubElement(metadata, "TotalTasks").text = str(task_count)
+        ET.SubElement(metadata, "ExportFormat").text = "xml"
+        ET.SubElement(metadata, "ExportedAt").text = datetime.now().isoformat()
+        ET.SubElement(metadata, "IncludeStatistics").text = str(include_statistics)
+        return metadata
+    
+    @staticmethod
+    def _xml_statistics(stats: Dict[str, Any]) -> ET.Element:
+        """Bloc <Statistics> de l'export XML"""
+        stats_element = ET.Element("Statistics")
+        
+        general_stats = ET.SubElement(stats_element, "GeneralStats")
+        ET.SubElement(general_stats, "TotalTasks").text = str(stats["total_tasks"])
+        ET.SubElement(general_stats, "CompletedTasks").text = str(stats["completed_tasks"])
+        ET.SubElement(general_stats, "PendingTasks").text = str(stats["pending_tasks"])
+        ET.SubElement(general_stats, "CompletionRate").text = str(stats["completion_rate"])
+        
+        # Répartition par priorité
+        priority_stats = ET.SubElement(stats_element, "PriorityDistribution")
+        for priority, count in stats["priority_distribution"].items():
+            priority_elem = ET.SubElement(priority_stats, "Priority")
+            priority_elem.set("type", priority)
+            priority_elem.text = str(count)
+        
+        # Répartition par statut
+        status_stats = ET.SubElement(stats_element, "StatusDistribution")
+        for status, count in stats["status_distribution"].items():
+            status_elem = ET.SubElement(status_stats, "Status")
+            status_elem.set("type", status)
+            status_elem.text = str(count)
+        
+        return stats_element
+    
+    def _export_excel(self, tasks: List[Task], filename: str, include_statistics: bool,
+                      statistics: Optional[Dict[str, Any]] = None) -> bool:
         """Export vers Excel"""
         if not OPENPYXL_AVAILABLE:
             raise ImportError("openpyxl library is required for Excel export. Install with: pip install openpyxl")
@@ -462,7 +796,7 @@ class ExportService:
             # Feuille des statistiques
             if include_statistics:
                 ws_stats = wb.create_sheet(title="Statistics")
-                stats = self._generate_export_statistics(tasks)
+                stats = statistics or self._generate_export_statistics(tasks)
                 
                 # Titre
                 ws_stats.cell(row=1, column=1, value="Task Statistics").font = Font(bold=True, size=16)
@@ -522,41 +856,183 @@ class ExportService:
         except Exception as e:
             raise RuntimeError(f"Error exporting to Excel: {str(e)}")
     
-    def _generate_export_statistics(self, tasks: List[Task]) -> Dict[str, Any]:
-        """Génère les statistiques pour l'export"""
-        total_tasks = len(tasks)
-        completed_tasks = len([t for t in tasks if t.status == Status.DONE])
-        pending_tasks = len([t for t in tasks if t.status == Status.TODO])
-        in_progress_tasks = len([t for t in tasks if t.status == Status.IN_PROGRESS])
-        cancelled_tasks = len([t for t in tasks if t.status == Status.CANCELLED])
-        
-        completion_rate = (completed_tasks / total_tasks * 100) if total_tasks > 0 else 0
-        
-        priority_distribution = {
-            "low": len([t for t in tasks if t.priority == Priority.LOW]),
-            "medium": len([t for t in tasks if t.priority == Priority.MEDIUM]),
-            "high": len([t for t in tasks if t.priority == Priority.HIGH]),
-            "urgent": len([t for t in tasks if t.priority == Priority.URGENT])
-        }
+    def _export_excel_write_only(self, tasks: List[Task], filename: str, include_statistics: bool,
+                                 statistics: Optional[Dict[str, Any]] = None) -> bool:
+        """
+        Export vers Excel en mode write_only d'openpyxl
         
-        status_distribution = {
-            "todo": pending_tasks,
-            "in_progress": in_progress_tasks,
-            "done": completed_tasks,
-            "cancelled": cancelled_tasks
-        }
+        Les lignes sont écrites dans le fichier au fur et à mesure, sans
+        garder de cellules en mémoire. Même classeur que _export_excel
+        (feuilles, valeurs, styles des en-têtes), à la largeur des colonnes
+        près : dans un fichier xlsx, les largeurs précèdent les lignes, elles
+        viennent donc des longueurs maximales relevées colonne par colonne en
+        un parcours des tâches (sans cellules ni chaînes conservées).
+        """
+        if not OPENPYXL_AVAILABLE:
+            raise ImportError("openpyxl library is required for Excel export. Install with: pip install openpyxl")
         
-        return {
-            "total_tasks": total_tasks,
-            "completed_tasks": completed_tasks,
-            "pending_tasks": pending_tasks,
-            "in_progress_tasks": in_progress_tasks,
-            "cancelled_tasks": cancelled_tasks,
-            "completion_rate": round(completion_rate, 2),
-            "priority_distribution": priority_distribution,
-            "status_distribution": status_distribution,
-            "generated_at": datetime.now().isoformat()
-        }
+        try:
+            wb = openpyxl.Workbook(write_only=True)
+            ws_tasks = wb.create_sheet(title="Tasks")
+            
+            header_font = Font(bold=True, color="FFFFFF")
+            header_fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
+            center_alignment = Alignment(horizontal="center", vertical="center")
+            
+            self._set_column_widths(ws_tasks, self._excel_column_lengths(tasks), 50)
+            ws_tasks.append([
+                self._styled_cell(ws_tasks, header, font=header_font, fill=header_fill, alignment=center_alignment)
+                for header in self.EXCEL_HEADERS
+            ])
+            
+            date_format = self.EXCEL_DATE_FORMAT
+            append = ws_tasks.append
+            for task in tasks:
+                completed_at = task.completed_at
+                append((
+                    task.id,
+                    task.title,
+                    task.description or "",
+                    task.priority.value,
+                    task.status.value,
+                    task.created_at.strftime(date_format),
+                    completed_at.strftime(date_format) if completed_at else "",
+                    task.project_id or "",
+                ))
+            
+            if include_statistics:
+                ws_stats = wb.create_sheet(title="Statistics")
+                rows = self._excel_statistics_rows(statistics or self._generate_export_statistics(tasks))
+                lengths = [0, 0]
+                for row in rows:
+                    for index, value in enumerate(row):
+                        lengths[index] = max(lengths[index], len(str(value)))
+                self._set_column_widths(ws_stats, lengths, 30)
+                
+                title_font = Font(bold=True, size=16)
+                title_fill = PatternFill(start_color="D9E2F3", end_color="D9E2F3", fill_type="solid")
+                section_font = Font(bold=True)
+                for index, row in enumerate(rows):
+                    if index == 0:
+                        row = [self._styled_cell(ws_stats, row[0], font=title_font, fill=title_fill)]
+                    elif len(row) == 1:
+                        row = [self._styled_cell(ws_stats, row[0], font=section_font)]
+                    ws_stats.append(row)
+            
+            wb.save(filename)
+            return True
+            
+        except Exception as e:
+            raise RuntimeError(f"Error exporting to Excel: {str(e)}")
+    
+    def _excel_column_lengths(self, tasks: List[Task]) -> List[int]:
+        """Longueur maximale de chaque colonne de la feuille Tasks, en-têtes compris"""
+        lengths = [len(header) for header in self.EXCEL_HEADERS]
+        id_length, title_length, description_length, project_length = lengths[0], lengths[1], lengths[2], lengths[7]
+        completed = False
+        priorities, statuses = set(), set()
+        for task in tasks:
+            length = len(str(task.id))
+            if length > id_length:
+                id_length = length
+            length = len(task._title)
+            if length > title_length:
+                title_length = length
+            length = len(task._description)
+            if length > description_length:
+                description_length = length
+            if task._project_id:
+                length = len(str(task._project_id))
+                if length > project_length:
+                    project_length = length
+            completed = completed or task._completed_us is not None
+            priorities.add(task._priority)
+            statuses.add(task._status)
+        
+        # Énumérations et dates : longueur connue d'avance
+        date_length = len(datetime.now().strftime(self.EXCEL_DATE_FORMAT))
+        lengths[0:3] = [id_length, title_length, description_length]
+        lengths[3] = max([lengths[3]] + [len(priority.value) for priority in priorities])
+        lengths[4] = max([lengths[4]] + [len(status.value) for status in statuses])
+        lengths[5] = max(lengths[5], date_length) if tasks else lengths[5]
+        lengths[6] = max(lengths[6], date_length) if completed else lengths[6]
+        lengths[7] = project_length
+        return lengths
+    
+    @staticmethod
+    def _excel_statistics_rows(stats: Dict[str, Any]) -> List[List[Any]]:
+        """Lignes de la feuille Statistics (une seule valeur : titre de section)"""
+        rows: List[List[Any]] = [["Task Statistics"], [], ["General Statistics"]]
+        rows.append(["Total Tasks", stats["total_tasks"]])
+        rows.append(["Completed Tasks", stats["completed_tasks"]])
+        rows.append(["Pending Tasks", stats["pending_tasks"]])
+        rows.append(["Completion Rate", f"{stats['completion_rate']}%"])
+        rows += [[], [], ["Priority Distribution"]]
+        rows += [[priority.capitalize(), count] for priority, count in stats["priority_distribution"].items()]
+        rows += [[], [], ["Status Distribution"]]
+        rows += [[status.replace("_", " ").title(), count] for status, count in stats["status_distribution"].items()]
+        return rows
+    
+    @staticmethod
+    def _styled_cell(ws: Any, value: Any, **style: Any) -> Any:
+        cell = WriteOnlyCell(ws, value=value)
+        for name, value in style.items():
+            setattr(cell, name, value)
+        return cell
+    
+    @staticmethod
+    def _set_column_widths(ws: Any, lengths: List[int], max_width: int) -> None:
+        for index, length in enumerate(lengths, 1):
+            ws.column_dimensions[get_column_letter(index)].width = min(length + 2, max_width)
+    
+    def _export_columnar(self, tasks: List[Task], filename: str, format_type: str, include_statistics: bool,
+                         statistics: Optional[Dict[str, Any]] = None) -> bool:
+        """
+        Export Parquet ou Arrow IPC (Feather v2) en colonnes typées
+        
+        Une colonne par champ : priorité et statut encodés en dictionnaire,
+        dates en timestamp (microsecondes, heure locale), completed_at et
+        project_id nullables. Les tâches sont converties par paquets de
+        COLUMNAR_BATCH_SIZE, un groupe de lignes par paquet. Métadonnées et
+        statistiques sont stockées en JSON dans les métadonnées du schéma
+        (clé "task_manager").
+        """
+        if not PYARROW_AVAILABLE:
+            raise ImportError(
+                "pyarrow library is required for Parquet and Arrow export. Install with: pip install pyarrow"
+            )
+        
+        try:
+            metadata: Dict[str, Any] = {
+                "total_tasks": len(tasks),
+                "export_format": format_type,
+                "exported_at": datetime.now().isoformat(),
+                "include_statistics": include_statistics
+            }
+            if include_statistics:
+                metadata["statistics"] = statistics or self._generate_export_statistics(tasks)
+            schema = _arrow_schema(tasks).with_metadata({"task_manager": self._codec.dumps(metadata, indent=False)})
+            
+            size = self.COLUMNAR_BATCH_SIZE
+            batches = (_arrow_batch(tasks[start:start + size], schema) for start in range(0, len(tasks), size))
+            if format_type == 'parquet':
+                with pq.ParquetWriter(filename, schema, compression=self.COLUMNAR_COMPRESSION) as writer:
+                    for batch in batches:
+                        writer.write_batch(batch)
+            else:
+                options = pa.ipc.IpcWriteOptions(compression=self.COLUMNAR_COMPRESSION)
+                with pa.ipc.new_file(filename, schema, options=options) as writer:
+                    for batch in batches:
+                        writer.write_batch(batch)
+            
+            return True
+            
+        except Exception as e:
+            raise RuntimeError(f"Error exporting to {format_type.capitalize()}: {str(e)}")
+    
+    def _generate_export_statistics(self, tasks: List[Task]) -> Dict[str, Any]:
+        """Génère les statistiques pour l'export (un seul parcours des tâches)"""
+        return count_tasks(tasks).to_statistics()
     
     def get_export_history(self) -> List[Dict[str, Any]]:
         """Retourne l'historique des exports"""
@@ -572,4 +1048,93 @@ class ExportService:
     
     def is_format_supported(self, format_type: str) -> bool:
         """Vérifie si un format est supporté"""
-        return format_type.lower() in self.SUPPORTED_FORMATS
\ No newline at end of file
+        return format_type.lower() in self.SUPPORTED_FORMATS
+
+
+def _arrow_schema(tasks: List[Task]) -> Any:
+    """
+    Schéma Arrow des tâches ; les identifiants sont int64 ou float64 (ancien format)
+    
+    Raises:
+        ValueError: Si les identifiants mélangent entiers et flottants
+    """
+    if all(isinstance(task.id, int) for task in tasks):
+        id_type = pa.int64()
+    elif all(isinstance(task.id, float) for task in tasks):
+        id_type = pa.float64()
+    else:
+        raise ValueError("Columnar export requires task ids of a single type (all float or all int)")
+    
+    return pa.schema([
+        pa.field("id", id_type, nullable=False),
+        pa.field("title", pa.string(), nullable=False),
+        pa.field("description", pa.string(), nullable=False),
+        pa.field("priority", pa.dictionary(pa.int8(), pa.string()), nullable=False),
+        pa.field("status", pa.dictionary(pa.int8(), pa.string()), nullable=False),
+        pa.field("created_at", pa.timestamp("us"), nullable=False),
+        pa.field("completed_at", pa.timestamp("us")),
+        pa.field("project_id", pa.float64()),
+    ])
+
+
+def _arrow_batch(tasks: List[Task], schema: Any) -> Any:
+    """Record batch d'un paquet de tâches ; dictionnaires complets et identiques d'un paquet à l'autre"""
+    ids, titles, descriptions, priorities, statuses, created, completed, projects = zip(
+        *[_TASK_FIELDS(task) for task in tasks]
+    )
+    priority_codes = {priority: code for code, priority in enumerate(Priority)}
+    status_codes = {status: code for code, status in enumerate(Status)}
+    return pa.RecordBatch.from_arrays([
+        pa.array(ids, schema.field("id").type),
+        pa.array(titles, pa.string()),
+        pa.array(descriptions, pa.string()),
+        pa.DictionaryArray.from_arrays(
+            pa.array([priority_codes[priority] for priority in priorities], pa.int8()),
+            pa.array([priority.value for priority in Priority], pa.string())
+        ),
+        pa.DictionaryArray.from_arrays(
+            pa.array([status_codes[status] for status in statuses], pa.int8()),
+            pa.array([status.value for status in Status], pa.string())
+        ),
+        pa.array(created, pa.timestamp("us")),
+        pa.array(completed, pa.timestamp("us")),
+        pa.array(projects, pa.float64()),
+    ], schema=schema)
+
+
+def _xml_escape(text: str) -> str:
+    """Échappement du texte XML, identique à ElementTree"""
+    if "&" in text:
+        text = text.replace("&", "&amp;")
+    if "<" in text:
+        text = text.replace("<", "&lt;")
+    if ">" in text:
+        text = text.replace(">", "&gt;")
+    return text
+
+
+def _xml_task(task: Task) -> str:
+    """Élément <Task> sérialisé comme le ferait ElementTree (identifiants numériques, non échappés)"""
+    description = task.description
+    parts = [
+        f'<Task id="{task.id}"><Title>{_xml_escape(task.title)}</Title>',
+        f'<Description>{_xml_escape(description)}</Description>' if description else '<Description />',
+        f'<Priority>{task.priority.value}</Priority><Status>{task.status.value}</Status>',
+        f'<CreatedAt>{task.created_at.isoformat()}</CreatedAt>',
+    ]
+    if task.completed_at:
+        parts.append(f'<CompletedAt>{task.completed_at.isoformat()}</CompletedAt>')
+    if task.project_id:
+        parts.append(f'<ProjectId>{task.project_id}</ProjectId>')
+    parts.append('</Task>')
+    return "".join(parts)
+
+
+def _export_in_subprocess(codec: str, format_type: str, snapshot: List[Tuple[Any, ...]], filename: str,
+                          include_statistics: bool, compression: Optional[str],
+                          statistics: Optional[Dict[str, Any]], streaming: bool) -> bool:
+    """Export d'un format dans un processus de travail, depuis l'instantané des tâches"""
+    tasks = [Task._from_fields(*fields) for fields in snapshot]
+    return ExportService(codec)._write(
+        format_type, tasks, filename, include_statistics, compression, None, statistics, streaming
+    )
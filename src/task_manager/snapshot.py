@@ -0,0 +1,394 @@
+# src/task_manager/snapshot.py
+import mmap
+import os
+import struct
+import sys
+import weakref
+from array import array
+from datetime import date, datetime, time as dt_time
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Sequence, Set
+from .task import Task, Priority, Status, to_epoch_us
+from .stats import TaskCounts, count_tasks
+from .storage import TaskStore, MemoryTaskStore
+from .ids import TaskId
+from .fileio import open_for_write
+
+MAGIC = b"TASKSNP1"
+# magic, type des identifiants (0 flottant, 1 entier), ordre des octets (0 little, 1 big), nombre de tâches
+HEADER = struct.Struct("<8sBB6xQ")
+
+PRIORITIES: List[Priority] = list(Priority)
+STATUSES: List[Status] = list(Status)
+PRIORITY_CODES: Dict[Priority, int] = {priority: code for code, priority in enumerate(PRIORITIES)}
+STATUS_CODES: Dict[Status, int] = {status: code for code, status in enumerate(STATUSES)}
+
+# Valeur sentinelle pour completed_at = None
+NO_DATE = -(2 ** 63)
+MICROSECONDS_PER_DAY = 86_400_000_000
+BYTE_ORDER = 0 if sys.byteorder == "little" else 1
+
+
+def _sections(count: int) -> Dict[str, int]:
+    """
+    Position de chaque section dans le fichier, pour count tâches
+
+    Colonnes de 8 octets d'abord (alignées), puis les colonnes d'un octet et
+    enfin le tas des chaînes UTF-8. Les tables d'offsets ont count + 1
+    entrées : la chaîne i occupe tas[offset[i]:offset[i + 1]].
+    """
+    sections = {}
+    position = HEADER.size
+    for name, size in (
+        ("ids", 8 * count),
+        ("created", 8 * count),
+        ("completed", 8 * count),
+        ("project", 8 * count),
+        ("title_offsets", 8 * (count + 1)),
+        ("description_offsets", 8 * (count + 1)),
+        ("id_index", 8 * count),
+        ("priority", count),
+        ("status", count),
+    ):
+        sections[name] = position
+        position += size
+    sections["heap"] = position
+    return sections
+
+
+def write_snapshot(tasks: Sequence[Task], file: BinaryIO) -> None:
+    """
+    Écrit les tâches au format binaire à largeur fixe
+
+    Une colonne par champ, dans l'ordre des tâches ; titres et descriptions
+    dans un tas de chaînes indexé par des tables d'offsets ; un index des
+    lignes triées par identifiant pour les recherches par dichotomie.
+
+    Raises:
+        ValueError: Si les identifiants mélangent entiers et flottants
+    """
+    ids = [task.id for task in tasks]
+    if all(isinstance(task_id, int) for task_id in ids) and ids:
+        id_kind, id_column = 1, array('q', ids)
+    elif all(isinstance(task_id, float) for task_id in ids):
+        id_kind, id_column = 0, array('d', ids)
+    else:
+        raise ValueError("Binary snapshot requires task ids of a single type (all float or all int)")
+
+    heap = bytearray()
+    title_offsets = array('Q', [0])
+    description_offsets = array('Q')
+    titles = []
+    for task in tasks:
+        encoded = task.title.encode('utf-8')
+        titles.append(encoded)
+        title_offsets.append(title_offsets[-1] + len(encoded))
+    heap += b"".join(titles)
+    description_offsets.append(len(heap))
+    for task in tasks:
+        heap += task.description.encode('utf-8')
+        description_offsets.append(len(heap))
+
+    file.write(HEADER.pack(MAGIC, id_kind, BYTE_ORDER, len(tasks)))
+    file.write(id_column.tobytes())
+    file.write(array('q', [task._created_us for task in tasks]).tobytes())
+    file.write(array('q', [
+        NO_DATE if task._completed_us is None else task._completed_us for task in tasks
+    ]).tobytes())
+    file.write(array('d', [
+        float("nan") if task.project_id is None else task.project_id for task in tasks
+    ]).tobytes())
+    file.write(title_offsets.tobytes())
+    file.write(description_offsets.tobytes())
+    file.write(array('Q', sorted(range(len(ids)), key=ids.__getitem__)).tobytes())
+    file.write(bytes(PRIORITY_CODES[task._priority] for task in tasks))
+    file.write(bytes(STATUS_CODES[task._status] for task in tasks))
+    file.write(heap)
+
+
+class MappedTaskStore(TaskStore):
+    """
+    Stockage lu directement dans un instantané binaire projeté en mémoire (mmap)
+
+    L'ouverture ne lit que l'en-tête : les comptages et les filtres par statut
+    ou priorité parcourent les colonnes du fichier projeté, la recherche par
+    identifiant se fait par dichotomie dans l'index trié, et les objets Task
+    ne sont décodés qu'à l'accès (le même objet est renvoyé tant qu'il est
+    référencé).
+
+    Le fichier n'est jamais modifié en place : les changements sont gardés en
+    mémoire (lignes supprimées, tâches du fichier modifiées, nouvelles tâches)
+    et appliqués aux résultats. checkpoint() réécrit l'instantané de façon
+    atomique et le projette à nouveau.
+    """
+
+    persistent = True
+
+    def __init__(self, snapshot_file: str) -> None:
+        self.database_file = os.path.abspath(snapshot_file)
+        self._file: Optional[BinaryIO] = None
+        self._mmap: Optional[mmap.mmap] = None
+        self._live: "weakref.WeakValueDictionary[TaskId, Task]" = weakref.WeakValueDictionary()
+        self._map()
+
+    # Projection du fichier
+
+    def _map(self) -> None:
+        self._reset_overlay()
+        self._count = 0
+        self._base_counts: Optional[TaskCounts] = None
+        self._status_start = self._priority_start = self._heap_start = 0
+        # Fichier absent ou vide : colonnes vides, seules les nouvelles tâches comptent
+        self._ids = self._created = self._completed = self._project = self._id_index = ()
+        self._priority = self._status = ()
+        self._title_offsets = self._description_offsets = (0,)
+        if not os.path.exists(self.database_file) or os.path.getsize(self.database_file) == 0:
+            return
+
+        self._file = open(self.database_file, 'rb')
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, id_kind, byte_order, count = HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC:
+            self._unmap()
+            raise ValueError(f"Invalid binary snapshot '{self.database_file}': bad magic number")
+        if byte_order != BYTE_ORDER:
+            self._unmap()
+            raise ValueError(f"Binary snapshot '{self.database_file}' was written with another byte order")
+
+        self._count = count
+        sections = _sections(count)
+        self._heap_start = sections["heap"]
+        view = memoryview(self._mmap)
+        self._views = [view]
+
+        def column(name: str, fmt: str, length: int) -> memoryview:
+            start = sections[name]
+            cast = view[start:start + length * struct.calcsize(fmt)].cast(fmt)
+            self._views.append(cast)
+            return cast
+
+        self._ids = column("ids", 'q' if id_kind else 'd', count)
+        self._created = column("created", 'q', count)
+        self._completed = column("completed", 'q', count)
+        self._project = column("project", 'd', count)
+        self._title_offsets = column("title_offsets", 'Q', count + 1)
+        self._description_offsets = column("description_offsets", 'Q', count + 1)
+        self._id_index = column("id_index", 'Q', count)
+        self._priority = column("priority", 'B', count)
+        self._status = column("status", 'B', count)
+        self._priority_start = sections["priority"]
+        self._status_start = sections["status"]
+
+    def _unmap(self) -> None:
+        for view in reversed(getattr(self, "_views", [])):
+            view.release()
+        self._views = []
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        self._count = 0
+
+    def _reset_overlay(self) -> None:
+        # Lignes du fichier supprimées, lignes du fichier modifiées, nouvelles tâches
+        self._removed: Set[int] = set()
+        self._overrides: Dict[int, Task] = {}
+        self._added = MemoryTaskStore()
+
+    # Lecture des lignes
+
+    def _find_row(self, task_id: TaskId) -> Optional[int]:
+        """Dichotomie dans l'index des lignes triées par identifiant"""
+        ids, index = self._ids, self._id_index
+        low, high = 0, self._count
+        try:
+            while low < high:
+                middle = (low + high) // 2
+                if ids[index[middle]] < task_id:
+                    low = middle + 1
+                else:
+                    high = middle
+        except TypeError:
+            return None
+        if low < self._count and ids[index[low]] == task_id:
+            return index[low]
+        return None
+
+    def _string(self, offsets: memoryview, row: int) -> str:
+        start = self._heap_start + offsets[row]
+        return self._mmap[start:self._heap_start + offsets[row + 1]].decode('utf-8')
+
+    def _task_at(self, row: int) -> Task:
+        override = self._overrides.get(row)
+        if override is not None:
+            return override
+
+        task_id = self._ids[row]
+        task = self._live.get(task_id)
+        if task is None:
+            completed = self._completed[row]
+            project_id = self._project[row]
+            task = Task._from_fields(
+                task_id,
+                self._string(self._title_offsets, row),
+                self._string(self._description_offsets, row),
+                PRIORITIES[self._priority[row]],
+                STATUSES[self._status[row]],
+                self._created[row],
+                None if completed == NO_DATE else completed,
+                None if project_id != project_id else project_id
+            )
+            task._owner = self
+            self._live[task_id] = task
+        return task
+
+    def _rows_with_code(self, start: int, code: int) -> List[int]:
+        """Lignes dont l'octet vaut code dans la colonne commençant à start"""
+        column = self._mmap[start:start + self._count] if self._count else b""
+        needle = bytes((code,))
+        rows = []
+        position = column.find(needle)
+        while position != -1:
+            rows.append(position)
+            position = column.find(needle, position + 1)
+        return rows
+
+    def _merge(self, base_rows: List[int], matches: Any, added: List[Task]) -> List[Task]:
+        """Lignes du fichier retenues + tâches modifiées qui correspondent, puis nouvelles tâches"""
+        rows = [row for row in base_rows if row not in self._removed and row not in self._overrides]
+        rows.extend(row for row, task in self._overrides.items() if matches(task))
+        rows.sort()
+        return [self._task_at(row) for row in rows] + added
+
+    # Opérations du stockage
+
+    def add(self, task: Task) -> None:
+        self.remove(task.id)
+        self._added.add(task)
+        task._owner = self
+
+    def get(self, task_id: TaskId) -> Optional[Task]:
+        task = self._added.get(task_id)
+        if task is not None:
+            return task
+        row = self._find_row(task_id)
+        if row is None or row in self._removed:
+            return None
+        return self._task_at(row)
+
+    def remove(self, task_id: TaskId) -> bool:
+        if self._added.remove(task_id):
+            return True
+        row = self._find_row(task_id)
+        if row is None or row in self._removed:
+            return False
+
+        self._removed.add(row)
+        task = self._overrides.pop(row, None) or self._live.pop(task_id, None)
+        if task is not None:
+            task._owner = None
+        return True
+
+    def by_status(self, status: Status) -> List[Task]:
+        return self._merge(
+            self._rows_with_code(self._status_start, STATUS_CODES[status]),
+            lambda task: task._status is status,
+            self._added.by_status(status)
+        )
+
+    def by_priority(self, priority: Priority) -> List[Task]:
+        return self._merge(
+            self._rows_with_code(self._priority_start, PRIORITY_CODES[priority]),
+            lambda task: task._priority is priority,
+            self._added.by_priority(priority)
+        )
+
+    def by_day(self, day: date) -> List[Task]:
+        start = to_epoch_us(datetime.combine(day, dt_time.min))
+        end = start + MICROSECONDS_PER_DAY
+        created, completed = self._created, self._completed
+        base_rows = [
+            row for row in range(self._count)
+            if start <= created[row] < end or start <= completed[row] < end
+        ]
+
+        def matches(task: Task) -> bool:
+            return (start <= task._created_us < end or
+                    (task._completed_us is not None and start <= task._completed_us < end))
+
+        return self._merge(base_rows, matches, self._added.by_day(day))
+
+    def _file_counts(self) -> TaskCounts:
+        """Comptages des colonnes du fichier, calculés une fois par projection"""
+        if self._base_counts is None:
+            status_column = self._mmap[self._status_start:self._status_start + self._count] if self._count else b""
+            priority_column = (
+                self._mmap[self._priority_start:self._priority_start + self._count] if self._count else b""
+            )
+            self._base_counts = TaskCounts(
+                self._count,
+                {status: status_column.count(bytes((code,))) for status, code in STATUS_CODES.items()},
+                {priority: priority_column.count(bytes((code,))) for priority, code in PRIORITY_CODES.items()}
+            )
+        return self._base_counts
+
+    def counts(self, day: Optional[date] = None) -> TaskCounts:
+        if day is not None:
+            return count_tasks(self.by_day(day), day=day)
+
+        base = self._file_counts()
+        added = self._added.counts()
+        status_counts = {status: base.status_counts[status] + added.status_counts[status] for status in Status}
+        priority_counts = {
+            priority: base.priority_counts[priority] + added.priority_counts[priority] for priority in Priority
+        }
+        for row in self._removed | self._overrides.keys():
+            status_counts[STATUSES[self._status[row]]] -= 1
+            priority_counts[PRIORITIES[self._priority[row]]] -= 1
+        for task in self._overrides.values():
+            status_counts[task._status] += 1
+            priority_counts[task._priority] += 1
+
+        return TaskCounts(len(self), status_counts, priority_counts)
+
+    def clear(self) -> None:
+        for task in list(self._live.values()) + list(self._overrides.values()):
+            task._owner = None
+        self._added.clear()
+        self._live = weakref.WeakValueDictionary()
+        self._overrides = {}
+        self._removed = set(range(self._count))
+
+    def checkpoint(self) -> None:
+        """Réécrit l'instantané avec les changements, puis le projette à nouveau"""
+        tasks = list(self)
+        with open_for_write(self.database_file, 'wb') as file:
+            write_snapshot(tasks, file)
+
+        self._unmap()
+        self._map()
+        for task in tasks:
+            task._owner = self
+            self._live[task.id] = task
+
+    def close(self) -> None:
+        self._unmap()
+
+    def _on_task_changed(self, task: Task, field: str, old_value: Any) -> None:
+        if self._added.get(task.id) is task:
+            self._added._on_task_changed(task, field, old_value)
+            return
+        row = self._find_row(task.id)
+        if row is not None and row not in self._removed:
+            self._overrides[row] = task
+
+    def __len__(self) -> int:
+        return self._count - len(self._removed) + len(self._added)
+
+    def __iter__(self) -> Iterator[Task]:
+        removed = self._removed
+        for row in range(self._count):
+            if row not in removed:
+                yield self._task_at(row)
+        yield from list(self._added)
@@ -0,0 +1,290 @@
+# src/task_manager/sqlite.py
+import os
+import sqlite3
+import weakref
+from contextlib import contextmanager
+from datetime import date, datetime, time as dt_time
+from typing import Any, Iterable, Iterator, List, Optional, Sequence, Tuple
+from .task import Task, Priority, Status, to_epoch_us
+from .stats import TaskCounts
+from .storage import TaskStore
+from .ids import TaskId
+
+MICROSECONDS_PER_DAY = 86_400_000_000
+
+# id sans affinité (BLOB) : les identifiants flottants et entiers sont gardés tels quels
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS tasks (
+    seq INTEGER PRIMARY KEY,
+    id BLOB NOT NULL UNIQUE,
+    title TEXT NOT NULL,
+    description TEXT NOT NULL,
+    priority TEXT NOT NULL,
+    status TEXT NOT NULL,
+    created_us INTEGER NOT NULL,
+    completed_us INTEGER,
+    project_id REAL
+);
+CREATE INDEX IF NOT EXISTS idx_tasks_status ON tasks (status);
+CREATE INDEX IF NOT EXISTS idx_tasks_priority ON tasks (priority);
+CREATE INDEX IF NOT EXISTS idx_tasks_project_id ON tasks (project_id);
+CREATE INDEX IF NOT EXISTS idx_tasks_created_us ON tasks (created_us);
+CREATE INDEX IF NOT EXISTS idx_tasks_completed_us ON tasks (completed_us);
+"""
+
+# Tâches créées ou terminées dans [début, fin) : chaque branche du OR a son index
+DAY_FILTER = "(created_us >= ? AND created_us < ?) OR (completed_us >= ? AND completed_us < ?)"
+
+COLUMNS = "id, title, description, priority, status, created_us, completed_us, project_id"
+
+
+class SqliteTaskStore(TaskStore):
+    """
+    Stockage dans une base SQLite (module sqlite3 de la bibliothèque standard)
+
+    Une ligne par tâche, indexée sur l'identifiant, le statut, la priorité, le
+    projet et les dates de création et de fin : recherches, filtres et
+    statistiques sont des requêtes SQL indexées, sans charger les tâches en
+    mémoire. L'ordre
+    d'insertion est celui de la clé seq. Comme pour le stockage colonne, les
+    objets Task sont créés à la demande ; tant qu'une tâche est référencée, le
+    même objet est renvoyé et ses changements sont réécrits dans sa ligne.
+    Chaque écriture simple est validée immédiatement ; les opérations en bloc
+    s'exécutent dans une seule transaction.
+    """
+
+    persistent = True
+    # Nombre maximal de paramètres par requête IN (...)
+    CHUNK_SIZE = 500
+
+    def __init__(self, database_file: str) -> None:
+        self.database_file = os.path.abspath(database_file)
+        self._connection = sqlite3.connect(database_file, isolation_level=None)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.executescript(SCHEMA)
+        self._live: "weakref.WeakValueDictionary[TaskId, Task]" = weakref.WeakValueDictionary()
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        connection = self._connection
+        connection.execute("BEGIN")
+        try:
+            yield connection
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        connection.execute("COMMIT")
+
+    @staticmethod
+    def _row(task: Task) -> Tuple[Any, ...]:
+        return (
+            task.id, task.title, task.description, task._priority.value, task._status.value,
+            task._created_us, task._completed_us, task.project_id
+        )
+
+    def _task_from_row(self, row: Sequence[Any]) -> Task:
+        task = self._live.get(row[0])
+        if task is None:
+            task = Task._from_fields(
+                row[0], row[1], row[2], Priority(row[3]), Status(row[4]), row[5], row[6], row[7]
+            )
+            task._owner = self
+            self._live[task.id] = task
+        return task
+
+    def _select(self, where: str = "", params: Sequence[Any] = ()) -> List[Task]:
+        cursor = self._connection.execute(f"SELECT {COLUMNS} FROM tasks {where} ORDER BY seq", params)
+        return [self._task_from_row(row) for row in cursor]
+
+    @classmethod
+    def _chunks(cls, task_ids: Iterable[TaskId]) -> Iterator[List[TaskId]]:
+        chunk: List[TaskId] = []
+        for task_id in task_ids:
+            chunk.append(task_id)
+            if len(chunk) >= cls.CHUNK_SIZE:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+    def _release(self, task_id: TaskId) -> None:
+        task = self._live.pop(task_id, None)
+        if task is not None:
+            task._owner = None
+
+    def add(self, task: Task) -> None:
+        self.add_many([task])
+
+    def get(self, task_id: TaskId) -> Optional[Task]:
+        task = self._live.get(task_id)
+        if task is not None:
+            return task
+        row = self._connection.execute(f"SELECT {COLUMNS} FROM tasks WHERE id = ?", (task_id,)).fetchone()
+        return None if row is None else self._task_from_row(row)
+
+    def existing(self, task_ids: Iterable[TaskId]) -> List[TaskId]:
+        """Présence vérifiée par requêtes SELECT id ... WHERE id IN (...), sans construire les tâches"""
+        task_ids = list(dict.fromkeys(task_ids))
+        found = set()
+        for chunk in self._chunks(task_ids):
+            placeholders = ", ".join("?" * len(chunk))
+            found.update(row[0] for row in self._connection.execute(
+                f"SELECT id FROM tasks WHERE id IN ({placeholders})", chunk
+            ))
+        return [task_id for task_id in task_ids if task_id in found]
+
+    def remove(self, task_id: TaskId) -> bool:
+        return self.remove_many([task_id]) == 1
+
+    def add_many(self, tasks: List[Task]) -> None:
+        """Insertion en une transaction ; un identifiant existant est remplacé et passe en fin d'ordre"""
+        if not tasks:
+            return
+
+        with self._transaction() as connection:
+            connection.executemany(
+                f"INSERT OR REPLACE INTO tasks ({COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                [self._row(task) for task in tasks]
+            )
+
+        for task in tasks:
+            previous = self._live.get(task.id)
+            if previous is not None and previous is not task:
+                previous._owner = None
+            self._live[task.id] = task
+            task._owner = self
+
+    def remove_many(self, task_ids: Iterable[TaskId]) -> int:
+        task_ids = list(task_ids)
+        with self._transaction() as connection:
+            cursor = connection.executemany("DELETE FROM tasks WHERE id = ?", [(task_id,) for task_id in task_ids])
+            removed = cursor.rowcount
+
+        for task_id in task_ids:
+            self._release(task_id)
+        return removed
+
+    def update_many(
+        self,
+        task_ids: Iterable[TaskId],
+        status: Optional[Status] = None,
+        priority: Optional[Priority] = None
+    ) -> int:
+        """Mise à jour par requêtes UPDATE ... WHERE id IN (...), vérifiée puis exécutée en une transaction"""
+        found: List[TaskId] = []
+        completed: List[TaskId] = []
+        for chunk in self._chunks(task_ids):
+            placeholders = ", ".join("?" * len(chunk))
+            cursor = self._connection.execute(f"SELECT id, status FROM tasks WHERE id IN ({placeholders})", chunk)
+            for task_id, task_status in cursor:
+                found.append(task_id)
+                if task_status == Status.DONE.value:
+                    completed.append(task_id)
+
+        if priority is not None and completed:
+            raise ValueError(f"Cannot update priority of completed tasks: {completed}")
+
+        now_us = to_epoch_us(datetime.now())
+        with self._transaction() as connection:
+            for chunk in self._chunks(found):
+                placeholders = ", ".join("?" * len(chunk))
+                if priority is not None:
+                    connection.execute(
+                        f"UPDATE tasks SET priority = ? WHERE id IN ({placeholders})", [priority.value, *chunk]
+                    )
+                if status is not None:
+                    if status is Status.DONE:
+                        connection.execute(
+                            f"UPDATE tasks SET completed_us = ? WHERE id IN ({placeholders}) AND status != ?",
+                            [now_us, *chunk, Status.DONE.value]
+                        )
+                    connection.execute(
+                        f"UPDATE tasks SET status = ? WHERE id IN ({placeholders})", [status.value, *chunk]
+                    )
+
+        # Les objets Task déjà créés reflètent les nouvelles valeurs
+        for task_id in found:
+            task = self._live.get(task_id)
+            if task is None:
+                continue
+            if priority is not None:
+                task._priority = priority
+            if status is not None:
+                if status is Status.DONE and task._status is not Status.DONE:
+                    task._completed_us = now_us
+                task._status = status
+
+        return len(found)
+
+    def by_status(self, status: Status) -> List[Task]:
+        return self._select("WHERE status = ?", (status.value,))
+
+    def by_priority(self, priority: Priority) -> List[Task]:
+        return self._select("WHERE priority = ?", (priority.value,))
+
+    @staticmethod
+    def _day_range(day: date) -> Tuple[int, int]:
+        start = to_epoch_us(datetime.combine(day, dt_time.min))
+        return start, start + MICROSECONDS_PER_DAY
+
+    def by_day(self, day: date) -> List[Task]:
+        start, end = self._day_range(day)
+        return self._select(
+            f"WHERE {DAY_FILTER}",
+            (start, end, start, end)
+        )
+
+    def counts(self, day: Optional[date] = None) -> TaskCounts:
+        where, params = "", ()
+        created_on_day = 0
+        if day is not None:
+            start, end = self._day_range(day)
+            where = f"WHERE {DAY_FILTER}"
+            params = (start, end, start, end)
+            created_on_day = self._connection.execute(
+                "SELECT COUNT(*) FROM tasks WHERE created_us >= ? AND created_us < ?", (start, end)
+            ).fetchone()[0]
+
+        status_counts = {status: 0 for status in Status}
+        for value, count in self._connection.execute(
+            f"SELECT status, COUNT(*) FROM tasks {where} GROUP BY status", params
+        ):
+            status_counts[Status(value)] = count
+
+        priority_counts = {priority: 0 for priority in Priority}
+        for value, count in self._connection.execute(
+            f"SELECT priority, COUNT(*) FROM tasks {where} GROUP BY priority", params
+        ):
+            priority_counts[Priority(value)] = count
+
+        return TaskCounts(sum(status_counts.values()), status_counts, priority_counts, created_on_day)
+
+    def clear(self) -> None:
+        self._connection.execute("DELETE FROM tasks")
+        for task in list(self._live.values()):
+            task._owner = None
+        self._live = weakref.WeakValueDictionary()
+
+    def checkpoint(self) -> None:
+        """Reporte le journal WAL de SQLite dans la base"""
+        self._connection.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
+    def close(self) -> None:
+        self._connection.close()
+
+    def _on_task_changed(self, task: Task, field: str, old_value: Any) -> None:
+        row = self._row(task)
+        self._connection.execute(
+            "UPDATE tasks SET title = ?, description = ?, priority = ?, status = ?, "
+            "created_us = ?, completed_us = ?, project_id = ? WHERE id = ?",
+            (*row[1:], row[0])
+        )
+
+    def __len__(self) -> int:
+        return self._connection.execute("SELECT COUNT(*) FROM tasks").fetchone()[0]
+
+    def __iter__(self) -> Iterator[Task]:
+        cursor = self._connection.execute(f"SELECT {COLUMNS} FROM tasks ORDER BY seq")
+        for row in cursor:
+            yield self._task_from_row(row)
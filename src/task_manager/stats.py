@@ -0,0 +1,107 @@
+# src/task_manager/stats.py
+from datetime import date, datetime
+from typing import Dict, Any, Iterable, Optional
+from .task import Task, Priority, Status
+
+
+class TaskCounts:
+    """Compteurs par statut et par priorité, calculés en une seule passe"""
+
+    def __init__(
+        self,
+        total: int = 0,
+        status_counts: Optional[Dict[Status, int]] = None,
+        priority_counts: Optional[Dict[Priority, int]] = None,
+        created_on_day: int = 0
+    ) -> None:
+        self.total: int = total
+        self.status_counts: Dict[Status, int] = status_counts or {status: 0 for status in Status}
+        self.priority_counts: Dict[Priority, int] = priority_counts or {priority: 0 for priority in Priority}
+        self.created_on_day: int = created_on_day
+
+    @property
+    def completed(self) -> int:
+        return self.status_counts[Status.DONE]
+
+    @property
+    def completion_rate(self) -> float:
+        return (self.completed / self.total) * 100.0 if self.total else 0.0
+
+    def priority_distribution(self) -> Dict[str, int]:
+        return {
+            "low": self.priority_counts[Priority.LOW],
+            "medium": self.priority_counts[Priority.MEDIUM],
+            "high": self.priority_counts[Priority.HIGH],
+            "urgent": self.priority_counts[Priority.URGENT]
+        }
+
+    def status_distribution(self) -> Dict[str, int]:
+        return {
+            "todo": self.status_counts[Status.TODO],
+            "in_progress": self.status_counts[Status.IN_PROGRESS],
+            "done": self.status_counts[Status.DONE],
+            "cancelled": self.status_counts[Status.CANCELLED]
+        }
+
+    def to_statistics(self) -> Dict[str, Any]:
+        """Format commun à TaskManager.get_statistics et aux exports"""
+        completion_rate = self.completion_rate
+        return {
+            "total_tasks": self.total,
+            "completed_tasks": self.completed,
+            "pending_tasks": self.status_counts[Status.TODO],
+            "in_progress_tasks": self.status_counts[Status.IN_PROGRESS],
+            "cancelled_tasks": self.status_counts[Status.CANCELLED],
+            "completion_rate": round(completion_rate, 2),
+            "priority_distribution": self.priority_distribution(),
+            "status_distribution": self.status_distribution(),
+            "generated_at": datetime.now().isoformat()
+        }
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, TaskCounts):
+            return False
+        return (
+            self.total == other.total
+            and self.status_counts == other.status_counts
+            and self.priority_counts == other.priority_counts
+            and self.created_on_day == other.created_on_day
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"TaskCounts(total={self.total}, status={self.status_distribution()}, "
+            f"priority={self.priority_distribution()})"
+        )
+
+
+def count_tasks(tasks: Iterable[Task], day: Optional[date] = None) -> TaskCounts:
+    """
+    Compte les tâches par statut et par priorité en un seul parcours
+
+    Args:
+        tasks: Tâches à compter (liste, générateur, gestionnaire...)
+        day: Ne compter que les tâches créées ou terminées ce jour-là
+
+    Returns:
+        TaskCounts: Compteurs ; created_on_day n'est renseigné que si day est fourni
+    """
+    status_counts = {status: 0 for status in Status}
+    priority_counts = {priority: 0 for priority in Priority}
+    total = 0
+    created_on_day = 0
+
+    for task in tasks:
+        if day is not None:
+            created_today = task.created_at.date() == day
+            completed_at = task.completed_at
+            if not created_today and not (completed_at and completed_at.date() == day):
+                continue
+            if created_today:
+                created_on_day += 1
+
+        total += 1
+        status_counts[task.status] += 1
+        priority_counts[task.priority] += 1
+
+    return TaskCounts(total, status_counts, priority_counts, created_on_day)
@@ -0,0 +1,275 @@
+# src/task_manager/storage.py
+from datetime import date, datetime
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+from .task import Task, Priority, Status, to_epoch_us
+from .stats import TaskCounts, count_tasks
+from .ids import TaskId
+
+
+class TaskStore:
+    """
+    Interface d'un moteur de stockage de tâches
+
+    Le moteur devient propriétaire (Task._owner) des tâches qu'il contient et
+    reçoit leurs changements via _task_changed, qui met à jour le stockage
+    (_on_task_changed) puis prévient l'observateur.
+    """
+
+    # True si le moteur est lié à ses propres fichiers : il est rempli sur
+    # place au chargement d'un JSON au lieu d'être remplacé
+    persistent = False
+    # Appelé avec la tâche après chacun de ses changements (suivi du gestionnaire)
+    observer: Optional[Callable[[Task], None]] = None
+    # Chemin absolu de la base de données du moteur, à ne pas écraser par un export JSON
+    database_file: Optional[str] = None
+
+    def add(self, task: Task) -> None:
+        raise NotImplementedError
+
+    def get(self, task_id: TaskId) -> Optional[Task]:
+        raise NotImplementedError
+
+    def remove(self, task_id: TaskId) -> bool:
+        raise NotImplementedError
+
+    def existing(self, task_ids: Iterable[TaskId]) -> List[TaskId]:
+        """Identifiants présents dans le stockage, sans doublon, dans l'ordre donné"""
+        return [task_id for task_id in dict.fromkeys(task_ids) if self.get(task_id) is not None]
+
+    def add_many(self, tasks: List[Task]) -> None:
+        """Ajoute des tâches déjà validées en un seul appel"""
+        for task in tasks:
+            self.add(task)
+
+    def remove_many(self, task_ids: Iterable[TaskId]) -> int:
+        """Supprime plusieurs tâches, renvoie le nombre de tâches supprimées"""
+        return sum(1 for task_id in task_ids if self.remove(task_id))
+
+    def update_many(
+        self,
+        task_ids: Iterable[TaskId],
+        status: Optional[Status] = None,
+        priority: Optional[Priority] = None
+    ) -> int:
+        """
+        Met à jour statut et/ou priorité de plusieurs tâches
+
+        Tout est vérifié avant la première modification : une priorité ne peut
+        pas être changée sur une tâche terminée (comme Task.update_priority).
+        Passer au statut DONE renseigne completed_at. Les identifiants inconnus
+        sont ignorés.
+
+        Returns:
+            int: Nombre de tâches trouvées
+        """
+        tasks = [task for task in (self.get(task_id) for task_id in task_ids) if task is not None]
+
+        if priority is not None:
+            completed = [task.id for task in tasks if task.status == Status.DONE]
+            if completed:
+                raise ValueError(f"Cannot update priority of completed tasks: {completed}")
+
+        now_us = to_epoch_us(datetime.now())
+        for task in tasks:
+            if priority is not None and task._priority is not priority:
+                old_priority = task._priority
+                task._priority = priority
+                self._on_task_changed(task, "priority", old_priority)
+            if status is not None and task._status is not status:
+                old_status = task._status
+                task._status = status
+                if status is Status.DONE:
+                    task._completed_us = now_us
+                self._on_task_changed(task, "status", old_status)
+
+        return len(tasks)
+
+    def by_status(self, status: Status) -> List[Task]:
+        raise NotImplementedError
+
+    def by_priority(self, priority: Priority) -> List[Task]:
+        raise NotImplementedError
+
+    def by_day(self, day: date) -> List[Task]:
+        """Tâches créées ou terminées le jour donné"""
+        return [
+            task for task in self
+            if (task.created_at.date() == day or
+                (task.completed_at and task.completed_at.date() == day))
+        ]
+
+    def counts(self, day: Optional[date] = None) -> TaskCounts:
+        return count_tasks(self, day=day)
+
+    def recount(self) -> TaskCounts:
+        """Recomptage complet en une passe, indépendant des compteurs maintenus"""
+        return count_tasks(self)
+
+    def clear(self) -> None:
+        raise NotImplementedError
+
+    def replace_all(self, tasks: List[Task]) -> None:
+        """Remplace toutes les tâches (chargement d'un fichier)"""
+        self.clear()
+        self.add_many(tasks)
+
+    def checkpoint(self) -> None:
+        """Rend durables les changements en attente (rien à faire en mémoire)"""
+
+    def close(self) -> None:
+        """Libère les fichiers ouverts par le moteur"""
+
+    def _task_changed(self, task: Task, field: str, old_value: Any) -> None:
+        """Point d'entrée des notifications envoyées par Task"""
+        self._on_task_changed(task, field, old_value)
+        if self.observer is not None:
+            self.observer(task)
+
+    def _on_task_changed(self, task: Task, field: str, old_value: Any) -> None:
+        pass
+
+    def __len__(self) -> int:
+        raise NotImplementedError
+
+    def __iter__(self) -> Iterator[Task]:
+        raise NotImplementedError
+
+
+class MemoryTaskStore(TaskStore):
+    """
+    Stockage en mémoire : index id -> Task et index secondaires
+
+    Le dict principal conserve l'ordre d'insertion. Les buckets par statut et
+    par priorité sont tenus à jour à chaque changement et leurs tailles servent
+    de compteurs pour les statistiques.
+    """
+
+    def __init__(self) -> None:
+        self._tasks: Dict[TaskId, Task] = {}
+        self._by_status: Dict[Status, Dict[TaskId, Task]] = {status: {} for status in Status}
+        self._by_priority: Dict[Priority, Dict[TaskId, Task]] = {priority: {} for priority in Priority}
+
+    def add(self, task: Task) -> None:
+        previous = self._tasks.get(task.id)
+        if previous is not None:
+            self._unindex(previous)
+
+        self._tasks[task.id] = task
+        self._by_status[task.status][task.id] = task
+        self._by_priority[task.priority][task.id] = task
+        task._owner = self
+
+    def get(self, task_id: TaskId) -> Optional[Task]:
+        return self._tasks.get(task_id)
+
+    def existing(self, task_ids: Iterable[TaskId]) -> List[TaskId]:
+        tasks_by_id = self._tasks
+        return [task_id for task_id in dict.fromkeys(task_ids) if task_id in tasks_by_id]
+
+    def remove(self, task_id: TaskId) -> bool:
+        task = self._tasks.get(task_id)
+        if task is None:
+            return False
+
+        self._unindex(task)
+        return True
+
+    def add_many(self, tasks: List[Task]) -> None:
+        tasks_by_id = self._tasks
+        by_status = self._by_status
+        by_priority = self._by_priority
+        for task in tasks:
+            task_id = task.id
+            if task_id in tasks_by_id:
+                self._unindex(tasks_by_id[task_id])
+            tasks_by_id[task_id] = task
+            by_status[task._status][task_id] = task
+            by_priority[task._priority][task_id] = task
+            task._owner = self
+
+    def by_status(self, status: Status) -> List[Task]:
+        return list(self._by_status[status].values())
+
+    def by_priority(self, priority: Priority) -> List[Task]:
+        return list(self._by_priority[priority].values())
+
+    def counts(self, day: Optional[date] = None) -> TaskCounts:
+        if day is not None:
+            return count_tasks(self._tasks.values(), day=day)
+
+        return TaskCounts(
+            len(self._tasks),
+            {status: len(bucket) for status, bucket in self._by_status.items()},
+            {priority: len(bucket) for priority, bucket in self._by_priority.items()}
+        )
+
+    def clear(self) -> None:
+        for task in self._tasks.values():
+            task._owner = None
+        self._tasks.clear()
+        for bucket in self._by_status.values():
+            bucket.clear()
+        for bucket in self._by_priority.values():
+            bucket.clear()
+
+    def _unindex(self, task: Task) -> None:
+        del self._tasks[task.id]
+        self._by_status[task.status].pop(task.id, None)
+        self._by_priority[task.priority].pop(task.id, None)
+        task._owner = None
+
+    def _on_task_changed(self, task: Task, field: str, old_value: Any) -> None:
+        """Déplace la tâche dans le bon bucket après un changement de statut ou de priorité"""
+        if field == "status":
+            del self._by_status[old_value][task.id]
+            self._by_status[task.status][task.id] = task
+        elif field == "priority":
+            del self._by_priority[old_value][task.id]
+            self._by_priority[task.priority][task.id] = task
+
+    def __len__(self) -> int:
+        return len(self._tasks)
+
+    def __iter__(self) -> Iterator[Task]:
+        return iter(self._tasks.values())
+
+
+def create_store(backend: str, path: Optional[str] = None) -> TaskStore:
+    """
+    Instancie le moteur de stockage demandé
+
+    Args:
+        backend: 'memory' (défaut), 'columnar' (NumPy), 'wal' (journal sur
+                 disque), 'sqlite' (base SQLite) ou 'mmap' (instantané binaire)
+        path: Fichier de l'instantané ou de la base, requis par les moteurs persistants
+    """
+    if not isinstance(backend, str):
+        raise TypeError(f"Backend must be a string, got {type(backend)}")
+
+    backend = backend.lower().strip()
+
+    if backend == "memory":
+        return MemoryTaskStore()
+    if backend == "columnar":
+        from .columnar import ColumnarTaskStore
+        return ColumnarTaskStore()
+    if backend == "wal":
+        if path is None:
+            raise ValueError("The 'wal' storage backend requires a snapshot file path")
+        from .journal import JournalTaskStore
+        return JournalTaskStore(path)
+    if backend == "sqlite":
+        if path is None:
+            raise ValueError("The 'sqlite' storage backend requires a database file path")
+        from .sqlite import SqliteTaskStore
+        return SqliteTaskStore(path)
+    if backend == "mmap":
+        if path is None:
+            raise ValueError("The 'mmap' storage backend requires a snapshot file path")
+        from .snapshot import MappedTaskStore
+        return MappedTaskStore(path)
+
+    raise ValueError(f"Unsupported storage backend: {backend}. Supported backends: {STORAGE_BACKENDS}")
+
+
+STORAGE_BACKENDS = ['memory', 'columnar', 'wal', 'sqlite', 'mmap']
@@ -1,8 +1,9 @@
-from datetime import datetime
+from datetime import datetime, timedelta
 from enum import Enum
-from typing import Optional, Dict, Any
-import time
+from functools import lru_cache
+from typing import Optional, Dict, Any, List, Sequence, Tuple
 import re
+from .ids import IdGenerator, MonotonicIdGenerator, TaskId, parse_id
 
 
 class Priority(Enum):
@@ -25,36 +26,239 @@ class Status(Enum):
         return self.value
 
 
+# Valeur JSON -> membre, sans passer par Enum[valeur.upper()]
+PRIORITY_BY_VALUE: Dict[str, Priority] = {priority.value: priority for priority in Priority}
+STATUS_BY_VALUE: Dict[str, Status] = {status.value: status for status in Status}
+
+_INVALID_TITLE_CHARS = re.compile(r'[<>]')
+
+# Attribut privé de chaque champ notifié, pour annuler un changement refusé
+_FIELD_ATTRIBUTES = {
+    "title": "_title",
+    "description": "_description",
+    "project_id": "_project_id",
+    "created_at": "_created_us",
+    "completed_at": "_completed_us",
+    "status": "_status",
+    "priority": "_priority",
+}
+
+_EPOCH = datetime(1970, 1, 1)
+_ONE_MICROSECOND = timedelta(microseconds=1)
+
+
+def to_epoch_us(value: datetime) -> int:
+    """
+    Datetime (heure locale naïve) -> microsecondes depuis 1970-01-01
+
+    Les dates avec fuseau sont refusées : converties en heure locale, elles
+    perdraient leur décalage et to_dict ne rendrait plus la même date.
+    """
+    if value.tzinfo is not None:
+        raise ValueError(f"Timezone-aware datetimes are not supported, use naive local time: {value.isoformat()}")
+    return (value - _EPOCH) // _ONE_MICROSECOND
+
+
+def from_epoch_us(value: int) -> datetime:
+    """Microsecondes depuis 1970-01-01 -> datetime naïf"""
+    return _EPOCH + timedelta(microseconds=value)
+
+
+@lru_cache(maxsize=65536)
+def parse_iso_us(value: str) -> int:
+    """
+    Date ISO 8601 -> microsecondes depuis 1970-01-01, mémorisée
+    
+    Les tâches créées ou terminées ensemble partagent la même date : au
+    chargement, chaque date distincte n'est analysée qu'une fois.
+    """
+    return to_epoch_us(datetime.fromisoformat(value))
+
+
 class Task:
-    """Une tâche avec toutes ses propriétés"""
+    """
+    Une tâche avec toutes ses propriétés
+    
+    Représentation compacte : __slots__ au lieu d'un __dict__ par instance,
+    dates stockées en microsecondes (entiers) et converties en datetime à la lecture.
+    """
+    
+    __slots__ = (
+        "id", "_title", "_description", "_priority", "_status",
+        "_created_us", "_completed_us", "_project_id", "_owner", "__weakref__"
+    )
     
     MAX_TITLE_LENGTH = 100
     MIN_TITLE_LENGTH = 1
     
+    # Générateur d'identifiants, remplaçable. Celui par défaut n'est unique qu'au sein
+    # d'un processus ; plusieurs processus : Task.id_generator = SnowflakeIdGenerator(worker_id=n),
+    # un worker_id distinct par processus
+    id_generator: IdGenerator = MonotonicIdGenerator()
+    
     def __init__(
         self, 
         title: str, 
         description: str = "", 
         priority: Priority = Priority.MEDIUM
     ) -> None:
-        self._validate_title(title)
+        clean_title = self._validate_title(title)
         self._validate_priority(priority)
         
-        self.id: float = time.time()
-        self.title: str = title.strip()
-        self.description: str = description.strip()
-        self.priority: Priority = priority
-        self.created_at: datetime = datetime.now()
-        self.status: Status = Status.TODO
-        self.completed_at: Optional[datetime] = None
-        self.project_id: Optional[float] = None
+        self.id: TaskId = self.id_generator.next_id()
+        self._title: str = clean_title
+        self._description: str = description.strip()
+        self._priority: Priority = priority
+        self._created_us: int = to_epoch_us(datetime.now())
+        self._status: Status = Status.TODO
+        self._completed_us: Optional[int] = None
+        self._project_id: Optional[float] = None
+        # Stockage propriétaire, notifié à chaque changement de la tâche
+        self._owner: Optional[Any] = None
+    
+    @classmethod
+    def create_many(
+        cls,
+        titles: Sequence[str],
+        descriptions: Optional[Sequence[str]] = None,
+        priorities: Optional[Sequence[Priority]] = None
+    ) -> List["Task"]:
+        """
+        Crée plusieurs tâches, validées ensemble
+        
+        Les titres sont contrôlés sur toute la liste en une passe (types,
+        longueurs, caractères interdits), les identifiants réservés en bloc
+        et l'horloge lue une seule fois pour toutes les dates de création.
+        Si un élément est invalide, aucune tâche n'est créée.
+        
+        Raises:
+            TypeError, ValueError: Comme Task(), avec l'index de l'élément invalide
+        """
+        titles = list(titles)
+        count = len(titles)
+        descriptions = [""] * count if descriptions is None else list(descriptions)
+        priorities = [Priority.MEDIUM] * count if priorities is None else list(priorities)
+        if len(descriptions) != count or len(priorities) != count:
+            raise ValueError("titles, descriptions and priorities must have the same length")
+        
+        valid = (
+            all(isinstance(title, str) for title in titles) and
+            all(isinstance(priority, Priority) for priority in priorities)
+        )
+        if valid:
+            clean_titles = [title.strip() for title in titles]
+            lengths = list(map(len, clean_titles))
+            valid = not lengths or (
+                min(lengths) >= max(cls.MIN_TITLE_LENGTH, 1) and
+                max(lengths) <= cls.MAX_TITLE_LENGTH and
+                _INVALID_TITLE_CHARS.search("".join(clean_titles)) is None
+            )
+        if not valid:
+            # Contrôle élément par élément, seulement pour trouver le fautif
+            for i, (title, priority) in enumerate(zip(titles, priorities)):
+                try:
+                    cls._validate_title(title)
+                    cls._validate_priority(priority)
+                except (TypeError, ValueError) as e:
+                    raise type(e)(f"Invalid task at index {i}: {str(e)}") from e
+        
+        clean_descriptions = [description.strip() for description in descriptions]
+        ids = cls.id_generator.next_ids(count)
+        created_us = to_epoch_us(datetime.now())
+        from_fields = cls._from_fields
+        todo = Status.TODO
+        return [
+            from_fields(task_id, title, description, priority, todo, created_us, None, None)
+            for task_id, title, description, priority in zip(ids, clean_titles, clean_descriptions, priorities)
+        ]
+    
+    @property
+    def title(self) -> str:
+        return self._title
+    
+    @title.setter
+    def title(self, value: str) -> None:
+        old_value = self._title
+        self._title = value
+        self._notify("title", old_value)
+    
+    @property
+    def description(self) -> str:
+        return self._description
+    
+    @description.setter
+    def description(self, value: str) -> None:
+        old_value = self._description
+        self._description = value
+        self._notify("description", old_value)
+    
+    @property
+    def project_id(self) -> Optional[float]:
+        return self._project_id
+    
+    @project_id.setter
+    def project_id(self, value: Optional[float]) -> None:
+        old_value = self._project_id
+        self._project_id = value
+        self._notify("project_id", old_value)
+    
+    @property
+    def created_at(self) -> datetime:
+        return from_epoch_us(self._created_us)
+    
+    @created_at.setter
+    def created_at(self, value: datetime) -> None:
+        old_value = getattr(self, "_created_us", None)
+        self._created_us = to_epoch_us(value)
+        self._notify("created_at", old_value)
+    
+    @property
+    def completed_at(self) -> Optional[datetime]:
+        if self._completed_us is None:
+            return None
+        return from_epoch_us(self._completed_us)
+    
+    @completed_at.setter
+    def completed_at(self, value: Optional[datetime]) -> None:
+        old_value = getattr(self, "_completed_us", None)
+        self._completed_us = to_epoch_us(value) if value is not None else None
+        self._notify("completed_at", old_value)
+    
+    @property
+    def status(self) -> Status:
+        return self._status
+    
+    @status.setter
+    def status(self, new_status: Status) -> None:
+        old_status = self._status
+        self._status = new_status
+        if old_status is not new_status:
+            self._notify("status", old_status)
+    
+    @property
+    def priority(self) -> Priority:
+        return self._priority
+    
+    @priority.setter
+    def priority(self, new_priority: Priority) -> None:
+        old_priority = self._priority
+        self._priority = new_priority
+        if old_priority is not new_priority:
+            self._notify("priority", old_priority)
     
     def mark_completed(self) -> None:
         if self.status == Status.DONE:
             raise ValueError("Task is already completed")
         
-        self.status = Status.DONE
-        self.completed_at = datetime.now()
+        old_status = self._status
+        old_completed_us = self._completed_us
+        self._status = Status.DONE
+        self._completed_us = to_epoch_us(datetime.now())
+        try:
+            self._notify("status", old_status)
+        except BaseException:
+            self._completed_us = old_completed_us
+            raise
     
     def update_priority(self, new_priority: Priority) -> None:
         if not isinstance(new_priority, Priority):
@@ -83,8 +287,31 @@ class Task:
             "project_id": self.project_id if self.project_id else None
         }
     
+    def to_record(self) -> Dict[str, Any]:
+        """Comme to_dict, avec les dates en datetime : les codecs JSON les écrivent eux-mêmes"""
+        return {
+            "id": self.id,
+            "title": self._title,
+            "description": self._description,
+            "priority": self._priority.value,
+            "status": self._status.value,
+            "created_at": from_epoch_us(self._created_us),
+            "completed_at": None if self._completed_us is None else from_epoch_us(self._completed_us),
+            "project_id": self._project_id if self._project_id else None
+        }
+    
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Task":
+        return cls.parse_dict(data)[0]
+    
+    @classmethod
+    def parse_dict(cls, data: Dict[str, Any]) -> Tuple["Task", bool]:
+        """
+        Comme from_dict, indique aussi si le dictionnaire était déjà canonique
+        
+        Canonique : tel qu'écrit par to_dict (identifiant numérique, priorité
+        et statut en valeurs), from_trusted_dict en donnerait la même tâche.
+        """
         if not isinstance(data, dict):
             raise TypeError("Data must be a dictionary")
         
@@ -94,52 +321,128 @@ class Task:
                 raise ValueError(f"Missing required field: {field}")
         
         task = cls.__new__(cls)
+        task._owner = None
         
-        task.id = float(data["id"])
-        task.title = data["title"]
-        task.description = data.get("description", "")
+        try:
+            task.id = parse_id(data["id"])
+        except (TypeError, ValueError):
+            raise ValueError(f"Invalid id: {data['id']}")
+        task._title = data["title"]
+        task._description = data.get("description", "")
         
         try:
-            task.priority = Priority[data["priority"].upper()]
+            task._priority = PRIORITY_BY_VALUE.get(data["priority"]) or Priority[data["priority"].upper()]
         except KeyError:
             raise ValueError(f"Invalid priority: {data['priority']}")
         
         try:
-            task.status = Status[data["status"].upper()]
+            task._status = STATUS_BY_VALUE.get(data["status"]) or Status[data["status"].upper()]
         except KeyError:
             raise ValueError(f"Invalid status: {data['status']}")
         
-        task.created_at = datetime.fromisoformat(data["created_at"])
+        task._created_us = parse_iso_us(data["created_at"])
         
-        task.completed_at = (
-            datetime.fromisoformat(data["completed_at"]) 
+        task._completed_us = (
+            parse_iso_us(data["completed_at"]) 
             if data.get("completed_at") 
             else None
         )
         
-        task.project_id = float(data["project_id"]) if data.get("project_id") else None
+        task._project_id = float(data["project_id"]) if data.get("project_id") else None
         
+        canonical = (
+            type(data["id"]) in (int, float) and
+            data["priority"] in PRIORITY_BY_VALUE and
+            data["status"] in STATUS_BY_VALUE
+        )
+        return task, canonical
+    
+    @classmethod
+    def from_trusted_dict(cls, data: Dict[str, Any]) -> "Task":
+        """
+        Recrée une tâche sans vérification, depuis un dictionnaire écrit par to_dict
+        
+        Pour les chargements en masse d'un fichier déjà validé : ni contrôle
+        des champs, ni normalisation de l'identifiant ou de la casse. Une
+        donnée invalide lève KeyError, TypeError ou ValueError.
+        """
+        task = cls.__new__(cls)
+        task.id = data["id"]
+        task._title = data["title"]
+        task._description = data.get("description", "")
+        task._priority = PRIORITY_BY_VALUE[data["priority"]]
+        task._status = STATUS_BY_VALUE[data["status"]]
+        task._created_us = parse_iso_us(data["created_at"])
+        completed_at = data.get("completed_at")
+        task._completed_us = parse_iso_us(completed_at) if completed_at else None
+        project_id = data.get("project_id")
+        task._project_id = float(project_id) if project_id else None
+        task._owner = None
+        return task
+    
+    @classmethod
+    def _from_fields(
+        cls,
+        task_id: TaskId,
+        title: str,
+        description: str,
+        priority: Priority,
+        status: Status,
+        created_us: int,
+        completed_us: Optional[int],
+        project_id: Optional[float]
+    ) -> "Task":
+        """Reconstruit une tâche sans validation, depuis des champs déjà validés par un stockage"""
+        task = cls.__new__(cls)
+        task.id = task_id
+        task._title = title
+        task._description = description
+        task._priority = priority
+        task._status = status
+        task._created_us = created_us
+        task._completed_us = completed_us
+        task._project_id = project_id
+        task._owner = None
         return task
     
-    def _validate_title(self, title: str) -> None:
+    def _notify(self, field: str, old_value: Any) -> None:
+        """
+        Prévient le stockage propriétaire qu'un champ de la tâche a changé
+
+        Si le stockage refuse le changement (écriture du journal en échec),
+        l'ancienne valeur est rétablie avant de propager l'erreur.
+        """
+        if self._owner is not None:
+            try:
+                self._owner._task_changed(self, field, old_value)
+            except BaseException:
+                setattr(self, _FIELD_ATTRIBUTES[field], old_value)
+                raise
+    
+    @classmethod
+    def _validate_title(cls, title: str) -> str:
+        """Vérifie le titre et le renvoie sans espaces autour"""
         if not isinstance(title, str):
             raise TypeError(f"Title must be a string, got {type(title)}")
         
-        if not title or not title.strip():
-            raise ValueError("Title cannot be empty or whitespace only")
-        
         clean_title = title.strip()
         
-        if len(clean_title) < self.MIN_TITLE_LENGTH:
-            raise ValueError(f"Title must be at least {self.MIN_TITLE_LENGTH} character")
+        if not clean_title:
+            raise ValueError("Title cannot be empty or whitespace only")
+        
+        if len(clean_title) < cls.MIN_TITLE_LENGTH:
+            raise ValueError(f"Title must be at least {cls.MIN_TITLE_LENGTH} character")
         
-        if len(clean_title) > self.MAX_TITLE_LENGTH:
-            raise ValueError(f"Title cannot exceed {self.MAX_TITLE_LENGTH} characters, got {len(clean_title)}")
+        if len(clean_title) > cls.MAX_TITLE_LENGTH:
+            raise ValueError(f"Title cannot exceed {cls.MAX_TITLE_LENGTH} characters, got {len(clean_title)}")
         
-        if re.search(r'[<>]', clean_title):
+        if _INVALID_TITLE_CHARS.search(clean_title):
             raise ValueError("Title contains invalid characters ('<', '>'). Please remove HTML tags for security")
+        
+        return clean_title
     
-    def _validate_priority(self, priority: Priority) -> None:
+    @staticmethod
+    def _validate_priority(priority: Priority) -> None:
         if not isinstance(priority, Priority):
             raise TypeError(f"Priority must be a Priority enum, got {type(priority)}")
     
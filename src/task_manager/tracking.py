@@ -0,0 +1,90 @@
+# src/task_manager/tracking.py
+import os
+from typing import Dict, Iterable, Optional, Set
+from .task import Task
+from .ids import TaskId
+
+
+class ChangeTracker:
+    """
+    Suivi des tâches modifiées depuis la dernière sauvegarde complète
+
+    La référence (baseline) est le fichier dont le contenu, complété par son
+    fichier delta, correspond aux tâches en mémoire. changed contient les
+    tâches ajoutées ou modifiées depuis, dans l'ordre du premier changement,
+    deleted les tâches supprimées. Le texte JSON de chaque tâche non modifiée
+    est gardé en cache pour ne pas la réencoder à la sauvegarde suivante.
+    """
+
+    def __init__(self) -> None:
+        self.baseline: Optional[str] = None
+        self.baseline_saved_at: Optional[str] = None
+        self.changed: Dict[TaskId, None] = {}
+        self.deleted: Set[TaskId] = set()
+        self._encoded: Dict[TaskId, str] = {}
+        self._encoded_compact = False
+
+    def task_changed(self, task: Task) -> None:
+        """Appelé par le stockage à chaque changement d'une tâche"""
+        task_id = task.id
+        self.changed[task_id] = None
+        self.deleted.discard(task_id)
+        self._encoded.pop(task_id, None)
+
+    def mark(self, task_ids: Iterable[TaskId]) -> None:
+        """Tâches ajoutées ou modifiées"""
+        for task_id in task_ids:
+            self.changed[task_id] = None
+            self.deleted.discard(task_id)
+            self._encoded.pop(task_id, None)
+
+    def forget(self, task_ids: Iterable[TaskId]) -> None:
+        """Tâches supprimées"""
+        for task_id in task_ids:
+            self.changed.pop(task_id, None)
+            self.deleted.add(task_id)
+            self._encoded.pop(task_id, None)
+
+    def invalidate(self) -> None:
+        """Plus aucune référence : la prochaine sauvegarde sera complète"""
+        self.baseline = None
+        self.baseline_saved_at = None
+        self.changed.clear()
+        self.deleted.clear()
+        self._encoded.clear()
+
+    def reset(
+        self,
+        baseline: str,
+        saved_at: Optional[str],
+        changed: Iterable[TaskId] = (),
+        deleted: Iterable[TaskId] = (),
+        keep_encoded: bool = False
+    ) -> None:
+        """
+        Nouvelle référence, après une sauvegarde complète ou un chargement
+
+        Le cache JSON est vidé : après un chargement, une tâche de même
+        identifiant peut avoir un autre contenu. keep_encoded seulement quand
+        le cache vient d'être rempli avec les tâches en mémoire (sauvegarde).
+        """
+        self.baseline = os.path.abspath(baseline)
+        self.baseline_saved_at = saved_at
+        self.changed = dict.fromkeys(changed)
+        self.deleted = set(deleted)
+        if not keep_encoded:
+            self._encoded.clear()
+
+    def is_baseline(self, filename: str) -> bool:
+        return self.baseline is not None and self.baseline == os.path.abspath(filename)
+
+    def encoded_cache(self, compact: bool) -> Dict[TaskId, str]:
+        """Cache id -> texte JSON, vidé si le format (compact ou indenté) change"""
+        if compact != self._encoded_compact:
+            self._encoded.clear()
+            self._encoded_compact = compact
+        return self._encoded
+
+    def __len__(self) -> int:
+        """Nombre de changements depuis la référence"""
+        return len(self.changed) + len(self.deleted)
@@ -0,0 +1,90 @@
+import pytest
+from datetime import datetime, timedelta
+from src.task_manager.task import Priority, Status
+from src.task_manager.manager import TaskManager
+from src.task_manager.services import ReportService
+from src.task_manager.columnar import NUMPY_AVAILABLE
+
+
+BACKENDS = [
+    "memory",
+    pytest.param("columnar", marks=pytest.mark.skipif(not NUMPY_AVAILABLE, reason="numpy n'est pas installé")),
+    "wal",
+    "sqlite",
+    "mmap",
+]
+
+
+@pytest.fixture(params=BACKENDS)
+def manager(request, tmp_path):
+    """Fixture: gestionnaire vide sur chaque moteur de stockage"""
+    manager = TaskManager(str(tmp_path / "tasks.db"), backend=request.param)
+    yield manager
+    manager.close()
+
+
+@pytest.mark.unit
+class TestStorageBackendConformance:
+    """Tests communs à tous les moteurs : même comportement que le stockage en mémoire"""
+
+    def test_add_get_delete_should_behave_like_memory_backend(self, manager):
+        """Test opérations de base"""
+        task_id = manager.add_task("Tâche", "Description", Priority.HIGH)
+
+        task = manager.get_task(task_id)
+
+        assert task.title == "Tâche"
+        assert task.description == "Description"
+        assert task.priority == Priority.HIGH
+        assert manager.get_task(str(task_id)) is task
+        assert manager.delete_task(task_id) is True
+        assert manager.delete_task(task_id) is False
+        assert manager.get_task(task_id) is None
+        assert len(manager) == 0
+
+    def test_statistics_should_match_single_pass_recount(self, manager):
+        """Test statistiques du moteur identiques au recomptage"""
+        ids = manager.add_tasks([(f"Tâche {i}", "", list(Priority)[i % 4]) for i in range(20)])
+        for task_id in ids[:5]:
+            manager.get_task(task_id).mark_completed()
+        manager.get_task(ids[6]).status = Status.CANCELLED
+
+        stats = manager.get_statistics(recompute=True)
+
+        assert stats["total_tasks"] == 20
+        assert stats["completed_tasks"] == 5
+        assert stats["cancelled_tasks"] == 1
+        assert stats["priority_distribution"] == {"low": 5, "medium": 5, "high": 5, "urgent": 5}
+
+    def test_daily_report_should_count_by_date(self, manager):
+        """Test rapport journalier et filtre par date"""
+        manager.add_task("Aujourd'hui")
+        old_id = manager.add_task("Ancienne")
+        manager.get_task(old_id).created_at = datetime.now() - timedelta(days=10)
+
+        report = ReportService().generate_daily_report(manager)
+
+        assert report["total_tasks"] == 2
+        assert report["tasks_for_date"] == 1
+        assert report["created_today"] == 1
+        assert len(manager.get_tasks_by_date(datetime.now())) == 1
+
+    def test_bulk_operations_should_update_held_tasks(self, manager):
+        """Test opérations en bloc, visibles sur les tâches déjà obtenues"""
+        ids = manager.add_tasks([f"Tâche {i}" for i in range(10)])
+        held = manager.get_task(ids[1])
+
+        manager.bulk_update(ids[:5], priority=Priority.HIGH)
+        manager.bulk_update(ids[:3], status=Status.DONE)
+        deleted = manager.delete_tasks(ids[8:] + [123.0])
+
+        assert deleted == 2
+        assert held.priority == Priority.HIGH
+        assert held.status == Status.DONE
+        assert held.completed_at is not None
+        assert len(manager.get_tasks_by_priority(Priority.HIGH)) == 5
+        assert manager.get_statistics(recompute=True)["completed_tasks"] == 3
+        with pytest.raises(ValueError, match="Cannot update priority of completed tasks"):
+            manager.bulk_update(ids[:4], priority=Priority.LOW)
+        assert manager.get_task(ids[3]).priority == Priority.HIGH
+        assert [task.id for task in manager] == ids[:8]
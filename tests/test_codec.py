@@ -0,0 +1,82 @@
+import pytest
+import json
+from unittest.mock import patch
+from src.task_manager.codec import get_codec, available_codecs, JsonCodec
+from src.task_manager.manager import TaskManager
+from src.task_manager.services import ExportService
+from src.task_manager.task import Task, Priority
+
+
+@pytest.mark.unit
+class TestJsonCodec:
+    """Tests des codecs JSON interchangeables"""
+
+    @pytest.mark.parametrize("name", available_codecs())
+    @pytest.mark.parametrize("indent", [True, False])
+    def test_dumps_should_match_stdlib_output(self, name, indent):
+        """Test même texte que json.dumps, dates écrites comme isoformat()"""
+        task = Task("Tâche é", "Description", Priority.HIGH)
+        task.mark_completed()
+        document = {"tasks": [task.to_record()], "metadata": {"total_tasks": 1}, "empty": []}
+        expected = {"tasks": [task.to_dict()], "metadata": {"total_tasks": 1}, "empty": []}
+
+        encoded = get_codec(name).dumps(document, indent=indent)
+
+        if indent:
+            assert encoded == json.dumps(expected, indent=2, ensure_ascii=False).encode('utf-8')
+        else:
+            assert encoded == json.dumps(expected, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+        assert get_codec(name).loads(encoded) == expected
+
+    @pytest.mark.parametrize("name", available_codecs())
+    def test_invalid_document_should_raise_json_decode_error(self, name):
+        """Test erreur de décodage identique pour tous les codecs"""
+        with pytest.raises(json.JSONDecodeError):
+            get_codec(name).loads(b'{"tasks": [')
+
+    def test_default_codec_should_be_fastest_available(self):
+        """Test choix par défaut et noms invalides"""
+        assert get_codec().name == available_codecs()[0]
+        assert available_codecs()[-1] == "json"
+        assert isinstance(get_codec("json"), JsonCodec)
+        with pytest.raises(ValueError, match="Unknown JSON codec"):
+            get_codec("yaml")
+
+    @pytest.mark.parametrize("name", available_codecs())
+    @pytest.mark.parametrize("compact", [False, True])
+    def test_streaming_save_should_use_codec(self, tmp_path, name, compact):
+        """Test sauvegarde en streaming encodée par le codec, identique à la sauvegarde complète"""
+        manager = TaskManager(str(tmp_path / "tasks.json"), codec=name)
+        ids = manager.add_tasks([f"Tâche é {i}" for i in range(5)])
+        manager.get_task(ids[1]).mark_completed()
+        manager.SAVE_BATCH_SIZE = 2
+        full, streamed = str(tmp_path / "full.json"), str(tmp_path / "streamed.json")
+
+        with patch.object(manager, '_get_current_time_iso', return_value="2024-01-01T00:00:00"):
+            manager.save_to_file(full, compact=compact)
+            with patch.object(type(manager._codec), 'item_encoder', autospec=True,
+                              side_effect=type(manager._codec).item_encoder) as mock_item_encoder:
+                manager.save_to_file(streamed, streaming=True, compact=compact)
+
+        mock_item_encoder.assert_called_once_with(manager._codec, compact)
+        with open(full, 'rb') as f1, open(streamed, 'rb') as f2:
+            assert f1.read() == f2.read()
+
+    @pytest.mark.parametrize("writer", available_codecs())
+    @pytest.mark.parametrize("reader", available_codecs())
+    def test_files_should_be_readable_by_any_codec(self, tmp_path, writer, reader):
+        """Test fichiers sauvegardés et exportés lisibles quel que soit le codec"""
+        path = str(tmp_path / "tasks.json")
+        manager = TaskManager(path, codec=writer)
+        ids = manager.add_tasks(["Une", "Deux"])
+        manager.get_task(ids[0]).mark_completed()
+        manager.save_to_file()
+        ExportService(codec=writer).export_tasks(manager.get_all_tasks(), str(tmp_path / "export.json"))
+
+        loaded = TaskManager(path, codec=reader)
+        loaded.load_from_file(trusted=False)
+
+        assert [task.to_dict() for task in loaded] == [task.to_dict() for task in manager]
+        with open(tmp_path / "export.json", 'rb') as file:
+            exported = get_codec(reader).loads(file.read())
+        assert exported["tasks"][0]["completed_at"] == manager.get_task(ids[0]).completed_at.isoformat()
@@ -0,0 +1,95 @@
+import pytest
+import gc
+from src.task_manager.task import Task, Priority, Status
+from src.task_manager.manager import TaskManager
+from src.task_manager.ids import SnowflakeIdGenerator
+from src.task_manager import columnar
+
+pytest.importorskip("numpy")
+
+
+@pytest.fixture
+def manager(tmp_path):
+    """Fixture: gestionnaire avec stockage colonne"""
+    return TaskManager(str(tmp_path / "tasks.json"), backend="columnar")
+
+
+@pytest.mark.unit
+class TestColumnarTaskStore:
+    """Tests propres au moteur colonne NumPy (comportement commun : test_backends.py)"""
+
+    def test_changes_on_materialized_task_should_be_written_back(self, manager):
+        """Test changements réécrits dans les colonnes après libération de l'objet"""
+        task_id = manager.add_task("Tâche", priority=Priority.LOW)
+        manager.get_task(task_id).update_priority(Priority.URGENT)
+        manager.get_task(task_id).mark_completed()
+        manager.get_task(task_id).assign_to_project(42)
+        gc.collect()
+
+        task = manager.get_task(task_id)
+
+        assert task.priority == Priority.URGENT
+        assert task.status == Status.DONE
+        assert task.completed_at is not None
+        assert task.project_id == 42.0
+        assert manager.get_tasks_by_status(Status.DONE) == [task]
+        assert manager.get_tasks_by_priority(Priority.LOW) == []
+
+    def test_compaction_should_keep_order_and_lookups(self, manager, monkeypatch):
+        """Test compactage des suppressions"""
+        monkeypatch.setattr(columnar.ColumnarTaskStore, "INITIAL_CAPACITY", 4)
+        manager = TaskManager(manager._storage_file, backend="columnar")
+        ids = [manager.add_task(f"Tâche {i}") for i in range(50)]
+
+        for task_id in ids[:40]:
+            manager.delete_task(task_id)
+
+        assert [task.id for task in manager] == ids[40:]
+        assert manager.get_task(ids[45]).title == "Tâche 45"
+        assert manager._store._size < 50
+
+    def test_string_pools_should_release_unused_strings(self, manager, monkeypatch):
+        """Test chaînes remplacées ou supprimées libérées des pools"""
+        monkeypatch.setattr(columnar.ColumnarTaskStore, "INITIAL_CAPACITY", 4)
+        manager = TaskManager(manager._storage_file, backend="columnar")
+        ids = [manager.add_task(f"Tâche {i}", f"Description {i}") for i in range(20)]
+        task = manager.get_task(ids[0])
+
+        for version in range(100):
+            task.title = f"Titre {version}"
+            task.description = f"Version {version}"
+        manager.delete_tasks(ids[1:15])
+        gc.collect()
+
+        store = manager._store
+        assert len(store._titles) <= 2 * len(manager)
+        assert len(store._descriptions) <= 2 * len(manager)
+        assert manager.get_task(ids[0]).title == "Titre 99"
+        assert manager.get_task(ids[0]).description == "Version 99"
+        assert [task.title for task in manager][1:] == [f"Tâche {i}" for i in range(15, 20)]
+
+    def test_snowflake_ids_should_be_stored_exactly(self, manager, monkeypatch):
+        """Test identifiants entiers 64 bits"""
+        monkeypatch.setattr(Task, "id_generator", SnowflakeIdGenerator(worker_id=7))
+        task_id = manager.add_task("Tâche Snowflake")
+        gc.collect()
+
+        assert manager.get_task(task_id).id == task_id
+        assert [task.id for task in manager] == [task_id]
+
+
+@pytest.mark.unit
+class TestStorageBackendSelection:
+    """Tests du choix du moteur de stockage"""
+
+    def test_unknown_backend_should_raise_error(self, tmp_path):
+        """Test moteur inconnu"""
+        with pytest.raises(ValueError, match="Unsupported storage backend"):
+            TaskManager(str(tmp_path / "tasks.json"), backend="unknown")
+
+    def test_columnar_backend_without_numpy_should_raise_error(self, tmp_path, monkeypatch):
+        """Test message clair si NumPy est absent"""
+        monkeypatch.setattr(columnar, "NUMPY_AVAILABLE", False)
+
+        with pytest.raises(ImportError, match="numpy library is required"):
+            TaskManager(str(tmp_path / "tasks.json"), backend="columnar")
@@ -0,0 +1,137 @@
+import pytest
+import gzip
+import json
+import os
+import xml.etree.ElementTree as ET
+from src.task_manager import compression as compression_module
+from src.task_manager.compression import detect_compression, strip_compression_suffix
+from src.task_manager.manager import TaskManager
+from src.task_manager.services import ExportService
+from src.task_manager.task import Priority
+
+INSTALLED = ["gzip"] + [
+    name for name, available in (
+        ("zstd", compression_module.ZSTANDARD_AVAILABLE), ("lz4", compression_module.LZ4_AVAILABLE)
+    ) if available
+]
+
+
+@pytest.fixture
+def manager(tmp_path):
+    """Fixture: gestionnaire de 200 tâches"""
+    manager = TaskManager(str(tmp_path / "tasks.json"))
+    ids = manager.add_tasks([(f"Tâche {i}", "Description répétée", list(Priority)[i % 4]) for i in range(200)])
+    manager.get_task(ids[0]).mark_completed()
+    return manager
+
+
+@pytest.mark.unit
+class TestDetectCompression:
+    """Tests du choix du format de compression"""
+
+    @pytest.mark.parametrize("path, requested, expected", [
+        ("tasks.json", None, None),
+        ("tasks.json.gz", None, "gzip"),
+        ("tasks.json.zst", None, "zstd"),
+        ("tasks.xml.lz4", None, "lz4"),
+        ("tasks.json", "GZIP", "gzip"),
+        ("tasks.json.gz", "none", None),
+    ])
+    def test_compression_should_follow_parameter_then_extension(self, path, requested, expected):
+        """Test paramètre prioritaire sur l'extension"""
+        assert detect_compression(path, requested) == expected
+
+    def test_unknown_compression_should_raise_error(self):
+        """Test format inconnu"""
+        with pytest.raises(ValueError, match="Unsupported compression: bz2"):
+            detect_compression("tasks.json", "bz2")
+        assert strip_compression_suffix("tasks.json.zst") == "tasks.json"
+
+    @pytest.mark.skipif(compression_module.ZSTANDARD_AVAILABLE, reason="zstandard installé")
+    def test_missing_library_should_raise_import_error(self, manager, tmp_path):
+        """Test bibliothèque absente"""
+        with pytest.raises(RuntimeError, match="zstandard library is required"):
+            manager.save_to_file(str(tmp_path / "tasks.json.zst"))
+
+
+@pytest.mark.integration
+class TestCompressedFiles:
+    """Tests de sauvegarde, chargement et export compressés"""
+
+    @pytest.mark.parametrize("name", INSTALLED)
+    @pytest.mark.parametrize("streaming", [False, True])
+    def test_save_and_load_should_round_trip(self, manager, tmp_path, name, streaming):
+        """Test aller-retour compressé, complet et en streaming"""
+        path = str(tmp_path / f"tasks.json{compression_module.SUFFIXES[name]}")
+        plain = str(tmp_path / "plain.json")
+
+        manager.save_to_file(path, streaming=streaming)
+        manager.save_to_file(plain, streaming=streaming)
+        loaded = TaskManager(path)
+        loaded.load_from_file(path, streaming=streaming)
+
+        assert os.path.getsize(path) < os.path.getsize(plain) / 4
+        assert [task.to_dict() for task in loaded] == [task.to_dict() for task in manager]
+
+    def test_gzip_file_should_be_readable_by_standard_tools(self, manager, tmp_path):
+        """Test fichier .gz standard, niveau de compression réglable"""
+        fast = str(tmp_path / "fast.json.gz")
+        small = str(tmp_path / "small.json.gz")
+
+        manager.save_to_file(fast, streaming=True, compression_level=1)
+        manager.save_to_file(small, streaming=True, compression_level=9)
+
+        with gzip.open(fast, 'rt', encoding='utf-8') as file:
+            assert json.load(file)["metadata"]["total_tasks"] == 200
+        assert os.path.getsize(small) <= os.path.getsize(fast)
+
+    def test_explicit_compression_should_ignore_extension(self, manager, tmp_path):
+        """Test compression demandée par paramètre"""
+        path = str(tmp_path / "tasks.data")
+
+        manager.save_to_file(path, compression="gzip")
+
+        with open(path, 'rb') as file:
+            assert file.read(2) == b"\x1f\x8b"
+        loaded = TaskManager(path)
+        loaded.load_from_file(path, compression="gzip")
+        assert len(loaded) == 200
+
+    def test_corrupted_compressed_file_should_raise_error(self, tmp_path):
+        """Test fichier .gz invalide"""
+        path = tmp_path / "tasks.json.gz"
+        path.write_bytes(b"not gzip data")
+
+        with pytest.raises(RuntimeError, match="Unexpected error while loading tasks"):
+            TaskManager(str(path)).load_from_file(str(path))
+
+    @pytest.mark.parametrize("format_type", ["json", "xml"])
+    def test_export_should_compress_json_and_xml(self, manager, tmp_path, format_type):
+        """Test export compressé, extension complétée"""
+        service = ExportService()
+
+        assert service.export_tasks(manager.get_all_tasks(), str(tmp_path / "export"), format_type,
+                                    compression="gzip") is True
+
+        path = str(tmp_path / f"export.{format_type}.gz")
+        assert service.get_export_history()[-1]["filename"] == path
+        with gzip.open(path, 'rb') as file:
+            content = file.read()
+        if format_type == "json":
+            assert json.loads(content)["metadata"]["total_tasks"] == 200
+        else:
+            assert ET.fromstring(content).find("Metadata/TotalTasks").text == "200"
+
+    def test_export_format_should_be_detected_before_compression_suffix(self, manager, tmp_path):
+        """Test format déduit de export.xml.gz"""
+        path = str(tmp_path / "export.xml.gz")
+
+        ExportService().export_tasks(manager.get_all_tasks(), path)
+
+        with gzip.open(path, 'rb') as file:
+            assert file.read().startswith(b"<?xml")
+
+    def test_xlsx_export_should_reject_compression(self, manager, tmp_path):
+        """Test Excel déjà compressé"""
+        with pytest.raises(ValueError, match="Compression is not supported for xlsx"):
+            ExportService().export_tasks(manager.get_all_tasks(), str(tmp_path / "export.xlsx.gz"))
@@ -0,0 +1,141 @@
+import pytest
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from src.task_manager.ids import MonotonicIdGenerator, SnowflakeIdGenerator, parse_id
+from src.task_manager.task import Task
+from src.task_manager.manager import TaskManager
+
+
+def snowflake_ids(worker_id, count):
+    """Identifiants produits dans un processus de travail"""
+    generator = SnowflakeIdGenerator(worker_id=worker_id)
+    return [generator.next_id() for _ in range(count)]
+
+
+@pytest.mark.unit
+class TestMonotonicIdGenerator:
+    """Tests du générateur float monotone (format historique)"""
+
+    def test_next_id_with_frozen_clock_should_not_collide(self):
+        """Test horloge figée : identifiants distincts et croissants"""
+        generator = MonotonicIdGenerator(clock=lambda: 1700000000.0)
+
+        ids = [generator.next_id() for _ in range(1000)]
+
+        assert len(set(ids)) == 1000
+        assert ids == sorted(ids)
+        assert all(isinstance(task_id, float) for task_id in ids)
+
+    def test_next_id_should_be_unique_across_threads(self):
+        """Test unicité avec plusieurs threads"""
+        generator = MonotonicIdGenerator()
+        ids = []
+
+        def worker():
+            ids.extend(generator.next_id() for _ in range(2000))
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(set(ids)) == 8000
+
+    def test_next_ids_should_continue_after_next_id(self):
+        """Test réservation en bloc : croissante et sans collision avec next_id"""
+        generator = MonotonicIdGenerator(clock=lambda: 1700000000.0)
+
+        ids = [generator.next_id()] + generator.next_ids(500) + [generator.next_id()]
+
+        assert len(set(ids)) == 502
+        assert ids == sorted(ids)
+
+
+@pytest.mark.unit
+class TestSnowflakeIdGenerator:
+    """Tests du générateur Snowflake 64 bits"""
+
+    def test_next_id_should_sort_by_creation_and_encode_worker(self):
+        """Test identifiants croissants avec worker encodé"""
+        generator = SnowflakeIdGenerator(worker_id=42, clock=lambda: 1800000000.0)
+
+        ids = [generator.next_id() for _ in range(5000)]
+
+        assert ids == sorted(ids)
+        assert len(set(ids)) == 5000
+        assert all(((task_id >> 12) & 0x3FF) == 42 for task_id in ids)
+        assert all(task_id < 2 ** 63 for task_id in ids)
+
+    def test_next_ids_should_use_sequence_of_same_millisecond(self):
+        """Test réservation en bloc au-delà de la séquence d'une milliseconde"""
+        generator = SnowflakeIdGenerator(worker_id=5, clock=lambda: 1800000000.0)
+
+        ids = generator.next_ids(5000) + [generator.next_id()]
+
+        assert ids == sorted(ids)
+        assert len(set(ids)) == 5001
+
+    def test_different_workers_should_not_collide(self):
+        """Test deux workers à la même milliseconde, séquence épuisée plusieurs fois"""
+        first = SnowflakeIdGenerator(worker_id=1, clock=lambda: 1800000000.0)
+        second = SnowflakeIdGenerator(worker_id=2, clock=lambda: 1800000000.0)
+
+        first_ids = first.next_ids(10_000) + [first.next_id() for _ in range(2000)]
+        second_ids = second.next_ids(10_000) + [second.next_id() for _ in range(2000)]
+
+        assert len(set(first_ids)) == len(set(second_ids)) == 12_000
+        assert not set(first_ids) & set(second_ids)
+
+    def test_workers_in_separate_processes_should_not_collide(self):
+        """Test unicité entre processus réels, un worker_id par processus"""
+        with ProcessPoolExecutor(max_workers=2) as pool:
+            batches = list(pool.map(snowflake_ids, [1, 2], [20_000, 20_000]))
+
+        all_ids = batches[0] + batches[1]
+        assert len(set(all_ids)) == 40_000
+        assert batches[0] == sorted(batches[0]) and batches[1] == sorted(batches[1])
+
+    def test_invalid_worker_id_should_raise_error(self):
+        """Test worker_id hors limites"""
+        with pytest.raises(ValueError, match="Worker ID must be an integer"):
+            SnowflakeIdGenerator(worker_id=1024)
+
+    def test_worker_id_should_be_required(self):
+        """Test pas de worker_id implicite (collision possible entre processus)"""
+        with pytest.raises(TypeError):
+            SnowflakeIdGenerator()
+        with pytest.raises(ValueError, match="Worker ID must be an integer"):
+            SnowflakeIdGenerator(worker_id=None)
+
+    def test_task_manager_should_index_snowflake_ids(self, monkeypatch, tmp_path):
+        """Test gestionnaire avec identifiants entiers"""
+        monkeypatch.setattr(Task, "id_generator", SnowflakeIdGenerator(worker_id=3))
+        manager = TaskManager(str(tmp_path / "tasks.json"))
+
+        task_id = manager.add_task("Tâche Snowflake")
+
+        assert isinstance(task_id, int)
+        assert manager.get_task(str(task_id)).id == task_id
+        assert manager.delete_task(task_id) is True
+
+
+@pytest.mark.unit
+class TestParseId:
+    """Tests de conversion des identifiants"""
+
+    @pytest.mark.parametrize("value,expected", [
+        (1752230487.414, 1752230487.414),
+        ("1752230487.414", 1752230487.414),
+        ("123456789012345678", 123456789012345678),
+        (42, 42),
+    ])
+    def test_parse_id_should_accept_old_and_new_formats(self, value, expected):
+        """Test anciens identifiants float et nouveaux entiers"""
+        assert parse_id(value) == expected
+
+    @pytest.mark.parametrize("value", ["abc", None, [1], True])
+    def test_parse_id_with_invalid_value_should_raise_error(self, value):
+        """Test identifiant invalide"""
+        with pytest.raises((TypeError, ValueError)):
+            parse_id(value)
@@ -0,0 +1,241 @@
+import pytest
+import json
+import os
+import shutil
+from unittest.mock import patch
+from src.task_manager.task import Priority, Status
+from src.task_manager.manager import TaskManager
+from src.task_manager.journal import JournalTaskStore
+
+
+@pytest.fixture
+def storage_file(tmp_path):
+    """Fixture: chemin de l'instantané dans un répertoire temporaire"""
+    return str(tmp_path / "tasks.json")
+
+
+def reopen(storage_file):
+    """Simule un redémarrage : nouveau gestionnaire sur les mêmes fichiers"""
+    return TaskManager(storage_file, backend="wal")
+
+
+def snapshot(manager):
+    return [task.to_dict() for task in manager]
+
+
+@pytest.mark.unit
+class TestJournalTaskStore:
+    """Tests du moteur de stockage journalisé (WAL)"""
+
+    def test_mutations_should_survive_restart_without_save(self, storage_file):
+        """Test chaque changement est rejoué au redémarrage"""
+        manager = reopen(storage_file)
+        kept_id = manager.add_task("Gardée", "Description", Priority.LOW)
+        deleted_id = manager.add_task("Supprimée")
+        manager.get_task(kept_id).update_priority(Priority.URGENT)
+        manager.get_task(kept_id).assign_to_project(7)
+        manager.get_task(kept_id).mark_completed()
+        manager.delete_task(deleted_id)
+        manager.close()
+
+        restarted = reopen(storage_file)
+
+        assert not os.path.exists(storage_file)
+        assert snapshot(restarted) == snapshot(manager)
+        assert restarted.get_tasks_by_status(Status.DONE)[0].id == kept_id
+        assert restarted.get_statistics(recompute=True)["priority_distribution"]["urgent"] == 1
+        restarted.close()
+
+    def test_checkpoint_should_fold_journal_into_snapshot(self, storage_file):
+        """Test compactage : instantané lisible par le chargement JSON, journal vidé"""
+        manager = reopen(storage_file)
+        manager.add_tasks([f"Tâche {i}" for i in range(5)])
+        manager.get_task(manager.get_all_tasks()[0].id).mark_completed()
+
+        manager.checkpoint()
+        manager.add_task("Après compactage")
+        manager.close()
+
+        with open(storage_file + ".wal", 'rb') as f:
+            lines = f.readlines()
+        assert len(lines) == 2
+        assert json.loads(lines[0])[0] == "base"
+        plain = TaskManager(storage_file)
+        plain.load_from_file()
+        assert len(plain) == 5
+        assert snapshot(reopen(storage_file)) == snapshot(manager)
+
+    def test_replay_over_newer_snapshot_should_give_same_state(self, storage_file):
+        """Test crash entre l'écriture de l'instantané et la troncature du journal"""
+        manager = reopen(storage_file)
+        ids = manager.add_tasks(["Une", "Deux", "Trois"])
+        manager.delete_task(ids[1])
+        manager.get_task(ids[0]).mark_completed()
+        manager.close()
+        shutil.copy(storage_file + ".wal", storage_file + ".bak")
+
+        manager.checkpoint()
+        os.replace(storage_file + ".bak", storage_file + ".wal")
+
+        assert snapshot(reopen(storage_file)) == snapshot(manager)
+
+    def test_incomplete_last_record_should_be_dropped(self, storage_file):
+        """Test enregistrement tronqué par un crash pendant l'écriture"""
+        manager = reopen(storage_file)
+        manager.add_task("Complète")
+        manager.close()
+        with open(storage_file + ".wal", 'ab') as f:
+            f.write(b'["add",{"id":1.0,"tit')
+
+        restarted = reopen(storage_file)
+        restarted.add_task("Suivante")
+        restarted.close()
+
+        assert [task.title for task in reopen(storage_file)] == ["Complète", "Suivante"]
+
+    def test_corrupted_record_should_raise_error(self, storage_file):
+        """Test enregistrement invalide au milieu du journal"""
+        with open(storage_file + ".wal", 'wb') as f:
+            f.write(b'["add",{"id":1.0}]\n["clear"]\n')
+
+        with pytest.raises(ValueError, match="Corrupted journal record at line 1"):
+            reopen(storage_file)
+
+    def test_bulk_operations_should_sync_once(self, storage_file):
+        """Test une opération en bloc produit une seule écriture synchronisée"""
+        manager = reopen(storage_file)
+        ids = manager.add_tasks([f"Tâche {i}" for i in range(20)])
+
+        with patch('os.fsync') as mock_fsync:
+            manager.bulk_update(ids, status=Status.DONE)
+            manager.delete_tasks(ids[:10])
+        manager.close()
+
+        assert mock_fsync.call_count == 2
+        restarted = reopen(storage_file)
+        assert len(restarted) == 10
+        assert all(task.completed_at is not None for task in restarted)
+
+    def test_journal_should_be_compacted_past_threshold(self, storage_file, monkeypatch):
+        """Test compactage automatique"""
+        monkeypatch.setattr(JournalTaskStore, "COMPACT_THRESHOLD", 10)
+        manager = reopen(storage_file)
+
+        for i in range(12):
+            manager.add_task(f"Tâche {i}")
+        manager.close()
+
+        with open(storage_file, 'r', encoding='utf-8') as f:
+            assert json.load(f)["metadata"]["total_tasks"] == 10
+        assert len(reopen(storage_file)) == 12
+
+    @pytest.mark.parametrize("streaming", [False, True])
+    def test_load_should_write_snapshot_not_journal(self, storage_file, tmp_path, streaming):
+        """Test un chargement remplace l'instantané sans journaliser chaque tâche"""
+        source = TaskManager(str(tmp_path / "source.json"))
+        source.add_tasks(["Une", "Deux"])
+        source.save_to_file()
+
+        manager = reopen(storage_file)
+        manager.add_task("Remplacée")
+        manager.load_from_file(str(tmp_path / "source.json"), streaming=streaming)
+        manager.close()
+
+        assert os.path.getsize(storage_file + ".wal") == 0
+        assert [task.title for task in reopen(storage_file)] == ["Une", "Deux"]
+
+    def test_load_over_journal_should_write_snapshot_once(self, storage_file, tmp_path):
+        """Test un chargement sur un journal non vide n'écrit qu'un instantané"""
+        source = TaskManager(str(tmp_path / "source.json"))
+        source.add_tasks(["Une", "Deux"])
+        source.save_to_file()
+        manager = reopen(storage_file)
+        manager.add_tasks(["Remplacée", "Aussi"])
+
+        with patch.object(JournalTaskStore, "_write_snapshot", autospec=True,
+                          side_effect=JournalTaskStore._write_snapshot) as write_snapshot:
+            manager.load_from_file(str(tmp_path / "source.json"))
+        manager.close()
+
+        assert write_snapshot.call_count == 1
+        assert [task.title for task in reopen(storage_file)] == ["Une", "Deux"]
+
+    def test_journal_of_replaced_snapshot_should_be_ignored(self, storage_file, tmp_path):
+        """Test crash entre le nouvel instantané d'un chargement et la troncature du journal"""
+        source = TaskManager(str(tmp_path / "source.json"))
+        source.add_tasks(["Une", "Deux"])
+        source.save_to_file()
+        manager = reopen(storage_file)
+        manager.add_task("Remplacée")
+        manager.close()
+        shutil.copy(storage_file + ".wal", storage_file + ".bak")
+
+        manager.load_from_file(str(tmp_path / "source.json"))
+        manager.close()
+        os.replace(storage_file + ".bak", storage_file + ".wal")
+
+        restarted = reopen(storage_file)
+        assert [task.title for task in restarted] == ["Une", "Deux"]
+        restarted.add_task("Suivante")
+        restarted.close()
+        assert [task.title for task in reopen(storage_file)] == ["Une", "Deux", "Suivante"]
+
+    def test_journal_without_generation_should_be_replayed(self, storage_file, tmp_path):
+        """Test journal de l'ancien format (sans en-tête) rejoué puis intégré au chargement"""
+        TaskManager(str(tmp_path / "empty.json")).save_to_file()
+        with open(storage_file + ".wal", 'wb') as f:
+            f.write(b'["add",{"id":1.0,"title":"Ancienne","description":"","priority":"medium",'
+                    b'"status":"todo","project_id":null,"created_at":"2024-01-01T10:00:00",'
+                    b'"completed_at":null}]\n')
+
+        manager = reopen(storage_file)
+        assert [task.title for task in manager] == ["Ancienne"]
+        manager.load_from_file(str(tmp_path / "empty.json"))
+        manager.close()
+
+        assert len(reopen(storage_file)) == 0
+
+    @pytest.mark.parametrize("operation", ["save_to_file", "load_from_file"])
+    def test_json_io_on_snapshot_should_raise_error(self, storage_file, operation):
+        """Test l'instantané du moteur ne peut pas servir de fichier JSON"""
+        manager = reopen(storage_file)
+        manager.add_task("Tâche")
+
+        with pytest.raises(ValueError, match="is the database of the 'wal' backend"):
+            getattr(manager, operation)()
+        with pytest.raises(ValueError, match="is the database of the 'wal' backend"):
+            getattr(manager, operation)(storage_file)
+        manager.close()
+
+    def test_failed_journal_write_should_leave_tasks_unchanged(self, storage_file):
+        """Test écriture anticipée : un échec de synchronisation n'applique rien"""
+        manager = reopen(storage_file)
+        task_id = manager.add_task("Tâche", priority=Priority.LOW)
+        task = manager.get_task(task_id)
+        before = snapshot(manager)
+
+        with patch('os.fsync', side_effect=OSError("disk full")):
+            with pytest.raises(OSError, match="disk full"):
+                manager.add_task("Perdue")
+            with pytest.raises(OSError, match="disk full"):
+                task.update_priority(Priority.URGENT)
+            with pytest.raises(OSError, match="disk full"):
+                task.mark_completed()
+            with pytest.raises(OSError, match="disk full"):
+                manager.delete_task(task_id)
+            with pytest.raises(OSError, match="disk full"):
+                manager.bulk_update([task_id], status=Status.DONE)
+
+        assert snapshot(manager) == before
+        assert manager.get_tasks_by_priority(Priority.LOW) == [task]
+        assert manager.get_tasks_by_status(Status.DONE) == []
+        manager.close()
+
+        assert snapshot(reopen(storage_file)) == before
+
+    def test_wal_backend_requires_path(self):
+        """Test moteur 'wal' sans fichier"""
+        from src.task_manager.storage import create_store
+
+        with pytest.raises(ValueError, match="requires a snapshot file path"):
+            create_store("wal")
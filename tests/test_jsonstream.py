@@ -0,0 +1,91 @@
+import pytest
+import io
+import json
+from src.task_manager.jsonstream import iter_json_array, iter_json_document
+
+
+def stream(text, chunk_size=4):
+    """Parcourt un document en très petits morceaux pour tester les coupures"""
+    return list(iter_json_array(io.StringIO(text), "tasks", source="test.json", chunk_size=chunk_size))
+
+
+@pytest.mark.unit
+class TestIterJsonArray:
+    """Tests du lecteur JSON incrémental"""
+
+    def test_should_yield_each_element_across_chunk_boundaries(self):
+        """Test éléments coupés entre plusieurs morceaux"""
+        document = {
+            "metadata": {"total_tasks": 3, "nested": [1, {"a": "b"}]},
+            "tasks": [{"id": 1.5, "title": 'Tâche "un"'}, 12345678, "texte, avec ] et }"],
+            "after": None
+        }
+
+        assert stream(json.dumps(document, indent=2)) == document["tasks"]
+
+    @pytest.mark.parametrize("text,expected", [
+        ('{}', []),
+        ('{"metadata": {}}', []),
+        ('{"tasks": []}', []),
+        ('  {"tasks" : [ 1 , 2 ] }  ', [1, 2]),
+    ])
+    def test_should_handle_empty_and_missing_arrays(self, text, expected):
+        """Test tableau vide, clé absente et espaces"""
+        assert stream(text) == expected
+
+    def test_non_object_root_should_raise_error(self):
+        """Test racine qui n'est pas un objet"""
+        with pytest.raises(ValueError, match="Invalid JSON structure in 'test.json': expected object, got array"):
+            stream('[1, 2]')
+
+    def test_non_array_tasks_should_raise_error(self):
+        """Test clé tasks qui n'est pas un tableau"""
+        with pytest.raises(ValueError, match="Invalid tasks format in 'test.json': expected array, got string"):
+            stream('{"tasks": "not_an_array"}')
+
+    @pytest.mark.parametrize("text", [
+        '{"tasks": [{"id": 1}, {"id": 2',
+        '{"tasks": [1 2]}',
+        '{"tasks": [1, 2]',
+    ])
+    def test_truncated_or_invalid_json_should_raise_decode_error(self, text):
+        """Test fichier tronqué (crash pendant l'écriture) ou invalide"""
+        with pytest.raises(json.JSONDecodeError):
+            stream(text)
+
+    def test_should_be_lazy(self):
+        """Test les éléments sont produits avant la fin de la lecture"""
+        items = iter_json_array(io.StringIO('{"tasks": [1, 2, oops'), "tasks", chunk_size=4)
+
+        assert next(items) == 1
+        assert next(items) == 2
+        with pytest.raises(json.JSONDecodeError):
+            next(items)
+
+
+@pytest.mark.unit
+class TestIterJsonDocument:
+    """Tests de l'écriture JSON par morceaux"""
+
+    @pytest.mark.parametrize("items", [[], [{"id": 1.5, "title": 'Tâche "un"', "tags": [1, {"a": None}]}, {"id": 2, "done": True}, {}, 2]])
+    @pytest.mark.parametrize("compact,options", [
+        (False, {"indent": 2}),
+        (True, {"separators": (',', ':')}),
+    ])
+    def test_should_match_json_dump(self, items, compact, options):
+        """Test texte identique à json.dumps, tableau vide compris"""
+        metadata = {"total_tasks": len(items), "saved_at": "2024-01-01T00:00:00"}
+        expected = json.dumps({"tasks": items, "metadata": metadata}, ensure_ascii=False, **options)
+
+        chunks = iter_json_document(items, "tasks", lambda count: {"metadata": metadata},
+                                    compact=compact, batch_size=1)
+
+        assert "".join(chunks) == expected
+
+    def test_should_yield_batches_and_count_items(self):
+        """Test découpage en morceaux et nombre d'éléments transmis aux métadonnées"""
+        chunks = list(iter_json_document(iter(range(10)), "tasks",
+                                         lambda count: {"count": count}, compact=True, batch_size=4))
+
+        assert len(chunks) == 3
+        assert json.loads("".join(chunks)) == {"tasks": list(range(10)), "count": 10}
@@ -6,7 +6,7 @@ import io
 import json
 import os
 import tempfile
-from src.task_manager.services import EmailService, ReportService, ExportService
+from src.task_manager.services import EmailService, ReportService, ExportService, PYARROW_AVAILABLE, _FORK_AVAILABLE
 from src.task_manager.task import Task, Priority, Status
 
 
@@ -332,6 +332,65 @@ class TestReportService:
         assert summary["exportable"] == expected_exportable
 
 
+@pytest.mark.integration
+class TestCsvThroughputMode:
+    """Tests du mode haut débit de l'export CSV"""
+
+    def setup_method(self):
+        self.report_service = ReportService()
+        self.tasks = Task.create_many([f'Tâche, "{i}"' for i in range(1000)],
+                                      descriptions=["ligne 1\nligne 2" if i % 2 else "" for i in range(1000)])
+        self.tasks[0].mark_completed()
+        self.tasks[1].project_id = 3.0
+
+    @pytest.mark.parametrize("options", [{"high_throughput": True}, {"workers": 3}])
+    def test_throughput_modes_should_write_same_bytes_as_dict_writer(self, tmp_path, options):
+        """Test fichier identique à l'export DictWriter"""
+        self.report_service.export_tasks_csv(self.tasks, str(tmp_path / "reference.csv"))
+
+        assert self.report_service.export_tasks_csv(self.tasks, str(tmp_path / "fast"), **options) is True
+
+        assert (tmp_path / "fast.csv").read_bytes() == (tmp_path / "reference.csv").read_bytes()
+        assert sorted(os.listdir(tmp_path)) == ["fast.csv", "reference.csv"]
+
+    def test_more_workers_than_tasks_should_still_export(self, tmp_path):
+        """Test tranches moins nombreuses que les processus demandés"""
+        path = str(tmp_path / "small.csv")
+
+        self.report_service.export_tasks_csv(self.tasks[:2], path, workers=4)
+
+        with open(path, newline='', encoding='utf-8') as file:
+            rows = list(csv.reader(file))
+        assert rows[0] == ReportService.CSV_FIELDNAMES
+        assert [row[1] for row in rows[1:]] == [task.title for task in self.tasks[:2]]
+
+    def test_sharded_export_should_remove_parts_on_error(self, tmp_path):
+        """Test fichiers temporaires supprimés si l'écriture échoue"""
+        path = str(tmp_path / "missing" / "export.csv")
+
+        with pytest.raises(OSError, match="File system error"):
+            self.report_service.export_tasks_csv(self.tasks, path, workers=2)
+
+        assert not os.path.exists(tmp_path / "missing")
+
+    @pytest.mark.skipif(not _FORK_AVAILABLE, reason="Export en tranches : fork nécessaire")
+    def test_sharded_export_should_keep_other_files_and_previous_export(self, tmp_path):
+        """Test tranches dans un répertoire temporaire, ancien export intact si la concaténation échoue"""
+        path = tmp_path / "export.csv"
+        path.write_text("ancien export")
+        (tmp_path / "export.csv.part0").write_text("fichier de l'utilisateur")
+
+        with patch('src.task_manager.services.shutil.copyfileobj', side_effect=OSError("disk full")):
+            with pytest.raises(OSError, match="File system error"):
+                self.report_service.export_tasks_csv(self.tasks, str(path), workers=2)
+
+        assert path.read_text() == "ancien export"
+        assert sorted(os.listdir(tmp_path)) == ["export.csv", "export.csv.part0"]
+        self.report_service.export_tasks_csv(self.tasks, str(path), workers=2)
+        assert (tmp_path / "export.csv.part0").read_text() == "fichier de l'utilisateur"
+        assert sorted(os.listdir(tmp_path)) == ["export.csv", "export.csv.part0"]
+
+
 @pytest.mark.unit
 class TestExportService:
     """Tests du service d'export multi-format"""
@@ -372,13 +431,13 @@ class TestExportService:
         service = ExportService()
         
         assert service.export_history == []
-        assert service.SUPPORTED_FORMATS == ['json', 'xml', 'xlsx', 'excel']
+        assert service.SUPPORTED_FORMATS == ['json', 'xml', 'xlsx', 'excel', 'parquet', 'arrow']
 
     def test_get_supported_formats_should_return_format_list(self):
         """Test récupération formats supportés"""
         formats = self.export_service.get_supported_formats()
         
-        expected_formats = ['json', 'xml', 'xlsx', 'excel']
+        expected_formats = ['json', 'xml', 'xlsx', 'excel', 'parquet', 'arrow']
         assert formats == expected_formats
 
     def test_is_format_supported_should_validate_formats(self):
@@ -863,4 +922,263 @@ class TestExportServiceRealFiles:
         
         # Vérifier que les fichiers existent
         assert os.path.exists(json_file)
-        assert os.path.exists(xml_file)
\ No newline at end of file
+        assert os.path.exists(xml_file)
+
+@pytest.mark.integration
+class TestExportMany:
+    """Tests de l'export multi-format en une fois"""
+
+    def setup_method(self):
+        self.export_service = ExportService()
+        self.tasks = [Task(f"Tâche {i}", "Description", list(Priority)[i % 4]) for i in range(50)]
+        self.tasks[0].mark_completed()
+        self.temp_dir = tempfile.mkdtemp()
+
+    def teardown_method(self):
+        import shutil
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _targets(self, prefix):
+        return {fmt: os.path.join(self.temp_dir, f"{prefix}.{fmt}") for fmt in ("json", "xml", "xlsx")}
+
+    @pytest.mark.parametrize("parallel", [True, False])
+    def test_export_many_should_write_same_files_as_export_tasks(self, parallel):
+        """Test contenu identique à des export_tasks successifs"""
+        import xml.etree.ElementTree as ET
+        from openpyxl import load_workbook
+        expected = self._targets("single")
+        for fmt, filename in expected.items():
+            ExportService().export_tasks(self.tasks, filename, fmt)
+
+        result = self.export_service.export_many(self.tasks, self._targets("many"), parallel=parallel)
+
+        assert result == {"json": True, "xml": True, "xlsx": True}
+        with open(expected["json"]) as single, open(self._targets("many")["json"]) as many:
+            single_data, many_data = json.load(single), json.load(many)
+        for data in (single_data, many_data):
+            del data["metadata"]["exported_at"], data["statistics"]["generated_at"]
+        assert many_data == single_data
+        root = ET.parse(self._targets("many")["xml"]).getroot()
+        assert [task.find("Title").text for task in root.find("Tasks")] == [task.title for task in self.tasks]
+        sheet = load_workbook(self._targets("many")["xlsx"])["Tasks"]
+        assert sheet.max_row == 51
+        assert [entry["format"] for entry in self.export_service.get_export_history()] == ["json", "xml", "xlsx"]
+
+    def test_export_many_should_compute_statistics_once(self):
+        """Test statistiques calculées une seule fois pour tous les formats"""
+        with patch.object(ExportService, "_generate_export_statistics",
+                          wraps=self.export_service._generate_export_statistics) as stats:
+            self.export_service.export_many(self.tasks, self._targets("stats"), parallel=True)
+
+        assert stats.call_count == 1
+
+    def test_export_many_should_snapshot_tasks(self):
+        """Test tâches d'origine non partagées avec les écritures"""
+        targets = self._targets("snapshot")
+        with patch.object(ExportService, "_export_json", autospec=True,
+                          side_effect=lambda service, tasks, *args: tasks is not self.tasks) as export_json:
+            result = self.export_service.export_many(self.tasks, {"json": targets["json"]})
+
+        assert export_json.called and result == {"json": True}
+
+    def test_export_many_should_report_failures_after_all_writes(self):
+        """Test un format en échec n'empêche pas les autres"""
+        targets = self._targets("partial")
+        targets["xml"] = "/invalid/path/export.xml"
+
+        with pytest.raises(RuntimeError, match="Error exporting to XML"):
+            self.export_service.export_many(self.tasks, targets, parallel=True)
+
+        assert os.path.exists(targets["json"]) and os.path.exists(targets["xlsx"])
+        history = {entry["format"]: entry for entry in self.export_service.get_export_history()}
+        assert history["xml"]["success"] is False and "error" in history["xml"]
+        assert history["json"]["success"] is True and history["xlsx"]["success"] is True
+
+    def test_export_many_with_invalid_targets_should_raise_error(self):
+        """Test cibles vides ou format inconnu"""
+        with pytest.raises(ValueError, match="Targets must be a non-empty dict"):
+            self.export_service.export_many(self.tasks, {})
+        with pytest.raises(ValueError, match="Unsupported format: csv"):
+            self.export_service.export_many(self.tasks, {"csv": "export.csv"})
+        with pytest.raises(TypeError, match="Tasks must be a list"):
+            self.export_service.export_many("tasks", {"json": "export.json"})
+
+
+@pytest.mark.integration
+class TestStreamingXmlExport:
+    """Tests de l'export XML en streaming"""
+
+    @staticmethod
+    def _read_without_date(path):
+        import re
+        with open(path, 'rb') as file:
+            return re.sub(rb"<ExportedAt>[^<]*</ExportedAt>", b"", file.read())
+
+    @pytest.mark.parametrize("include_statistics", [True, False])
+    @pytest.mark.parametrize("count", [0, 2500])
+    def test_streaming_export_should_match_tree_export_bytes(self, tmp_path, include_statistics, count):
+        """Test octets identiques à l'export ElementTree (échappement, éléments vides)"""
+        tasks = Task.create_many([f"Tâche & {i}" for i in range(count)],
+                                 descriptions=["a > b" if i % 2 else "" for i in range(count)])
+        if tasks:
+            tasks[0].mark_completed()
+            tasks[1].project_id = 7
+        tree_file, stream_file = str(tmp_path / "tree.xml"), str(tmp_path / "stream.xml")
+
+        ExportService().export_tasks(tasks, tree_file, "xml", include_statistics)
+        ExportService().export_tasks(tasks, stream_file, "xml", include_statistics, streaming=True)
+
+        assert self._read_without_date(stream_file) == self._read_without_date(tree_file)
+
+    def test_streaming_export_memory_should_not_grow_with_task_count(self, tmp_path):
+        """Test pic mémoire indépendant du nombre de tâches"""
+        import tracemalloc
+        peaks = []
+        for count in (2_000, 20_000):
+            tasks = Task.create_many([f"Tâche {i}" for i in range(count)])
+            tracemalloc.start()
+            ExportService().export_tasks(tasks, str(tmp_path / f"export_{count}.xml"), "xml", streaming=True)
+            peaks.append(tracemalloc.get_traced_memory()[1])
+            tracemalloc.stop()
+
+        assert peaks[1] < peaks[0] * 2
+
+
+@pytest.mark.integration
+class TestWriteOnlyExcelExport:
+    """Tests de l'export Excel en mode write_only"""
+
+    @staticmethod
+    def _sheets(path):
+        from openpyxl import load_workbook
+        workbook = load_workbook(path)
+        return {
+            sheet.title: (
+                [[cell.value for cell in row] for row in sheet.iter_rows()],
+                {letter: dimension.width for letter, dimension in sheet.column_dimensions.items()},
+                (sheet["A1"].font.b, sheet["A1"].fill.fgColor.rgb),
+            )
+            for sheet in workbook.worksheets
+        }
+
+    @pytest.mark.parametrize("include_statistics", [True, False])
+    def test_write_only_export_should_match_standard_workbook(self, tmp_path, include_statistics):
+        """Test mêmes feuilles, valeurs, styles d'en-tête et largeurs de colonnes"""
+        tasks = Task.create_many([f"Tâche {i}" for i in range(300)], descriptions=["x" * i for i in range(300)])
+        tasks[0].mark_completed()
+        tasks[1].project_id = 12
+        tasks[2].status = Status.IN_PROGRESS
+        standard, write_only = str(tmp_path / "standard.xlsx"), str(tmp_path / "write_only.xlsx")
+
+        ExportService().export_tasks(tasks, standard, "xlsx", include_statistics)
+        ExportService().export_tasks(tasks, write_only, "xlsx", include_statistics, streaming=True)
+
+        assert self._sheets(write_only) == self._sheets(standard)
+
+    def test_write_only_export_of_empty_list_should_keep_headers(self, tmp_path):
+        """Test export vide : seulement la ligne d'en-têtes"""
+        path = str(tmp_path / "empty.xlsx")
+
+        assert ExportService().export_tasks([], path, "xlsx", streaming=True) is True
+
+        rows, widths, _ = self._sheets(path)["Tasks"]
+        assert rows == [list(ExportService.EXCEL_HEADERS)]
+        assert widths["A"] == 4
+
+    def test_write_only_export_without_openpyxl_should_raise_import_error(self, tmp_path):
+        """Test mode write_only sans openpyxl"""
+        with patch('src.task_manager.services.OPENPYXL_AVAILABLE', False):
+            with pytest.raises(ImportError, match="openpyxl library is required"):
+                ExportService().export_tasks([], str(tmp_path / "export.xlsx"), "xlsx", streaming=True)
+
+
+def columnar_tasks():
+    """Dix tâches de priorités variées, une terminée, une rattachée à un projet"""
+    tasks = Task.create_many([f"Tâche {i}" for i in range(10)],
+                             priorities=[list(Priority)[i % 4] for i in range(10)])
+    tasks[0].mark_completed()
+    tasks[1].project_id = 12
+    return tasks
+
+
+@pytest.mark.integration
+class TestColumnarExport:
+    """Tests des exports Parquet et Arrow qui ne nécessitent pas pyarrow"""
+
+    def setup_method(self):
+        self.tasks = columnar_tasks()
+
+    @pytest.mark.parametrize("filename, expected", [
+        ("export.parquet", "export.parquet"),
+        ("export.feather", "export.feather"),
+        ("export.arrow", "export.arrow"),
+    ])
+    def test_format_should_be_detected_from_extension(self, filename, expected):
+        """Test format déduit de l'extension (.feather pour Arrow)"""
+        format_type, resolved, _ = ExportService()._resolve_target(filename, "json", None)
+
+        assert resolved == expected
+        assert format_type == ("parquet" if expected.endswith(".parquet") else "arrow")
+
+    def test_compression_should_be_rejected(self, tmp_path):
+        """Test colonnes déjà compressées"""
+        with pytest.raises(ValueError, match="Compression is not supported for parquet"):
+            ExportService().export_tasks(self.tasks, str(tmp_path / "export.parquet.gz"))
+
+    @pytest.mark.parametrize("format_type", ["parquet", "arrow"])
+    def test_export_without_pyarrow_should_raise_import_error(self, tmp_path, format_type):
+        """Test absence de pyarrow : erreur explicite, aucun fichier, échec dans l'historique"""
+        service = ExportService()
+        path = tmp_path / f"export.{format_type}"
+
+        with patch('src.task_manager.services.PYARROW_AVAILABLE', False):
+            with pytest.raises(ImportError, match="pyarrow library is required"):
+                service.export_tasks(self.tasks, str(path), format_type)
+
+        assert not path.exists()
+        assert service.get_export_history()[-1]["success"] is False
+
+
+@pytest.mark.integration
+@pytest.mark.skipif(not PYARROW_AVAILABLE, reason="pyarrow n'est pas installé")
+class TestColumnarExportWithPyarrow:
+    """Tests des fichiers Parquet et Arrow écrits (relus avec pyarrow)"""
+
+    def setup_method(self):
+        self.tasks = columnar_tasks()
+
+    @pytest.mark.parametrize("format_type", ["parquet", "arrow"])
+    def test_export_should_write_typed_columns(self, tmp_path, format_type):
+        """Test colonnes typées, groupes de lignes par paquet et statistiques en métadonnées"""
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        path = str(tmp_path / f"export.{format_type}")
+
+        with patch.object(ExportService, "COLUMNAR_BATCH_SIZE", 4):
+            ExportService().export_tasks(self.tasks, path, format_type)
+
+        if format_type == "parquet":
+            assert pq.ParquetFile(path).num_row_groups == 3
+            table = pq.read_table(path)
+        else:
+            reader = pa.ipc.open_file(path)
+            assert reader.num_record_batches == 3
+            table = reader.read_all()
+        assert table.schema.field("priority").type == pa.dictionary(pa.int8(), pa.string())
+        assert table.schema.field("created_at").type == pa.timestamp("us")
+        columns = table.to_pydict()
+        assert columns["id"] == [task.id for task in self.tasks]
+        assert columns["priority"] == [task.priority.value for task in self.tasks]
+        assert columns["created_at"] == [task.created_at for task in self.tasks]
+        assert columns["completed_at"][:2] == [self.tasks[0].completed_at, None]
+        assert columns["project_id"][:3] == [None, 12.0, None]
+        metadata = json.loads(table.schema.metadata[b"task_manager"])
+        assert metadata["total_tasks"] == 10
+        assert metadata["statistics"]["completed_tasks"] == 1
+
+    def test_export_with_mixed_id_types_should_fail(self, tmp_path):
+        """Test identifiants entiers et flottants mélangés"""
+        self.tasks[0].id = 7 if isinstance(self.tasks[1].id, float) else 7.5
+
+        with pytest.raises(RuntimeError, match="single type"):
+            ExportService().export_tasks(self.tasks, str(tmp_path / "export.parquet"))
@@ -0,0 +1,160 @@
+import pytest
+import gc
+from src.task_manager.task import Task, Priority, Status
+from src.task_manager.manager import TaskManager
+from src.task_manager.ids import SnowflakeIdGenerator
+
+
+@pytest.fixture
+def snapshot_file(tmp_path):
+    """Fixture: instantané binaire de 12 tâches"""
+    path = str(tmp_path / "tasks.snap")
+    source = TaskManager(str(tmp_path / "source.json"))
+    ids = source.add_tasks([(f"Tâche {i} é", f"Description {i}", list(Priority)[i % 4]) for i in range(12)])
+    for task_id in ids[:3]:
+        source.get_task(task_id).mark_completed()
+    source.get_task(ids[4]).assign_to_project(7)
+    source.save_snapshot(path)
+    return path
+
+
+@pytest.fixture
+def manager(snapshot_file):
+    """Fixture: gestionnaire sur l'instantané projeté"""
+    manager = TaskManager(snapshot_file, backend="mmap")
+    yield manager
+    manager.close()
+
+
+def same_statistics(manager):
+    stats, recounted = manager.get_statistics(), manager.get_statistics(recompute=True)
+    stats.pop("generated_at")
+    recounted.pop("generated_at")
+    return stats == recounted
+
+
+def summary(tasks):
+    return [(t.id, t.title, t.description, t.priority, t.status, t.created_at, t.completed_at, t.project_id)
+            for t in tasks]
+
+
+@pytest.mark.unit
+class TestMappedTaskStore:
+    """Tests du moteur de stockage sur instantané binaire projeté"""
+
+    def test_snapshot_should_round_trip_all_fields(self, manager):
+        """Test relecture identique à la source"""
+        tasks = list(manager)
+
+        task = manager.get_task(tasks[4].id)
+
+        assert len(manager) == 12
+        assert task is tasks[4]
+        assert task.title == "Tâche 4 é"
+        assert task.description == "Description 4"
+        assert task.priority == Priority.LOW
+        assert task.project_id == 7.0
+        assert manager.get_task(str(task.id)) is task
+        assert manager.get_task(123.0) is None
+        assert manager.get_task("inconnu") is None
+        assert tasks[0].completed_at is not None
+        assert tasks[5].completed_at is None
+        assert tasks[5].project_id is None
+
+    def test_counts_and_filters_should_match_recount(self, manager):
+        """Test comptages et filtres lus dans les colonnes du fichier"""
+        stats = manager.get_statistics()
+
+        assert same_statistics(manager)
+        assert stats["completed_tasks"] == 3
+        assert stats["priority_distribution"] == {"low": 3, "medium": 3, "high": 3, "urgent": 3}
+        assert [t.title for t in manager.get_tasks_by_status(Status.DONE)] == ["Tâche 0 é", "Tâche 1 é", "Tâche 2 é"]
+        assert len(manager.get_tasks_by_priority(Priority.HIGH)) == 3
+
+    def test_changes_should_be_applied_then_checkpointed(self, manager, snapshot_file):
+        """Test changements en mémoire, intégrés au fichier par save_snapshot"""
+        tasks = list(manager)
+        manager.get_task(tasks[5].id).mark_completed()
+        manager.get_task(tasks[6].id).title = "Renommée"
+        manager.delete_task(tasks[0].id)
+        new_id = manager.add_task("Nouvelle", priority=Priority.URGENT)
+
+        assert len(manager) == 12
+        assert same_statistics(manager)
+        assert [t.id for t in manager.get_tasks_by_status(Status.DONE)] == [tasks[1].id, tasks[2].id, tasks[5].id]
+        assert manager.get_tasks_by_priority(Priority.URGENT)[-1].id == new_id
+
+        manager.save_snapshot()
+        expected = summary(manager)
+        del tasks
+        gc.collect()
+        reopened = TaskManager(snapshot_file, backend="mmap")
+
+        assert summary(reopened) == expected
+        assert reopened.get_statistics()["completed_tasks"] == 3
+        reopened.close()
+
+    def test_missing_file_should_start_empty(self, tmp_path):
+        """Test instantané pas encore créé : ajout, lecture puis premier checkpoint"""
+        path = str(tmp_path / "new.snap")
+        manager = TaskManager(path, backend="mmap")
+
+        assert len(manager) == 0
+        assert manager.get_task(1.0) is None
+        task_id = manager.add_task("Première", priority=Priority.HIGH)
+
+        assert manager.get_task(task_id).title == "Première"
+        assert [task.id for task in manager.get_tasks_by_priority(Priority.HIGH)] == [task_id]
+        assert same_statistics(manager)
+        manager.save_snapshot()
+        manager.close()
+
+        reopened = TaskManager(path, backend="mmap")
+        assert [task.title for task in reopened] == ["Première"]
+        reopened.close()
+
+    def test_integer_ids_should_be_stored_exactly(self, tmp_path, monkeypatch):
+        """Test identifiants Snowflake sur 64 bits"""
+        monkeypatch.setattr(Task, "id_generator", SnowflakeIdGenerator(worker_id=3))
+        path = str(tmp_path / "ints.snap")
+        source = TaskManager(str(tmp_path / "source.json"))
+        ids = source.add_tasks(["Une", "Deux", "Trois"])
+        source.save_snapshot(path)
+
+        manager = TaskManager(path, backend="mmap")
+
+        assert [task.id for task in manager] == ids
+        assert type(manager.get_task(ids[2]).id) is int
+        manager.close()
+
+    def test_mixed_ids_should_be_rejected(self, tmp_path, monkeypatch):
+        """Test identifiants entiers et flottants mélangés"""
+        source = TaskManager(str(tmp_path / "source.json"))
+        source.add_task("Flottante")
+        monkeypatch.setattr(Task, "id_generator", SnowflakeIdGenerator(worker_id=3))
+        source.add_task("Entière")
+
+        with pytest.raises(ValueError, match="single type"):
+            source.save_snapshot(str(tmp_path / "mixed.snap"))
+
+    def test_invalid_file_should_be_rejected(self, tmp_path):
+        """Test fichier qui n'est pas un instantané"""
+        path = tmp_path / "other.snap"
+        path.write_bytes(b"x" * 64)
+
+        with pytest.raises(ValueError, match="bad magic number"):
+            TaskManager(str(path), backend="mmap")
+
+    def test_json_load_should_fill_snapshot_store(self, manager, tmp_path, snapshot_file):
+        """Test import JSON, l'instantané ne peut pas être écrasé en JSON"""
+        json_file = str(tmp_path / "tasks.json")
+        source = TaskManager(json_file)
+        source.add_tasks(["Une", "Deux"])
+        source.save_to_file()
+
+        manager.load_from_file(json_file, streaming=True)
+
+        assert [task.title for task in manager] == ["Une", "Deux"]
+        assert manager.get_statistics()["total_tasks"] == 2
+        with pytest.raises(ValueError, match="is the database of the 'mmap' backend"):
+            manager.save_to_file()
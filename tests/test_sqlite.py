@@ -0,0 +1,122 @@
+import pytest
+import gc
+from datetime import date, datetime
+from src.task_manager.task import Task, Priority, Status
+from src.task_manager.manager import TaskManager
+from src.task_manager.ids import SnowflakeIdGenerator
+
+
+@pytest.fixture
+def manager(tmp_path):
+    """Fixture: gestionnaire avec base SQLite"""
+    manager = TaskManager(str(tmp_path / "tasks.db"), backend="sqlite")
+    yield manager
+    manager.close()
+
+
+def reopen(manager):
+    """Nouveau gestionnaire sur la même base"""
+    return TaskManager(manager._storage_file, backend="sqlite")
+
+
+@pytest.mark.unit
+class TestSqliteTaskStore:
+    """Tests propres au moteur SQLite (comportement commun : test_backends.py)"""
+
+    def test_changes_should_be_persisted_without_save(self, manager):
+        """Test changements réécrits dans la base, relus après réouverture"""
+        task_id = manager.add_task("Tâche", priority=Priority.LOW)
+        other_id = manager.add_task("Autre")
+        manager.get_task(task_id).update_priority(Priority.URGENT)
+        manager.get_task(task_id).mark_completed()
+        manager.get_task(task_id).assign_to_project(42)
+        manager.get_task(other_id).title = "Renommée"
+        gc.collect()
+
+        reopened = reopen(manager)
+        task = reopened.get_task(task_id)
+
+        assert task.priority == Priority.URGENT
+        assert task.status == Status.DONE
+        assert task.completed_at is not None
+        assert task.project_id == 42.0
+        assert [t.title for t in reopened] == ["Tâche", "Renommée"]
+        assert reopened.get_tasks_by_status(Status.DONE) == [task]
+        assert reopened.get_tasks_by_priority(Priority.LOW) == []
+        reopened.close()
+
+    def test_filters_should_use_indexes(self, manager):
+        """Test plans de requête indexés"""
+        connection = manager._store._connection
+
+        for column, index in [("status", "idx_tasks_status"), ("priority", "idx_tasks_priority"),
+                              ("project_id", "idx_tasks_project_id"), ("created_us", "idx_tasks_created_us")]:
+            plan = connection.execute(f"EXPLAIN QUERY PLAN SELECT id FROM tasks WHERE {column} = ?", (1,)).fetchall()
+            assert index in str(plan)
+
+    def test_day_filters_should_use_date_indexes(self, manager):
+        """Test rapport journalier : les deux branches du OR passent par un index"""
+        manager.add_tasks([f"Tâche {i}" for i in range(10)])
+        connection = manager._store._connection
+        statements = []
+        connection.set_trace_callback(statements.append)
+
+        manager.get_tasks_by_date(datetime.now())
+        manager._store.counts(date.today())
+        connection.set_trace_callback(None)
+
+        day_queries = [sql for sql in statements if "completed_us >=" in sql]
+        assert len(day_queries) >= 3
+        for sql in day_queries:
+            plan = str(connection.execute(f"EXPLAIN QUERY PLAN {sql}").fetchall())
+            assert "idx_tasks_created_us" in plan
+            assert "idx_tasks_completed_us" in plan
+            assert "SCAN tasks" not in plan
+
+    def test_integer_and_float_ids_should_be_stored_exactly(self, manager, monkeypatch):
+        """Test identifiants entiers 64 bits et flottants"""
+        float_id = manager.add_task("Tâche flottante")
+        monkeypatch.setattr(Task, "id_generator", SnowflakeIdGenerator(worker_id=7))
+        int_id = manager.add_task("Tâche Snowflake")
+        gc.collect()
+
+        reopened = reopen(manager)
+
+        assert [task.id for task in reopened] == [float_id, int_id]
+        assert type(reopened.get_task(int_id).id) is int
+        assert type(reopened.get_task(float_id).id) is float
+        reopened.close()
+
+    def test_bulk_operations_should_run_in_one_transaction(self, manager):
+        """Test une transaction par opération en bloc, annulée en cas d'erreur"""
+        ids = manager.add_tasks([f"Tâche {i}" for i in range(10)])
+        statements = []
+        manager._store._connection.set_trace_callback(statements.append)
+
+        manager.bulk_update(ids[:5], priority=Priority.HIGH)
+        manager.bulk_update(ids[:3], status=Status.DONE)
+        manager.delete_tasks(ids[8:])
+
+        assert statements.count("BEGIN") == 3
+        assert statements.count("COMMIT") == 3
+        gc.collect()
+        reopened = reopen(manager)
+        assert len(reopened.get_tasks_by_priority(Priority.HIGH)) == 5
+        assert reopened.get_statistics(recompute=True)["completed_tasks"] == 3
+        assert [task.id for task in reopened] == ids[:8]
+        reopened.close()
+
+    def test_json_load_and_save_should_use_other_files(self, manager, tmp_path):
+        """Test import/export JSON, la base ne peut pas être écrasée"""
+        json_file = str(tmp_path / "tasks.json")
+        source = TaskManager(json_file)
+        source.add_tasks(["Une", "Deux"])
+        source.save_to_file()
+
+        manager.load_from_file(json_file, streaming=True)
+
+        assert [task.title for task in reopen(manager)] == ["Une", "Deux"]
+        with pytest.raises(ValueError, match="is the database of the 'sqlite' backend"):
+            manager.save_to_file()
+        with pytest.raises(ValueError, match="is the database of the 'sqlite' backend"):
+            manager.load_from_file()
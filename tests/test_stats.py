@@ -0,0 +1,55 @@
+import pytest
+from datetime import datetime, timedelta
+from src.task_manager.task import Task, Priority, Status
+from src.task_manager.stats import TaskCounts, count_tasks
+
+
+@pytest.mark.unit
+class TestCountTasks:
+    """Tests du moteur de statistiques en une passe"""
+
+    def setup_method(self):
+        self.tasks = [
+            Task("Tâche basse", priority=Priority.LOW),
+            Task("Tâche haute", priority=Priority.HIGH),
+            Task("Tâche urgente", priority=Priority.URGENT),
+        ]
+        self.tasks[1].mark_completed()
+        self.tasks[2].status = Status.CANCELLED
+
+    def test_count_tasks_should_count_every_distribution(self):
+        """Test comptage statuts et priorités"""
+        counts = count_tasks(self.tasks)
+
+        assert counts.total == 3
+        assert counts.completed == 1
+        assert counts.status_distribution() == {
+            "todo": 1, "in_progress": 0, "done": 1, "cancelled": 1
+        }
+        assert counts.priority_distribution() == {
+            "low": 1, "medium": 0, "high": 1, "urgent": 1
+        }
+
+    def test_count_tasks_should_accept_any_iterable(self):
+        """Test comptage depuis un générateur (un seul parcours)"""
+        counts = count_tasks(task for task in self.tasks)
+
+        assert counts == count_tasks(self.tasks)
+
+    def test_count_tasks_with_day_should_filter_tasks(self):
+        """Test filtrage par jour de création ou de complétion"""
+        old_task = Task("Ancienne tâche")
+        old_task.created_at = datetime.now() - timedelta(days=3)
+
+        counts = count_tasks(self.tasks + [old_task], day=datetime.now().date())
+
+        assert counts.total == 3
+        assert counts.created_on_day == 3
+
+    def test_to_statistics_on_empty_counts(self):
+        """Test statistiques vides"""
+        stats = TaskCounts().to_statistics()
+
+        assert stats["total_tasks"] == 0
+        assert stats["completion_rate"] == 0.0
+        assert "generated_at" in stats
@@ -1,6 +1,6 @@
 import pytest
-from datetime import datetime, timedelta
-from src.task_manager.task import Task, Priority, Status
+from datetime import datetime, timedelta, timezone
+from src.task_manager.task import Task, Priority, Status, parse_iso_us, to_epoch_us
 
 
 @pytest.mark.unit
@@ -324,3 +324,100 @@ class TestTaskSerialization:
         finally:
             # Restaurer la valeur originale
             Task.MIN_TITLE_LENGTH = original_min_length
+
+
+@pytest.mark.unit
+class TestTaskCompactLayout:
+    """Tests de la représentation compacte (__slots__, dates en epoch)"""
+
+    def test_task_should_not_have_instance_dict(self):
+        """Test absence de __dict__ par instance"""
+        task = Task("Tâche compacte")
+
+        assert not hasattr(task, "__dict__")
+        with pytest.raises(AttributeError):
+            task.unknown_attribute = 1
+
+    def test_dates_should_round_trip_to_the_microsecond(self):
+        """Test conversion epoch -> datetime sans perte"""
+        task = Task("Tâche datée")
+        created = datetime(2024, 3, 15, 10, 30, 45, 123456)
+
+        task.created_at = created
+        task.completed_at = created + timedelta(hours=1)
+
+        assert task.created_at == created
+        assert task.completed_at == created + timedelta(hours=1)
+        assert isinstance(task._created_us, int)
+
+    def test_offset_timestamps_should_be_rejected_not_shifted(self):
+        """Test date avec décalage : refusée plutôt que convertie en heure locale"""
+        data = Task("Tâche datée").to_dict()
+        naive = {**data, "created_at": "2024-03-15T10:30:45.123456"}
+        offset = {**data, "created_at": "2024-03-15T10:30:45.123456+05:30"}
+        task = Task.from_dict(naive)
+
+        assert Task.from_dict(task.to_dict()).to_dict()["created_at"] == "2024-03-15T10:30:45.123456"
+        with pytest.raises(ValueError, match="Timezone-aware datetimes are not supported"):
+            Task.from_dict(offset)
+        with pytest.raises(ValueError, match="Timezone-aware datetimes are not supported"):
+            Task.from_dict({**naive, "completed_at": "2024-03-15T12:00:00Z"})
+        with pytest.raises(ValueError, match="Timezone-aware datetimes are not supported"):
+            task.created_at = datetime(2024, 3, 15, tzinfo=timezone.utc)
+        assert task.to_dict() == naive
+
+    def test_from_dict_should_reuse_enum_members(self):
+        """Test les priorités et statuts chargés sont les membres de l'enum"""
+        task = Task.from_dict({
+            "id": 1.5, "title": "Chargée", "priority": "high",
+            "status": "done", "created_at": "2024-01-01T00:00:00"
+        })
+
+        assert task.priority is Priority.HIGH
+        assert task.status is Status.DONE
+
+    def test_from_trusted_dict_should_match_from_dict(self):
+        """Test chargement sans vérification identique au chargement vérifié"""
+        task = Task("Source", "Description", Priority.URGENT)
+        task.mark_completed()
+        task.assign_to_project(3)
+        data = task.to_dict()
+
+        trusted = Task.from_trusted_dict(data)
+
+        assert trusted.to_dict() == Task.from_dict(data).to_dict() == data
+        assert trusted.priority is Priority.URGENT
+        with pytest.raises(KeyError):
+            Task.from_trusted_dict({**data, "status": "DONE"})
+
+    def test_create_many_should_match_individual_construction(self):
+        """Test création en bloc : titres nettoyés, même horloge, identifiants croissants"""
+        tasks = Task.create_many(["  Une  ", "Deux"], [" Desc ", ""], [Priority.HIGH, Priority.LOW])
+
+        assert [task.title for task in tasks] == ["Une", "Deux"]
+        assert tasks[0].description == "Desc"
+        assert [task.priority for task in tasks] == [Priority.HIGH, Priority.LOW]
+        assert tasks[0].created_at == tasks[1].created_at
+        assert tasks[0].id < tasks[1].id
+        assert all(task.status is Status.TODO and task.completed_at is None for task in tasks)
+        assert Task.create_many([]) == []
+
+    @pytest.mark.parametrize("titles, error, message", [
+        (["Valide", "   "], ValueError, "index 1: Title cannot be empty"),
+        (["Valide", "x" * 101], ValueError, "index 1: Title cannot exceed"),
+        (["<b>Gras</b>"], ValueError, "index 0: Title contains invalid characters"),
+        (["Valide", 42], TypeError, "index 1: Title must be a string"),
+    ])
+    def test_create_many_should_report_first_invalid_title(self, titles, error, message):
+        """Test création en bloc : l'erreur indique l'élément invalide"""
+        with pytest.raises(error, match=message):
+            Task.create_many(titles)
+
+    def test_parse_iso_us_should_cache_repeated_dates(self):
+        """Test une date répétée n'est analysée qu'une fois"""
+        parse_iso_us.cache_clear()
+
+        values = [parse_iso_us("2024-01-01T10:00:00.000001") for _ in range(3)]
+
+        assert values == [to_epoch_us(datetime(2024, 1, 1, 10, 0, 0, 1))] * 3
+        assert parse_iso_us.cache_info().hits == 2
@@ -2,9 +2,12 @@ import pytest
 from unittest.mock import patch, mock_open, Mock
 import json
 import tempfile
+import shutil
 import os
+from datetime import datetime
 from src.task_manager.manager import TaskManager
 from src.task_manager.task import Task, Priority, Status
+from src.task_manager.services import PYARROW_AVAILABLE
 
 
 @pytest.mark.unit
@@ -102,6 +105,24 @@ class TestTaskManagerBasics:
         
         assert result is False
 
+    def test_get_task_with_string_id_should_use_index(self):
+        """Test récupération par ID sous forme de chaîne"""
+        task_id = self.manager.add_task("Tâche indexée")
+
+        assert self.manager.get_task(str(task_id)).id == task_id
+
+    def test_delete_task_should_keep_insertion_order(self):
+        """Test suppression conserve l'ordre d'insertion des autres tâches"""
+        first_id = self.manager.add_task("Première")
+        middle_id = self.manager.add_task("Milieu")
+        last_id = self.manager.add_task("Dernière")
+
+        self.manager.delete_task(middle_id)
+
+        assert [task.id for task in self.manager] == [first_id, last_id]
+        assert [task.id for task in self.manager.get_all_tasks()] == [first_id, last_id]
+        assert len(self.manager) == 2
+
 
 @pytest.mark.unit
 class TestTaskManagerFiltering:
@@ -167,6 +188,132 @@ class TestTaskManagerFiltering:
         with pytest.raises(TypeError, match="Priority must be a Priority enum"):
             self.manager.get_tasks_by_priority("high")
 
+    def test_status_index_should_follow_status_changes(self):
+        """Test index par statut mis à jour après modification de la tâche"""
+        task = self.manager.get_task(self.high_id)
+
+        task.status = Status.IN_PROGRESS
+
+        assert task in self.manager.get_tasks_by_status(Status.IN_PROGRESS)
+        assert task not in self.manager.get_tasks_by_status(Status.TODO)
+
+        task.mark_completed()
+
+        assert task in self.manager.get_tasks_by_status(Status.DONE)
+        assert self.manager.get_tasks_by_status(Status.IN_PROGRESS) == []
+
+    def test_priority_index_should_follow_update_priority(self):
+        """Test index par priorité mis à jour après update_priority"""
+        task = self.manager.get_task(self.todo_id)
+
+        task.update_priority(Priority.HIGH)
+
+        assert self.manager.get_tasks_by_priority(Priority.LOW) == []
+        assert len(self.manager.get_tasks_by_priority(Priority.HIGH)) == 2
+
+    def test_deleted_task_should_leave_indexes(self):
+        """Test tâche supprimée retirée des index et plus suivie"""
+        task = self.manager.get_task(self.high_id)
+        self.manager.delete_task(self.high_id)
+
+        task.update_priority(Priority.LOW)
+
+        assert self.manager.get_tasks_by_priority(Priority.HIGH) == []
+        assert task not in self.manager.get_tasks_by_priority(Priority.LOW)
+        assert task not in self.manager.get_tasks_by_status(Status.TODO)
+
+
+@pytest.mark.unit
+class TestTaskManagerBulkOperations:
+    """Tests des opérations en bloc"""
+
+    def setup_method(self):
+        fd, temp_path = tempfile.mkstemp(suffix='.json')
+        os.close(fd)
+        self.manager = TaskManager(temp_path)
+        self.temp_path = temp_path
+
+    def teardown_method(self):
+        try:
+            os.unlink(self.temp_path)
+        except OSError:
+            pass
+
+    def test_add_tasks_should_accept_titles_dicts_tuples_and_tasks(self):
+        """Test ajout en bloc de plusieurs formes de tâches"""
+        existing = Task("Tâche existante")
+
+        ids = self.manager.add_tasks([
+            "Titre seul",
+            {"title": "Depuis un dict", "priority": Priority.HIGH},
+            ("Depuis un tuple", "Description", Priority.LOW),
+            existing,
+        ])
+
+        assert len(ids) == 4
+        assert [task.id for task in self.manager] == ids
+        assert self.manager.get_task(ids[1]).priority == Priority.HIGH
+        assert self.manager.get_task(ids[2]).description == "Description"
+        assert self.manager.get_task(existing.id) is existing
+        assert len(self.manager.get_tasks_by_priority(Priority.MEDIUM)) == 2
+
+    def test_add_tasks_with_invalid_item_should_add_nothing(self):
+        """Test validation en bloc : rien n'est ajouté si une tâche est invalide"""
+        with pytest.raises(ValueError, match="Invalid task at index 1"):
+            self.manager.add_tasks(["Valide", "   ", "Autre"])
+
+        assert len(self.manager) == 0
+
+    def test_add_tasks_error_index_should_count_existing_tasks(self):
+        """Test index de l'élément invalide parmi des Task déjà créées"""
+        with pytest.raises(ValueError, match="Invalid task at index 2: Title contains invalid"):
+            self.manager.add_tasks([Task("Existante"), "Valide", ("<script>", "", Priority.LOW)])
+
+        assert len(self.manager) == 0
+
+    def test_delete_tasks_should_return_deleted_count(self):
+        """Test suppression en bloc"""
+        ids = self.manager.add_tasks([f"Tâche {i}" for i in range(5)])
+
+        deleted = self.manager.delete_tasks([ids[0], str(ids[2]), 999.0, None, "invalid"])
+
+        assert deleted == 2
+        assert [task.id for task in self.manager] == [ids[1], ids[3], ids[4]]
+        assert self.manager.get_statistics(recompute=True)["total_tasks"] == 3
+
+    def test_bulk_update_should_change_status_and_priority(self):
+        """Test mise à jour en bloc"""
+        ids = self.manager.add_tasks([f"Tâche {i}" for i in range(4)])
+
+        updated = self.manager.bulk_update(ids[:3], priority=Priority.URGENT)
+        self.manager.bulk_update(ids[:2], status=Status.DONE)
+
+        assert updated == 3
+        assert len(self.manager.get_tasks_by_priority(Priority.URGENT)) == 3
+        assert len(self.manager.get_tasks_by_status(Status.DONE)) == 2
+        assert self.manager.get_task(ids[0]).completed_at is not None
+        assert self.manager.get_statistics(recompute=True)["completed_tasks"] == 2
+
+    def test_bulk_update_priority_of_completed_task_should_change_nothing(self):
+        """Test mise à jour refusée si une tâche est terminée"""
+        ids = self.manager.add_tasks(["Tâche 1", "Tâche 2"])
+        self.manager.get_task(ids[1]).mark_completed()
+
+        with pytest.raises(ValueError, match="Cannot update priority of completed tasks"):
+            self.manager.bulk_update(ids, priority=Priority.LOW)
+
+        assert self.manager.get_tasks_by_priority(Priority.LOW) == []
+
+    def test_bulk_update_without_changes_should_raise_error(self):
+        """Test mise à jour sans statut ni priorité"""
+        with pytest.raises(ValueError, match="Nothing to update"):
+            self.manager.bulk_update([1.0])
+
+    def test_bulk_update_with_invalid_status_type_should_raise_error(self):
+        """Test statut invalide"""
+        with pytest.raises(TypeError, match="Status must be a Status enum"):
+            self.manager.bulk_update([1.0], status="done")
+
 
 @pytest.mark.unit  
 class TestTaskManagerPersistence:
@@ -189,24 +336,24 @@ class TestTaskManagerPersistence:
             pass
 
     @patch('builtins.open', new_callable=mock_open)
-    @patch('json.dump')
-    def test_save_to_file_should_open_file_for_writing(self, mock_json_dump, mock_file):
-        """Test sauvegarde ouvre fichier en écriture"""
-        self.manager.save_to_file("test.json")
+    def test_save_to_file_should_open_file_for_writing(self, mock_file):
+        """Test sauvegarde non atomique ouvre directement le fichier en écriture"""
+        self.manager.save_to_file("test.json", atomic=False)
         
-        mock_file.assert_called_once_with("test.json", 'w', encoding='utf-8')
+        mock_file.assert_called_once_with("test.json", 'wb')
 
     @patch('builtins.open', new_callable=mock_open)
-    @patch('json.dump')
-    def test_save_to_file_should_call_json_dump(self, mock_json_dump, mock_file):
-        """Test sauvegarde appelle json.dump"""
-        self.manager.save_to_file("test.json")
-        
-        mock_json_dump.assert_called_once()
-        call_args = mock_json_dump.call_args[0]
-        data = call_args[0]
+    def test_save_to_file_should_call_codec_dumps(self, mock_file):
+        """Test sauvegarde encode le document avec le codec JSON"""
+        with patch.object(self.manager._codec, 'dumps', return_value=b"{}") as mock_dumps:
+            self.manager.save_to_file("test.json", atomic=False)
+        
+        mock_dumps.assert_called_once()
+        data = mock_dumps.call_args[0][0]
         assert "tasks" in data
         assert "metadata" in data
+        assert isinstance(data["tasks"][0]["created_at"], datetime)
+        mock_file().write.assert_called_once_with(b"{}")
 
     @patch('builtins.open', side_effect=PermissionError("Permission denied"))
     def test_save_to_file_permission_denied_should_raise_specific_error(self, mock_file):
@@ -272,13 +419,10 @@ class TestTaskManagerPersistence:
         with pytest.raises(ValueError, match="Maximum number of JSON files exceeded"):
             self.manager.save_to_file("new_file.json")
 
-    @patch('builtins.open', new_callable=mock_open, read_data='{"tasks": "not_an_array"}')
-    @patch('json.load')
+    @patch('builtins.open', new_callable=mock_open, read_data=b'{"tasks": "not_an_array"}')
     @patch('os.path.exists', return_value=True)
-    def test_load_from_file_with_invalid_tasks_format_should_raise_error(self, mock_exists, mock_json_load, mock_file):
+    def test_load_from_file_with_invalid_tasks_format_should_raise_error(self, mock_exists, mock_file):
         """Test chargement avec format tâches invalide (pas un array)"""
-        mock_json_load.return_value = {"tasks": "not_an_array"}
-        
         with pytest.raises(RuntimeError, match="Unexpected error while loading tasks.*Invalid tasks format"):
             self.manager.load_from_file("invalid.json")
 
@@ -360,6 +504,29 @@ class TestTaskManagerStatistics:
         assert stats["status_distribution"]["in_progress"] == 0
         assert stats["status_distribution"]["cancelled"] == 0
 
+    def test_get_statistics_should_follow_deletes_and_changes(self):
+        """Test compteurs mis à jour après suppression et modifications"""
+        task_id1 = self.manager.add_task("Tâche 1", priority=Priority.LOW)
+        task_id2 = self.manager.add_task("Tâche 2", priority=Priority.HIGH)
+        self.manager.get_task(task_id1).update_priority(Priority.URGENT)
+        self.manager.get_task(task_id1).status = Status.CANCELLED
+        self.manager.delete_task(task_id2)
+
+        stats = self.manager.get_statistics(recompute=True)
+
+        assert stats["total_tasks"] == 1
+        assert stats["cancelled_tasks"] == 1
+        assert stats["priority_distribution"]["urgent"] == 1
+        assert stats["priority_distribution"]["high"] == 0
+
+    def test_get_statistics_recompute_should_detect_out_of_sync_counters(self):
+        """Test recompute détecte des compteurs désynchronisés"""
+        task_id = self.manager.add_task("Tâche")
+        self.manager.get_task(task_id)._status = Status.DONE
+
+        with pytest.raises(RuntimeError, match="Statistics counters out of sync"):
+            self.manager.get_statistics(recompute=True)
+
     @pytest.mark.parametrize("total,completed,expected_rate", [
         (1, 0, 0.0),
         (1, 1, 100.0),
@@ -680,7 +847,7 @@ class TestTaskManagerExport:
         assert result is True
         mock_export.assert_called_once()
         args, kwargs = mock_export.call_args
-        assert args[0] == self.manager._tasks  # Liste des tâches
+        assert args[0] == self.manager.get_all_tasks()  # Liste des tâches
         assert args[1] == "test.json"          # Nom du fichier
         assert args[2] == "json"               # Format
         assert args[3] is True                 # Include statistics
@@ -902,6 +1069,399 @@ class TestTaskManagerRealFileOperations:
         self.manager.load_from_file(self.temp_file)
         assert len(self.manager.get_all_tasks()) == 2
 
+    def test_streaming_load_should_match_regular_load(self):
+        """Test intégration : chargement en streaming identique au chargement complet"""
+        ids = self.manager.add_tasks([f"Tâche {i}" for i in range(25)])
+        self.manager.get_task(ids[3]).mark_completed()
+        self.manager.save_to_file(self.temp_file)
+
+        streamed = TaskManager(self.temp_file)
+        streamed.STREAM_BATCH_SIZE = 7
+        streamed.load_from_file(self.temp_file, streaming=True)
+
+        assert [task.to_dict() for task in streamed] == [task.to_dict() for task in self.manager]
+        assert streamed.get_statistics(recompute=True)["completed_tasks"] == 1
+
+    def test_streaming_load_should_report_invalid_task_index(self):
+        """Test intégration : index de la tâche invalide en streaming"""
+        self.manager.add_tasks(["Tâche 0", "Tâche 1"])
+        self.manager.save_to_file(self.temp_file)
+        with open(self.temp_file, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        data["tasks"][1]["priority"] = "unknown"
+        with open(self.temp_file, 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+
+        with pytest.raises(RuntimeError, match="Invalid task data at index 1"):
+            self.manager.load_from_file(self.temp_file, streaming=True)
+
+        # Le chargement échoué ne modifie pas les tâches en mémoire
+        assert len(self.manager) == 2
+
+    def test_streaming_load_of_truncated_file_should_raise_json_error(self):
+        """Test intégration : fichier tronqué en streaming"""
+        with open(self.temp_file, 'w', encoding='utf-8') as f:
+            f.write('{"tasks": [{"id": 1.0, "title": "Coupée"')
+
+        with pytest.raises(json.JSONDecodeError, match="Invalid JSON format"):
+            self.manager.load_from_file(self.temp_file, streaming=True)
+
+    def test_streaming_save_should_write_same_file_as_regular_save(self):
+        """Test intégration : sauvegarde en streaming identique à la sauvegarde complète"""
+        ids = self.manager.add_tasks([f"Tâche {i}" for i in range(25)])
+        self.manager.get_task(ids[3]).mark_completed()
+        self.manager.SAVE_BATCH_SIZE = 4
+        streamed_file = os.path.join(self.temp_dir, 'streamed.json')
+
+        with patch.object(self.manager, '_get_current_time_iso', return_value="2024-01-01T00:00:00"):
+            self.manager.save_to_file(self.temp_file)
+            self.manager.save_to_file(streamed_file, streaming=True)
+
+        with open(self.temp_file, 'r', encoding='utf-8') as f1, open(streamed_file, 'r', encoding='utf-8') as f2:
+            assert f1.read() == f2.read()
+
+    @pytest.mark.parametrize("streaming", [False, True])
+    def test_compact_save_should_round_trip(self, streaming):
+        """Test intégration : sauvegarde compacte relue à l'identique"""
+        self.manager.add_tasks([f"Tâche {i}" for i in range(5)])
+
+        self.manager.save_to_file(self.temp_file, streaming=streaming, compact=True)
+        with open(self.temp_file, 'r', encoding='utf-8') as f:
+            content = f.read()
+        loaded = TaskManager(self.temp_file)
+        loaded.load_from_file(self.temp_file, streaming=True)
+
+        assert "\n" not in content
+        assert json.loads(content)["metadata"]["total_tasks"] == 5
+        assert [task.to_dict() for task in loaded] == [task.to_dict() for task in self.manager]
+
+    @pytest.mark.parametrize("streaming", [False, True])
+    def test_atomic_save_should_replace_file_without_leftovers(self, streaming):
+        """Test intégration : sauvegarde atomique par défaut, aucun fichier temporaire restant"""
+        self.manager.add_tasks(["Tâche 1", "Tâche 2"])
+
+        with patch('os.fsync', wraps=os.fsync) as mock_fsync:
+            self.manager.save_to_file(self.temp_file, streaming=streaming)
+            self.manager.save_to_file(self.temp_file, streaming=streaming)
+
+        assert sorted(os.listdir(self.temp_dir)) == ['test_tasks.json', 'test_tasks.json.validated']
+        # Fichier temporaire puis répertoire, à chaque sauvegarde
+        assert mock_fsync.call_count == 4
+        loaded = TaskManager(self.temp_file)
+        loaded.load_from_file(self.temp_file)
+        assert len(loaded) == 2
+
+    @pytest.mark.skipif(os.name != 'posix', reason="Permissions POSIX")
+    @pytest.mark.parametrize("streaming", [False, True])
+    def test_atomic_save_should_keep_file_permissions(self, streaming):
+        """Test intégration : la sauvegarde atomique garde les droits du fichier remplacé"""
+        self.manager.add_task("Tâche")
+        self.manager.save_to_file(self.temp_file)
+        os.chmod(self.temp_file, 0o640)
+
+        self.manager.save_to_file(self.temp_file, streaming=streaming)
+
+        assert os.stat(self.temp_file).st_mode & 0o777 == 0o640
+
+    @pytest.mark.skipif(os.name != 'posix', reason="Liens symboliques POSIX")
+    @pytest.mark.parametrize("streaming", [False, True])
+    def test_atomic_save_should_follow_symlink(self, streaming):
+        """Test intégration : sauvegarde via un lien symbolique, le lien est conservé"""
+        target_dir = tempfile.mkdtemp()
+        target = os.path.join(target_dir, 'real.json')
+        link = os.path.join(self.temp_dir, 'link.json')
+        self.manager.add_task("Tâche")
+        self.manager.save_to_file(target)
+        os.symlink(target, link)
+        self.manager.add_task("Autre tâche")
+
+        try:
+            self.manager.save_to_file(link, streaming=streaming)
+
+            assert os.path.islink(link)
+            assert sorted(os.listdir(self.temp_dir)) == ['link.json', 'link.json.validated']
+            assert sorted(os.listdir(target_dir)) == ['real.json', 'real.json.validated']
+            with open(target, 'r', encoding='utf-8') as f:
+                assert json.load(f)["metadata"]["total_tasks"] == 2
+        finally:
+            os.unlink(link)
+            shutil.rmtree(target_dir)
+
+    @pytest.mark.parametrize("streaming", [False, True])
+    def test_crash_during_atomic_save_should_keep_previous_file(self, streaming):
+        """Test intégration : échec en cours d'écriture, l'ancien fichier reste lisible"""
+        self.manager.add_task("Tâche sauvegardée")
+        self.manager.save_to_file(self.temp_file)
+        self.manager.add_task("Tâche perdue")
+
+        with patch.object(Task, 'to_record', side_effect=[{"id": 1.0}, OSError("disk full")]):
+            with pytest.raises(OSError, match="File system error while saving"):
+                self.manager.save_to_file(self.temp_file, streaming=streaming)
+
+        assert sorted(os.listdir(self.temp_dir)) == ['test_tasks.json', 'test_tasks.json.validated']
+        loaded = TaskManager(self.temp_file)
+        loaded.load_from_file(self.temp_file)
+        assert [task.title for task in loaded] == ["Tâche sauvegardée"]
+
+    @pytest.mark.parametrize("streaming", [False, True])
+    def test_reload_of_unchanged_file_should_skip_validation(self, streaming):
+        """Test intégration : fichier sauvegardé relu sans vérification, même par un autre gestionnaire"""
+        ids = self.manager.add_tasks([f"Tâche {i}" for i in range(5)])
+        self.manager.get_task(ids[1]).mark_completed()
+        self.manager.save_to_file(self.temp_file)
+        expected = [task.to_dict() for task in self.manager]
+        cold_start = TaskManager(self.temp_file)
+
+        with patch.object(Task, 'parse_dict', side_effect=AssertionError("validated again")):
+            self.manager.load_from_file(self.temp_file, streaming=streaming)
+            cold_start.load_from_file(streaming=streaming)
+
+        assert [task.to_dict() for task in self.manager] == expected
+        assert [task.to_dict() for task in cold_start] == expected
+
+    @pytest.mark.parametrize("streaming", [False, True])
+    def test_canonical_file_should_be_validated_once(self, streaming):
+        """Test intégration : fichier externe canonique vérifié au premier chargement seulement"""
+        self.manager.add_tasks(["Une", "Deux"])
+        self.manager.save_to_file(self.temp_file)
+        os.remove(self.temp_file + TaskManager.VALIDATED_SUFFIX)
+
+        with patch.object(Task, 'parse_dict', wraps=Task.parse_dict) as mock_parse:
+            TaskManager(self.temp_file).load_from_file(streaming=streaming)
+            TaskManager(self.temp_file).load_from_file(streaming=streaming)
+
+        assert mock_parse.call_count == 2
+        assert os.path.exists(self.temp_file + TaskManager.VALIDATED_SUFFIX)
+
+    def test_repeated_saves_should_not_scan_directory_again(self):
+        """Test intégration : nombre de fichiers JSON gardé en cache entre les sauvegardes"""
+        self.manager.add_task("Tâche")
+        self.manager.save_to_file(self.temp_file)
+        self.manager.save_to_file(os.path.join(self.temp_dir, 'other.json'), streaming=True)
+
+        with patch('os.listdir', wraps=os.listdir) as mock_listdir:
+            self.manager.save_to_file(self.temp_file)
+            self.manager.save_to_file(self.temp_file, incremental=True)
+            self.manager.save_to_file(self.temp_file, compact=True)
+
+        mock_listdir.assert_not_called()
+        assert self.manager._json_files.count(self.temp_dir) == 2
+
+    def test_files_created_by_others_should_count_toward_limit(self):
+        """Test intégration : fichiers ajoutés hors du gestionnaire, limite toujours appliquée"""
+        self.manager.MAX_JSON_FILES = 3
+        self.manager.add_task("Tâche")
+        self.manager.save_to_file(self.temp_file)
+        self.manager.save_to_file(os.path.join(self.temp_dir, 'second.json'))
+
+        with open(os.path.join(self.temp_dir, 'external.json'), 'w') as f:
+            f.write("{}")
+        # Date de modification distincte même sur un système de fichiers peu précis
+        stat = os.stat(self.temp_dir)
+        os.utime(self.temp_dir, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        with pytest.raises(ValueError, match="Maximum number of JSON files exceeded: 3"):
+            self.manager.save_to_file(self.temp_file)
+
+    def test_file_created_before_write_should_not_be_absorbed(self):
+        """Test intégration : fichier JSON ajouté par un autre processus entre le comptage et l'écriture"""
+        self.manager.add_task("Tâche")
+        self.manager.save_to_file(self.temp_file)
+
+        def create_external_file(*args):
+            with open(os.path.join(self.temp_dir, 'external.json'), 'w') as f:
+                f.write("{}")
+            stat = os.stat(self.temp_dir)
+            os.utime(self.temp_dir, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+            return None
+
+        with patch('src.task_manager.manager.detect_compression', side_effect=create_external_file):
+            self.manager.save_to_file(self.temp_file)
+
+        assert self.manager._json_files.count(self.temp_dir) == 2
+
+    def test_modified_file_should_be_validated_again(self):
+        """Test intégration : fichier modifié depuis la sauvegarde, vérifié à nouveau"""
+        self.manager.add_task("Tâche")
+        self.manager.save_to_file(self.temp_file)
+        with open(self.temp_file, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        data["tasks"][0]["priority"] = "HIGH"
+        with open(self.temp_file, 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+
+        self.manager.load_from_file(self.temp_file)
+
+        assert self.manager.get_all_tasks()[0].priority == Priority.HIGH
+
+    @pytest.mark.parametrize("streaming", [False, True])
+    def test_legacy_file_should_be_normalised_on_every_load(self, streaming):
+        """Test intégration : fichier ancien format relu deux fois, toujours validé"""
+        self.manager.add_task("Tâche")
+        self.manager.save_to_file(self.temp_file)
+        with open(self.temp_file, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        data["tasks"][0].update({"id": "12.5", "priority": "HIGH"})
+        with open(self.temp_file, 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+
+        self.manager.load_from_file(self.temp_file, streaming=streaming)
+        self.manager.load_from_file(self.temp_file, streaming=streaming)
+
+        task = self.manager.get_task(12.5)
+        assert task is not None and task.id == 12.5
+        assert task.priority == Priority.HIGH
+        assert not os.path.exists(self.temp_file + TaskManager.VALIDATED_SUFFIX)
+
+
+@pytest.mark.integration
+class TestTaskManagerIncrementalSave:
+    """Tests d'intégration - sauvegarde incrémentale (fichier delta)"""
+
+    @pytest.fixture
+    def manager(self, tmp_path):
+        """Fixture : gestionnaire avec 20 tâches déjà sauvegardées"""
+        manager = TaskManager(str(tmp_path / "tasks.json"))
+        manager.add_tasks([f"Tâche {i}" for i in range(20)])
+        manager.save_to_file()
+        return manager
+
+    @staticmethod
+    def reload(manager, streaming=False):
+        loaded = TaskManager(manager._storage_file)
+        loaded.load_from_file(streaming=streaming)
+        return loaded
+
+    @pytest.mark.parametrize("streaming", [False, True])
+    def test_incremental_save_should_write_only_changes(self, manager, streaming):
+        """Test seules les tâches modifiées, ajoutées ou supprimées sont écrites"""
+        with open(manager._storage_file, 'rb') as f:
+            base = f.read()
+        tasks = manager.get_all_tasks()
+        tasks[2].mark_completed()
+        tasks[5].title = "Titre modifié"
+        manager.delete_task(tasks[7].id)
+        new_id = manager.add_task("Nouvelle")
+
+        manager.save_to_file(incremental=True)
+
+        with open(manager._storage_file, 'rb') as f:
+            assert f.read() == base
+        with open(manager._storage_file + ".delta", 'r', encoding='utf-8') as f:
+            delta = json.load(f)
+        assert [task["id"] for task in delta["tasks"]] == [tasks[2].id, tasks[5].id, new_id]
+        assert delta["deleted"] == [tasks[7].id]
+        loaded = self.reload(manager, streaming)
+        assert [task.to_dict() for task in loaded] == [task.to_dict() for task in manager]
+        assert loaded.get_statistics(recompute=True)["completed_tasks"] == 1
+
+    @pytest.mark.parametrize("backend", ["memory", "columnar", "wal", "sqlite", "mmap"])
+    def test_bulk_operations_should_track_only_existing_tasks(self, tmp_path, backend):
+        """Test identifiants inconnus ignorés : absents du fichier delta"""
+        manager = TaskManager(str(tmp_path / "tasks.db"), backend=backend)
+        ids = manager.add_tasks([f"Tâche {i}" for i in range(20)])
+        json_file = str(tmp_path / "tasks.json")
+        manager.save_to_file(json_file)
+        missing = ids[-1] + 1
+
+        assert manager.bulk_update([ids[0], missing, ids[0]], status=Status.DONE) == 1
+        assert manager.delete_tasks([ids[1], missing]) == 1
+        manager.save_to_file(json_file, incremental=True)
+        manager.close()
+
+        with open(json_file + ".delta", 'r', encoding='utf-8') as f:
+            delta = json.load(f)
+        assert [task["id"] for task in delta["tasks"]] == [ids[0]]
+        assert delta["deleted"] == [ids[1]]
+
+    def test_deltas_should_accumulate_after_reload(self, manager):
+        """Test un second delta reprend les changements du premier"""
+        first = manager.get_all_tasks()[0]
+        first.update_priority(Priority.URGENT)
+        manager.save_to_file(incremental=True)
+
+        loaded = self.reload(manager)
+        loaded.get_all_tasks()[1].assign_to_project(3)
+        loaded.save_to_file(incremental=True)
+
+        final = self.reload(loaded)
+        assert final.get_task(first.id).priority == Priority.URGENT
+        assert final.get_all_tasks()[1].project_id == 3.0
+
+    def test_full_save_should_remove_delta(self, manager):
+        """Test sauvegarde complète : le delta est intégré puis supprimé"""
+        manager.get_all_tasks()[0].mark_completed()
+        manager.save_to_file(incremental=True)
+
+        manager.save_to_file()
+
+        assert not os.path.exists(manager._storage_file + ".delta")
+        assert self.reload(manager).get_statistics()["completed_tasks"] == 1
+
+    def test_too_many_changes_should_fall_back_to_full_save(self, manager):
+        """Test au-delà de MAX_DELTA_RATIO, réécriture complète"""
+        manager.bulk_update([task.id for task in manager.get_all_tasks()[:10]], priority=Priority.HIGH)
+
+        manager.save_to_file(incremental=True)
+
+        assert not os.path.exists(manager._storage_file + ".delta")
+        assert len(self.reload(manager).get_tasks_by_priority(Priority.HIGH)) == 10
+
+    def test_unknown_target_should_be_saved_in_full(self, manager, tmp_path):
+        """Test fichier différent de la référence : pas de delta"""
+        other_file = str(tmp_path / "other.json")
+
+        manager.save_to_file(other_file, incremental=True)
+
+        assert os.path.exists(other_file)
+        assert not os.path.exists(other_file + ".delta")
+
+    def test_stale_delta_should_be_ignored(self, manager):
+        """Test delta visant une version antérieure du fichier"""
+        manager.get_all_tasks()[0].mark_completed()
+        manager.save_to_file(incremental=True)
+        delta_file = manager._storage_file + ".delta"
+        with open(delta_file, 'r', encoding='utf-8') as f:
+            delta = json.load(f)
+        delta["base_saved_at"] = "2000-01-01T00:00:00"
+        with open(delta_file, 'w', encoding='utf-8') as f:
+            json.dump(delta, f)
+
+        assert self.reload(manager).get_statistics()["completed_tasks"] == 0
+
+    def test_unchanged_tasks_should_not_be_encoded_again(self, manager, tmp_path):
+        """Test cache du JSON des tâches inchangées lors d'une réécriture complète"""
+        other_file = str(tmp_path / "other.json")
+        manager.MAX_DELTA_RATIO = 0
+        manager.save_to_file(other_file, incremental=True)
+        manager.get_all_tasks()[4].update_priority(Priority.LOW)
+
+        with patch.object(Task, 'to_record', autospec=True, side_effect=Task.to_record) as mock_to_record:
+            manager.save_to_file(other_file, incremental=True)
+
+        assert mock_to_record.call_count == 1
+        loaded = TaskManager(other_file)
+        loaded.load_from_file()
+        assert [task.to_dict() for task in loaded] == [task.to_dict() for task in manager]
+
+    @pytest.mark.parametrize("streaming", [False, True])
+    def test_load_should_drop_encoded_cache(self, manager, tmp_path, streaming):
+        """Test tâches rechargées (mêmes identifiants, autre contenu) réencodées à la sauvegarde"""
+        manager.MAX_DELTA_RATIO = 0
+        manager.save_to_file(str(tmp_path / "a.json"), incremental=True)
+        renamed = TaskManager(str(tmp_path / "b.json"))
+        renamed.add_tasks(manager.get_all_tasks())
+        for task in renamed:
+            task.title = f"Renommée {task.title}"
+        renamed.save_to_file()
+
+        manager.load_from_file(str(tmp_path / "b.json"), streaming=streaming)
+        manager.save_to_file(str(tmp_path / "c.json"), incremental=True)
+
+        saved = TaskManager(str(tmp_path / "c.json"))
+        saved.load_from_file()
+        assert [task.title for task in saved] == [task.title for task in renamed]
+
 
 @pytest.mark.integration
 class TestTaskManagerWorkflows:
@@ -983,6 +1543,8 @@ class TestTaskManagerWorkflows:
         for fmt in formats:
             if fmt == 'excel':
                 continue  # Skip excel alias
+            if fmt in ('parquet', 'arrow') and not PYARROW_AVAILABLE:
+                continue  # pyarrow optionnel
             filename = os.path.join(self.temp_dir, f'export_test.{fmt}')
             result = self.manager.export_tasks(filename, fmt, include_statistics=True)
             assert result is True